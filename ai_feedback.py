@@ -0,0 +1,295 @@
+import heapq
+import json
+import threading
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, List, Any, Optional, Callable, Hashable, Iterable, NamedTuple, Tuple
+
+# Fields that are only known when feedback is rendered; everything else in a
+# template is bound once when the template file is compiled.
+HEADLINE_FIELDS = {"score"}
+WEAKNESS_ITEM_FIELDS = {"missed"}
+
+
+class Feedback(NamedTuple):
+    band: str
+    badge: str
+    headline: str
+    weakness_lines: Tuple[str, ...]
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _bind_static(template: str, static: Dict[str, Any], dynamic: set) -> str:
+    """
+    Substitutes the static fields of a format string, leaving dynamic fields in place.
+
+    Args:
+        template (str): A str.format style template.
+        static (dict): Values known at compile time.
+        dynamic (set): Field names that are filled in at render time.
+
+    Returns:
+        str: A format string that only references dynamic fields.
+    """
+    pieces = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        pieces.append(_escape(literal))
+        if field is None:
+            continue
+        if field in static:
+            pieces.append(_escape(format(static[field], spec)))
+        elif field in dynamic:
+            pieces.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+        else:
+            raise ValueError(f"Unknown field '{field}' in feedback template: {template!r}")
+    return "".join(pieces)
+
+
+def weaknesses_from_answers(answers: Iterable[Dict[str, Any]]) -> Tuple[Tuple[str, int], ...]:
+    """
+    Counts missed questions per topic, most-missed first.
+
+    Args:
+        answers (list): Answer records with 'topic' and 'correct' keys, as kept in
+            st.session_state.civic_answers / financial_answers.
+
+    Returns:
+        tuple: (topic, missed_count) pairs, hashable so they can key the feedback cache.
+    """
+    missed = Counter(a["topic"] for a in answers if not a["correct"] and a.get("topic"))
+    return tuple(sorted(missed.items(), key=lambda item: (-item[1], item[0])))
+
+
+class FeedbackGenerator:
+    """
+    Renders quiz feedback from feedback_template.json.
+
+    The template file is compiled once: quiz labels, badges and topic tips are bound
+    into per-(quiz, band) and per-topic format strings, so rendering is a single
+    str.format call per line. Rendered feedback is memoized on its inputs.
+    """
+
+    def __init__(self, template_path: str = "feedback_template.json", cache_size: int = 4096):
+        with open(template_path, "r", encoding="utf-8") as f:
+            self.template = json.load(f)
+        self._compile()
+        self.generate = lru_cache(maxsize=cache_size)(self._generate)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._background_lock = threading.Lock()
+        self._background_results: Dict[Hashable, Any] = {}
+        self._background_pending: Dict[Hashable, Future] = {}
+
+    def _compile(self):
+        bands = sorted(self.template["score_bands"], key=lambda b: b["min_score"])
+        self._band_thresholds = [b["min_score"] for b in bands]
+        self._band_names = [b["name"] for b in bands]
+
+        self._headlines: Dict[Tuple[str, str], str] = {}
+        self._badges: Dict[Tuple[str, str], str] = {}
+        for quiz, quiz_data in self.template["quizzes"].items():
+            for band in bands:
+                key = (quiz, band["name"])
+                self._headlines[key] = _bind_static(band["headline"], {"quiz_label": quiz_data["label"]},
+                                                    HEADLINE_FIELDS)
+                self._badges[key] = quiz_data["badges"][band["name"]]
+
+        weakness = self.template["weakness"]
+        self._weakness_intro = weakness["intro"]
+        self._weakness_none = weakness["none"]
+        self._weakness_item = weakness["item"]
+        tips = self.template["topic_tips"]
+        self._default_tip = tips["default"]
+        self._weakness_items = {
+            topic: self._compile_weakness_item(topic, tip) for topic, tip in tips.items() if topic != "default"
+        }
+
+    def _compile_weakness_item(self, topic: str, tip: str) -> str:
+        return _bind_static(self._weakness_item, {"topic": topic, "tip": tip}, WEAKNESS_ITEM_FIELDS)
+
+    def band_for(self, score_percentage: float) -> str:
+        """Returns the name of the score band a percentage falls into."""
+        index = bisect_right(self._band_thresholds, score_percentage) - 1
+        return self._band_names[max(index, 0)]
+
+    def _generate(self, quiz: str, score_percentage: float,
+                  weaknesses: Tuple[Tuple[str, int], ...] = ()) -> Feedback:
+        band = self.band_for(score_percentage)
+        key = (quiz, band)
+        if weaknesses:
+            lines = [self._weakness_intro]
+            for topic, missed in weaknesses:
+                item = self._weakness_items.get(topic)
+                if item is None:
+                    # Not stored: generate() may run on several script threads at once, and
+                    # the rendered feedback is memoized anyway
+                    item = self._compile_weakness_item(topic, self._default_tip)
+                lines.append(item.format(missed=missed))
+        else:
+            lines = [self._weakness_none]
+        return Feedback(
+            band=band,
+            badge=self._badges[key],
+            headline=self._headlines[key].format(score=score_percentage),
+            weakness_lines=tuple(lines),
+        )
+
+    def background(self, key: Hashable, producer: Callable[..., Any], *args) -> Optional[Any]:
+        """
+        Runs slower feedback generation off the request path.
+
+        The first call for a key starts producer(*args) on a worker thread and
+        returns None, so the caller shows the template feedback as a fallback.
+        Later calls return the cached result once it is ready.
+
+        Args:
+            key (Hashable): Identifies the result, e.g. the same inputs passed to generate().
+            producer (callable): The slow generator.
+
+        Returns:
+            The producer's result if available, otherwise None.
+        """
+        with self._background_lock:
+            if key in self._background_results:
+                return self._background_results[key]
+            future = self._background_pending.get(key)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="feedback")
+                self._background_pending[key] = self._executor.submit(producer, *args)
+                return None
+            if not future.done():
+                return None
+            del self._background_pending[key]
+            try:
+                self._background_results[key] = future.result()
+            except Exception as e:
+                print(f"Background feedback generation failed: {e}")
+                return None
+            return self._background_results[key]
+
+
+@lru_cache(maxsize=1)
+def get_feedback_generator(template_path: str = "feedback_template.json") -> FeedbackGenerator:
+    """Returns the process-wide generator, compiling the template file on first use."""
+    return FeedbackGenerator(template_path)
+
+
+def generate_quiz_feedback(quiz: str, score_percentage: float, answers: List[Dict[str, Any]]) -> Feedback:
+    """
+    Builds feedback for a finished quiz.
+
+    Args:
+        quiz (str): 'civic' or 'financial'.
+        score_percentage (float): Score between 0 and 100.
+        answers (list): The answer records collected while the quiz was taken.
+
+    Returns:
+        Feedback: Band, badge, headline and topic review lines.
+    """
+    return get_feedback_generator().generate(quiz, score_percentage, weaknesses_from_answers(answers))
+
+
+# --- Topic Mastery (Bayesian Knowledge Tracing) ---
+class BKTParams(NamedTuple):
+    p_init: float = 0.3   # Probability the topic is already known before any answer
+    p_learn: float = 0.1  # Probability of learning the topic after each attempt
+    p_slip: float = 0.1   # Probability of answering wrong despite knowing the topic
+    p_guess: float = 0.25 # Probability of guessing right; four options per question
+
+
+DEFAULT_BKT_PARAMS = BKTParams()
+
+
+def bkt_update(p_mastery: float, correct: bool, params: BKTParams = DEFAULT_BKT_PARAMS) -> float:
+    """
+    Applies one Bayesian Knowledge Tracing step for a single answer.
+
+    Args:
+        p_mastery (float): Current probability that the topic is mastered.
+        correct (bool): Whether the answer was correct.
+        params (BKTParams): Slip, guess and learn rates.
+
+    Returns:
+        float: Updated probability of mastery.
+    """
+    if correct:
+        known = p_mastery * (1 - params.p_slip)
+        posterior = known / (known + (1 - p_mastery) * params.p_guess)
+    else:
+        known = p_mastery * params.p_slip
+        posterior = known / (known + (1 - p_mastery) * (1 - params.p_guess))
+    return posterior + (1 - posterior) * params.p_learn
+
+
+class MasteryTracker:
+    """
+    Keeps one learner's per-topic mastery estimates.
+
+    Each answer updates its topic in O(1), so ranking weak topics never needs the
+    answer history. Only topics changed since the last save are written back.
+    The topics dict is plain data and can live in st.session_state.
+    """
+
+    def __init__(self, user_id: str, topics: Optional[Dict[str, Dict[str, Any]]] = None,
+                 params: BKTParams = DEFAULT_BKT_PARAMS):
+        self.user_id = user_id
+        self.topics = topics if topics is not None else {}
+        self.params = params
+        self._dirty = set()
+
+    @classmethod
+    def from_db(cls, db, user_id: str, params: BKTParams = DEFAULT_BKT_PARAMS) -> "MasteryTracker":
+        """Loads a learner's stored estimates with a single query."""
+        return cls(user_id, db.fetch_topic_mastery(user_id), params)
+
+    def record_answer(self, topic: str, correct: bool) -> float:
+        """
+        Updates the mastery estimate of a topic after one answer.
+
+        Args:
+            topic (str): Content topic the question belongs to.
+            correct (bool): Whether the answer was correct.
+
+        Returns:
+            float: The topic's new probability of mastery.
+        """
+        state = self.topics.get(topic)
+        if state is None:
+            state = self.topics[topic] = {"p_mastery": self.params.p_init, "attempts": 0, "correct": 0}
+        state["p_mastery"] = bkt_update(state["p_mastery"], correct, self.params)
+        state["attempts"] += 1
+        state["correct"] += int(correct)
+        self._dirty.add(topic)
+        return state["p_mastery"]
+
+    def mastery(self, topic: str) -> float:
+        state = self.topics.get(topic)
+        return state["p_mastery"] if state else self.params.p_init
+
+    def weakest_topics(self, limit: int = 3, mastered_threshold: float = 0.95) -> List[Tuple[str, float]]:
+        """
+        Returns the attempted topics with the lowest mastery, weakest first.
+
+        Args:
+            limit (int): Maximum number of topics to return.
+            mastered_threshold (float): Topics at or above this are considered mastered.
+
+        Returns:
+            list: (topic, p_mastery) pairs for remedial content.
+        """
+        candidates = ((topic, state["p_mastery"]) for topic, state in self.topics.items()
+                      if state["p_mastery"] < mastered_threshold)
+        return heapq.nsmallest(limit, candidates, key=lambda item: item[1])
+
+    def save(self, db):
+        """Writes topics changed since the last save in one batch."""
+        if not self._dirty:
+            return
+        db.upsert_topic_mastery(self.user_id, {topic: self.topics[topic] for topic in self._dirty})
+        self._dirty.clear()
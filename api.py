@@ -0,0 +1,243 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from contentloader import load_content_from_json, get_categories, get_topics, get_topic_details
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; clients fall back to gzip
+    brotli = None
+
+# Read-only JSON API over the course content and quiz bank, for mobile and offline
+# clients. Run next to the Streamlit app with e.g. `uvicorn api:app --workers 4`.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_SOURCES = {"civic": "civic.json", "financial": "financial.json"}
+QUIZ_BANK_FILE = "quiz_bank.json"
+MAX_AGE_SECONDS = int(os.environ.get("LMS_API_MAX_AGE", 300))
+# Bodies smaller than this go out uncompressed
+COMPRESS_MIN_BYTES = 512
+
+
+class EncodedBody(NamedTuple):
+    digest: str
+    identity: bytes
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+
+
+def encode_body(payload: Any) -> EncodedBody:
+    """
+    Serializes a payload once, with every compressed variant a client may ask for.
+
+    Responses only change when a content file does, so the slowest compression
+    levels are affordable here and each request just picks a precomputed body.
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return EncodedBody(digest, body, None, None)
+    return EncodedBody(
+        digest,
+        body,
+        gzip.compress(body, compresslevel=9, mtime=0),
+        brotli.compress(body, quality=11) if brotli is not None else None,
+    )
+
+
+class ContentCache:
+    """
+    Content files and their encoded responses, reloaded when a file changes on disk.
+
+    Only successful responses are cached, so the number of entries is bounded by
+    the number of categories, topics and quizzes.
+    """
+
+    def __init__(self, base_dir: str = BASE_DIR):
+        self.base_dir = base_dir
+        self._files: Dict[str, Tuple[int, Any]] = {}
+        self._responses: Dict[Tuple[str, Tuple], Tuple[int, EncodedBody]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, file_name: str) -> Tuple[int, Any]:
+        """Returns (mtime_ns, parsed JSON) for a content file."""
+        path = os.path.join(self.base_dir, file_name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return 0, {}
+        cached = self._files.get(file_name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, load_content_from_json(path))
+            with self._lock:
+                self._files[file_name] = cached
+        return cached
+
+    def response(self, file_name: str, key: Tuple, build: Callable[[Any], Any]) -> Optional[EncodedBody]:
+        """
+        Returns the encoded response for key, building it from the file's data on a miss.
+
+        Args:
+            file_name (str): Content file the response is derived from.
+            key (tuple): Identifies the response within that file, e.g. ('topic', category, topic).
+            build (callable): Maps the parsed file to the payload, or None if not found.
+        """
+        mtime, data = self.load(file_name)
+        cached = self._responses.get((file_name, key))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        payload = build(data)
+        if payload is None:
+            return None
+        encoded = encode_body(payload)
+        with self._lock:
+            self._responses[(file_name, key)] = (mtime, encoded)
+        return encoded
+
+
+cache = ContentCache()
+SOURCES_BODY = encode_body({"sources": list(CONTENT_SOURCES)})
+
+
+def choose_encoding(accept_encoding: str, encoded: EncodedBody) -> Optional[str]:
+    """Picks br over gzip from an Accept-Encoding header, if the variant exists."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+    wildcard = accepted.get("*", 0.0)
+    for coding in ("br", "gzip"):
+        if getattr(encoded, coding) is not None and accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], digest: str) -> bool:
+    """Weak comparison as If-None-Match requires; any encoding of the same content matches."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"').split("-", 1)[0] == digest:
+            return True
+    return False
+
+
+def send(request: Request, encoded: Optional[EncodedBody], not_found: str = "Not found") -> Response:
+    """Builds the response for an encoded body, honouring conditional and compression headers."""
+    if encoded is None:
+        return JSONResponse({"error": not_found}, status_code=404)
+    coding = choose_encoding(request.headers.get("accept-encoding", ""), encoded)
+    # Strong ETags must differ between content codings of the same resource
+    headers = {
+        "ETag": f'"{encoded.digest}-{coding}"' if coding else f'"{encoded.digest}"',
+        "Cache-Control": f"public, max-age={MAX_AGE_SECONDS}, stale-while-revalidate={MAX_AGE_SECONDS}",
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), encoded.digest):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(getattr(encoded, coding or "identity"), media_type="application/json", headers=headers)
+
+
+# --- Routes ---
+async def list_sources(request: Request) -> Response:
+    return send(request, SOURCES_BODY)
+
+
+async def list_categories(request: Request) -> Response:
+    source = request.path_params["source"]
+    if source not in CONTENT_SOURCES:
+        return send(request, None, f"Unknown content source '{source}'")
+    return send(request, cache.response(CONTENT_SOURCES[source], ("categories",),
+                                        lambda content: {"source": source, "categories": get_categories(content)}))
+
+
+async def list_topics(request: Request) -> Response:
+    source, category = request.path_params["source"], request.path_params["category"]
+    if source not in CONTENT_SOURCES:
+        return send(request, None, f"Unknown content source '{source}'")
+
+    def build(content):
+        if category not in content:
+            return None
+        return {"source": source, "category": category, "topics": get_topics(content, category)}
+
+    return send(request, cache.response(CONTENT_SOURCES[source], ("topics", category), build),
+                f"Unknown category '{category}'")
+
+
+async def topic_details(request: Request) -> Response:
+    source, category, topic = (request.path_params[k] for k in ("source", "category", "topic"))
+    if source not in CONTENT_SOURCES:
+        return send(request, None, f"Unknown content source '{source}'")
+
+    def build(content):
+        if topic not in content.get(category, {}):
+            return None
+        return {"source": source, "category": category, "topic": topic,
+                **get_topic_details(content, category, topic)}
+
+    return send(request, cache.response(CONTENT_SOURCES[source], ("topic", category, topic), build),
+                f"Unknown topic '{topic}' in '{category}'")
+
+
+async def list_quizzes(request: Request) -> Response:
+    return send(request, cache.response(QUIZ_BANK_FILE, ("quizzes",), lambda bank: {
+        "quizzes": [{"quiz": quiz, "questions": len(questions)} for quiz, questions in bank.items()]
+    }))
+
+
+async def quiz_questions(request: Request) -> Response:
+    quiz = request.path_params["quiz"]
+
+    def build(bank):
+        if quiz not in bank:
+            return None
+        # Answers and explanations are included so offline clients can grade locally
+        return {"quiz": quiz, "questions": bank[quiz]}
+
+    return send(request, cache.response(QUIZ_BANK_FILE, ("quiz", quiz), build), f"Unknown quiz '{quiz}'")
+
+
+app = Starlette(routes=[
+    Route("/content", list_sources),
+    Route("/content/{source}", list_categories),
+    Route("/content/{source}/{category}", list_topics),
+    Route("/content/{source}/{category}/{topic}", topic_details),
+    Route("/quizzes", list_quizzes),
+    Route("/quizzes/{quiz}", quiz_questions),
+])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve course content and quizzes as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    uvicorn.run("api:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
@@ -0,0 +1,13 @@
+import pytest
+
+from financial_calculators import future_value, investment_growth
+
+
+@pytest.mark.parametrize("years", [10, 40])
+def bench_investment_growth(benchmark, years):
+    growth = benchmark(investment_growth, 1000.0, 100.0, 7.0, years)
+    assert len(growth["values"]) == years
+
+
+def bench_future_value(benchmark):
+    assert benchmark(future_value, 1000.0, 100.0, 7.0, 480) > 0
@@ -0,0 +1,26 @@
+from contentloader import load_content_from_json, get_categories, get_topics, get_topic_details
+
+
+def bench_load_content_from_json(benchmark, content_file):
+    content = benchmark(load_content_from_json, content_file)
+    assert content
+
+
+def bench_get_topic_details(benchmark, content_file):
+    content = load_content_from_json(content_file)
+    category = get_categories(content)[0]
+    topics = get_topics(content, category)
+    # Look up the last topic so the cost reflects a full catalogue
+    details = benchmark(get_topic_details, content, category, topics[-1])
+    assert details["title"]
+
+
+def bench_browse_all_topics(benchmark, content_file):
+    content = load_content_from_json(content_file)
+
+    def browse():
+        for category in get_categories(content):
+            for topic in get_topics(content, category):
+                get_topic_details(content, category, topic)
+
+    benchmark(browse)
@@ -0,0 +1,60 @@
+import itertools
+from datetime import datetime, timedelta
+
+import pytest
+
+_session_counter = itertools.count()
+
+# Every DatabaseManager fetch/update method, called the way the app and jobs call it.
+# Each entry maps a name to fn(db, user_id).
+FETCHES = {
+    "fetch_user_profile": lambda db, u: db.fetch_user_profile(u),
+    "fetch_all_user_profiles": lambda db, u: db.fetch_all_user_profiles(),
+    "get_all_user_ids": lambda db, u: db.get_all_user_ids(),
+    "get_total_users": lambda db, u: db.get_total_users(),
+    "fetch_user_sessions": lambda db, u: db.fetch_user_sessions(u),
+    "fetch_all_learning_sessions": lambda db, u: db.fetch_all_learning_sessions(),
+    "fetch_user_features": lambda db, u: db.fetch_user_features(u),
+    "fetch_all_user_features": lambda db, u: db.fetch_all_user_features(),
+    "fetch_user_cluster": lambda db, u: db.fetch_user_cluster(u),
+    "fetch_features_by_cluster": lambda db, u: db.fetch_features_by_cluster(0),
+    "fetch_user_predictions": lambda db, u: db.fetch_user_predictions(u),
+    "fetch_user_recommendations": lambda db, u: db.fetch_user_recommendations(u),
+    "fetch_user_insights": lambda db, u: db.fetch_user_insights(u),
+    "fetch_all_learning_outcomes": lambda db, u: db.fetch_all_learning_outcomes(),
+    "fetch_user_completed_content": lambda db, u: db.fetch_user_completed_content(u),
+    "fetch_top_content_by_cluster": lambda db, u: db.fetch_top_content_by_cluster(0),
+    "fetch_topic_mastery": lambda db, u: db.fetch_topic_mastery(u),
+    "fetch_session_rollups": lambda db, u: db.fetch_session_rollups(
+        "daily", "cluster", datetime(2024, 1, 1), datetime(2025, 1, 1)),
+}
+
+UPDATES = {
+    "insert_user_profile": lambda db, u: db.insert_user_profile({"user_id": u, "demographics": {"age": 20}}),
+    "insert_learning_session": lambda db, u: db.insert_learning_session({
+        "session_id": f"bench_{next(_session_counter)}", "user_id": u, "content_accessed": ["Overview"],
+        "time_spent": timedelta(minutes=10), "performance_metrics": {"score": 75}, "timestamp": datetime(2024, 6, 1),
+    }),
+    "update_user_features": lambda db, u: db.update_user_features(u, {"avg_score": 80.0}),
+    "update_user_cluster": lambda db, u: db.update_user_cluster(u, 1),
+    "update_user_predictions": lambda db, u: db.update_user_predictions(u, "performance", 0.8),
+    "update_user_recommendations": lambda db, u: db.update_user_recommendations(u, [{"content_id": "Overview"}]),
+    "update_user_insights": lambda db, u: db.update_user_insights(u, {"summary": "improving"}),
+    "upsert_topic_mastery": lambda db, u: db.upsert_topic_mastery(
+        u, {"Overview": {"p_mastery": 0.6, "attempts": 4, "correct": 2}}),
+    "refresh_session_rollups": lambda db, u: db.refresh_session_rollups(),
+}
+
+
+@pytest.mark.parametrize("method", list(FETCHES))
+def bench_fetch(benchmark, seeded_db, method):
+    db, user_ids = seeded_db
+    benchmark.group = f"fetch:{method}"
+    benchmark(FETCHES[method], db, user_ids[len(user_ids) // 2])
+
+
+@pytest.mark.parametrize("method", list(UPDATES))
+def bench_update(benchmark, seeded_db, method):
+    db, user_ids = seeded_db
+    benchmark.group = f"update:{method}"
+    benchmark(UPDATES[method], db, user_ids[len(user_ids) // 2])
@@ -0,0 +1,49 @@
+import json
+import sys
+from typing import Dict
+
+
+def load_means(path: str) -> Dict[str, float]:
+    """Reads a pytest-benchmark JSON file into {benchmark fullname: mean seconds}."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {b["fullname"]: b["stats"]["mean"] for b in data["benchmarks"]}
+
+
+def compare(baseline_path: str, candidate_path: str, threshold_pct: float = 10.0) -> int:
+    """
+    Prints the change in mean time for every benchmark present in both runs.
+
+    Args:
+        baseline_path (str): Earlier pytest-benchmark JSON file.
+        candidate_path (str): Newer pytest-benchmark JSON file.
+        threshold_pct (float): Slowdown, in percent, that counts as a regression.
+
+    Returns:
+        int: Number of regressions found.
+    """
+    baseline = load_means(baseline_path)
+    candidate = load_means(candidate_path)
+    regressions = 0
+    for name in sorted(baseline.keys() & candidate.keys()):
+        change = (candidate[name] - baseline[name]) / baseline[name] * 100
+        flag = ""
+        if change > threshold_pct:
+            flag = "  ⚠️ REGRESSION"
+            regressions += 1
+        print(f"{change:+8.1f}%  {baseline[name] * 1e3:10.3f} ms -> {candidate[name] * 1e3:10.3f} ms  {name}{flag}")
+    for name in sorted(candidate.keys() - baseline.keys()):
+        print(f"     new  {'':10}    -> {candidate[name] * 1e3:10.3f} ms  {name}")
+    print(f"\n{regressions} regression(s) over {threshold_pct:.0f}%.")
+    return regressions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Flag regressions between two stored benchmark runs.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent.")
+    args = parser.parse_args()
+    sys.exit(1 if compare(args.baseline, args.candidate, args.threshold) else 0)
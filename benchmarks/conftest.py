@@ -0,0 +1,134 @@
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from contentloader import load_content_from_json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Number of users seeded per database scale. Override with e.g. LMS_BENCH_SCALES=100,1000
+DB_SCALES = [int(s) for s in os.environ.get("LMS_BENCH_SCALES", "100,1000,10000").split(",")]
+SESSIONS_PER_USER = 10
+CLUSTERS = 4
+
+
+def _base_topics():
+    topics = []
+    for file_name in ("civic.json", "financial.json"):
+        content = load_content_from_json(os.path.join(REPO_ROOT, file_name))
+        for category, category_topics in content.items():
+            topics.extend(category_topics.items())
+    return topics
+
+
+def build_content(topic_count):
+    """Builds a single-category content dict with topic_count topics cloned from the real files."""
+    base = _base_topics()
+    topics = {}
+    for i in range(topic_count):
+        name, data = base[i % len(base)]
+        topics[f"{name} {i}"] = data
+    return {"Benchmark Category": topics}
+
+
+# 1x is the real content size, then 100x and a 10k-topic catalogue
+CONTENT_SCALES = {"1x": len(_base_topics()), "100x": 100 * len(_base_topics()), "10k": 10_000}
+
+
+@pytest.fixture(scope="session", params=list(CONTENT_SCALES), ids=lambda scale: f"content-{scale}")
+def content_file(request, tmp_path_factory):
+    content = build_content(CONTENT_SCALES[request.param])
+    path = tmp_path_factory.mktemp("content") / f"content_{request.param}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(content, f)
+    return str(path)
+
+
+def _seed(db, users, Json):
+    """
+    Seeds profiles, sessions, analytics rows and topic mastery for the given number of users.
+
+    Json wraps JSON column values for the backend: psycopg2's Json for PostgreSQL,
+    pass-through for SQLite, which encodes dicts and lists itself.
+    """
+    rng = random.Random(42)
+    topics = [name for name, _ in _base_topics()]
+    start = datetime(2024, 1, 1)
+    user_ids = [f"user_{i:06d}" for i in range(users)]
+
+    db._execute_batch("INSERT INTO user_profiles (user_id, demographics) VALUES %s",
+                      [(u, Json({"age": rng.randint(16, 25)})) for u in user_ids])
+    sessions = []
+    for u in user_ids:
+        for j in range(SESSIONS_PER_USER):
+            sessions.append((
+                f"{u}_s{j}", u, Json(rng.sample(topics, 3)), timedelta(minutes=rng.randint(5, 60)),
+                Json({"clicks": rng.randint(1, 50)}), Json({"score": rng.randint(0, 100)}),
+                start + timedelta(minutes=rng.randint(0, 525_600)),
+            ))
+    db._execute_batch("INSERT INTO learning_sessions (session_id, user_id, content_accessed, time_spent, "
+                      "interactions, performance_metrics, timestamp) VALUES %s", sessions)
+    db._execute_batch("INSERT INTO user_analytics_data (user_id, engineered_features, cluster_label, predictions, "
+                      "recommendations, insights) VALUES %s",
+                      [(u, Json({"avg_score": rng.random() * 100}), rng.randrange(CLUSTERS), Json({"performance": 0.5}),
+                        Json([{"content_id": rng.choice(topics)}]), Json({"summary": "ok"})) for u in user_ids])
+    db._execute_batch("INSERT INTO topic_mastery (user_id, topic, p_mastery, attempts, correct) VALUES %s",
+                      [(u, t, rng.random(), 3, 1) for u in user_ids for t in rng.sample(topics, 5)])
+    db.refresh_session_rollups(full=True)
+    return user_ids
+
+
+def _postgres_db(scale):
+    admin_dsn = os.environ.get("LMS_BENCH_DATABASE_URL")
+    if not admin_dsn:
+        pytest.skip("LMS_BENCH_DATABASE_URL is not set")
+    psycopg2 = pytest.importorskip("psycopg2")
+    from psycopg2.extras import Json
+    from database_manager import DatabaseManager
+
+    db_name = f"lms_bench_{scale}_{os.getpid()}"
+    admin = psycopg2.connect(admin_dsn)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        cur.execute(f"CREATE DATABASE {db_name};")
+
+    db = DatabaseManager({"dsn": admin_dsn, "dbname": db_name})
+    try:
+        db.setup_database()
+        yield db, _seed(db, scale, Json)
+    finally:
+        db.close()
+        with admin.cursor() as cur:
+            cur.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        admin.close()
+
+
+def _sqlite_db(scale, directory):
+    from sqlite_manager import SQLiteDatabaseManager
+
+    db = SQLiteDatabaseManager({"path": str(directory / f"lms_bench_{scale}.db")})
+    try:
+        db.setup_database()
+        yield db, _seed(db, scale, lambda value: value)
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session", params=[(backend, scale) for backend in ("postgres", "sqlite") for scale in DB_SCALES],
+                ids=lambda param: f"{param[0]}-users-{param[1]}")
+def seeded_db(request, tmp_path_factory):
+    """
+    A freshly created and seeded database per backend and scale, dropped afterwards.
+
+    PostgreSQL needs LMS_BENCH_DATABASE_URL pointing at a disposable server where the
+    user may create databases and is skipped otherwise. SQLite runs in a temp file.
+    """
+    backend, scale = request.param
+    if backend == "postgres":
+        yield from _postgres_db(scale)
+    else:
+        yield from _sqlite_db(scale, tmp_path_factory.mktemp("sqlite"))
@@ -0,0 +1,278 @@
+"""
+Headless load harness for lms_app.py.
+
+Each virtual learner is its own AppTest session running in its own worker process,
+so learners rerun the app truly concurrently and compete for CPU, the database and
+the OS scheduler rather than queueing behind each other. AppTest swaps a process-wide
+Runtime on every rerun, which is why sessions cannot share one process without
+serializing. Each worker warms up with a throwaway session before the learners start
+together, so no learner is charged for imports or st.cache_resource. Run from the
+repository root:
+
+    python benchmarks/load_harness.py --learners 1,5,10,25 --rounds 2
+"""
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "lms_app.py")
+
+NAV_LABEL = "Choose a section:"
+with open(os.path.join(REPO_ROOT, "quiz_bank.json"), "r", encoding="utf-8") as _f:
+    ANSWER_KEY = {q["id"]: q["options"][q["correct"]] for questions in json.load(_f).values() for q in questions}
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _by_label(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No widget labelled {label!r} on the current page")
+
+
+class VirtualLearner:
+    """
+    One simulated learner with its own Streamlit session.
+
+    Every interaction is a widget change followed by a script rerun; the rerun is what
+    gets timed, since that is the work the server does per click.
+    """
+
+    def __init__(self, learner_id: int, timeout: float = 60, think_time: float = 0.0):
+        self.learner_id = learner_id
+        self.think_time = think_time
+        self.rng = random.Random(learner_id)
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: List[str] = []
+
+    def _step(self, name: str, action: Callable[[], Any]):
+        if self.think_time:
+            time.sleep(self.rng.uniform(0, 2 * self.think_time))
+        start = time.perf_counter()
+        action()
+        self.latencies[name].append(time.perf_counter() - start)
+        if self.at.exception:
+            self.errors.append(f"{name}: {self.at.exception[0].value}")
+
+    def _navigate(self, page: str):
+        self._step(f"navigate:{page}", lambda: _by_label(self.at.sidebar.selectbox, NAV_LABEL).select(page).run())
+
+    def open_app(self):
+        self._step("open_app", self.at.run)
+
+    def browse_topics(self):
+        source = self.rng.choice(["civic.json", "financial.json"])
+        self._step("browse:content_source",
+                   lambda: _by_label(self.at.sidebar.selectbox, "📂 Choose Content Source:").select(source).run())
+        topic_box = _by_label(self.at.selectbox, "Choose a Topic:")
+        topic = self.rng.choice(topic_box.options)
+        self._step("browse:topic", lambda: topic_box.select(topic).run())
+
+        self._navigate("🏛️ Civic Education")
+        civic_box = _by_label(self.at.selectbox, "Choose a topic to explore:")
+        civic_topic = self.rng.choice(civic_box.options)
+        self._step("browse:civic_topic", lambda: civic_box.select(civic_topic).run())
+
+    def take_quiz(self, quiz: str, category: str):
+        self._navigate("📝 Quizzes")
+        self._step(f"quiz:{quiz}:open",
+                   lambda: _by_label(self.at.selectbox, "Choose quiz category:").select(category).run())
+        if any(button.key == f"practice_{quiz}" for button in self.at.button):
+            # Nothing due for review yet; practice the whole quiz instead
+            self._step(f"quiz:{quiz}:practice", lambda: self.at.button(key=f"practice_{quiz}").click().run())
+        for i, question_id in enumerate(self.at.session_state[f"{quiz}_round"]):
+            correct = ANSWER_KEY[question_id]
+            radio = self.at.radio(key=f"{quiz}_q_{i}")
+            # Roughly two thirds right, so learners see every feedback band
+            radio.set_value(correct if self.rng.random() < 0.67 else self.rng.choice(radio.options))
+            self._step(f"quiz:{quiz}:answer", lambda: self.at.button(key=f"submit_{quiz}_{i}").click().run())
+        self._step(f"quiz:{quiz}:retry", lambda: self.at.button(key=f"retry_{quiz}").click().run())
+
+    def use_calculators(self):
+        self._navigate("💰 Financial Literacy")
+        self._step("calculator:budget_income", lambda: _by_label(self.at.number_input, "Monthly Income ($)")
+                   .set_value(float(self.rng.randrange(1500, 8000, 100))).run())
+        self._step("calculator:budget_rent", lambda: _by_label(self.at.number_input, "Rent/Mortgage ($)")
+                   .set_value(float(self.rng.randrange(500, 3000, 50))).run())
+        self._step("calculator:open_investment",
+                   lambda: _by_label(self.at.selectbox, "Choose a financial topic:").select("Investment Basics").run())
+        self._step("calculator:investment_years", lambda: _by_label(self.at.slider, "Investment Period (years)")
+                   .set_value(self.rng.randint(1, 40)).run())
+        self._step("calculator:investment_return", lambda: _by_label(self.at.slider, "Expected Annual Return (%)")
+                   .set_value(self.rng.randrange(2, 30) / 2).run())
+
+    def journey(self):
+        """One pass through the app in a per-learner random order."""
+        steps = [
+            self.browse_topics,
+            lambda: self.take_quiz("civic", "Civic Knowledge"),
+            lambda: self.take_quiz("financial", "Financial Literacy"),
+            self.use_calculators,
+        ]
+        self.rng.shuffle(steps)
+        for step in steps:
+            try:
+                step()
+            except Exception as e:
+                self.errors.append(f"{type(e).__name__}: {e}")
+        self._navigate("🏠 Home")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+
+_start_barrier: Optional[Any] = None
+
+
+def _init_worker(barrier):
+    global _start_barrier
+    _start_barrier = barrier
+
+
+def _drive(learner_id: int, rounds: int, think_time: float, timeout: float) -> Dict[str, Any]:
+    """Runs one learner in a worker process and returns its latencies, errors and memory use."""
+    VirtualLearner(-1, timeout=timeout).open_app()
+    rss_before = rss_mb()
+    learner = VirtualLearner(learner_id, timeout=timeout, think_time=think_time)
+    _start_barrier.wait()
+    learner.open_app()
+    for _ in range(rounds):
+        learner.journey()
+    rss_after = rss_mb()
+    return {
+        "latencies": dict(learner.latencies),
+        "errors": learner.errors,
+        "rss_mb": rss_after,
+        "rss_growth_mb": max(0.0, rss_after - rss_before),
+    }
+
+
+def run_load(learners: int, rounds: int = 1, think_time: float = 0.0, timeout: float = 60) -> Dict[str, Any]:
+    """
+    Runs learners concurrent virtual learners through rounds journeys each.
+
+    Every learner gets its own worker process, started together behind a barrier.
+
+    Args:
+        learners (int): Number of concurrent sessions.
+        rounds (int): Journeys per learner.
+        think_time (float): Mean pause in seconds between interactions.
+        timeout (float): Per-rerun timeout in seconds.
+
+    Returns:
+        dict: Latency percentiles overall and per interaction, throughput in
+        interactions per second, the largest worker RSS, mean RSS growth per
+        session and any errors.
+    """
+    # Not fork: lms_app's prewarm thread may hold the import lock at the moment of forking
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(learners + 1)
+    with ProcessPoolExecutor(max_workers=learners, mp_context=context,
+                             initializer=_init_worker, initargs=(barrier,)) as pool:
+        futures = [pool.submit(_drive, i, rounds, think_time, timeout) for i in range(learners)]
+        # Wall time starts once every worker has warmed up and built its session
+        barrier.wait()
+        started = time.perf_counter()
+        outcomes = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+    by_interaction = defaultdict(list)
+    for outcome in outcomes:
+        for name, values in outcome["latencies"].items():
+            by_interaction[name].extend(values)
+    all_latencies = [v for values in by_interaction.values() for v in values]
+    return {
+        "learners": learners,
+        "rounds": rounds,
+        "elapsed_s": elapsed,
+        "interactions": len(all_latencies),
+        "throughput_per_s": len(all_latencies) / elapsed if elapsed else 0.0,
+        "latency": summarize(all_latencies),
+        "by_interaction": {name: summarize(values) for name, values in sorted(by_interaction.items())},
+        "rss_mb": max(outcome["rss_mb"] for outcome in outcomes),
+        "rss_per_session_mb": statistics.fmean(outcome["rss_growth_mb"] for outcome in outcomes),
+        "errors": [f"learner {i}: {e}" for i, outcome in enumerate(outcomes) for e in outcome["errors"]],
+    }
+
+
+def print_report(results: List[Dict[str, Any]], detail: bool = False):
+    print(f"\n{'learners':>8} {'interactions':>12} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'RSS MB':>8} {'MB/sess':>8} {'errors':>6}")
+    for r in results:
+        lat = r["latency"]
+        print(f"{r['learners']:>8} {r['interactions']:>12} {r['throughput_per_s']:>8.1f} {lat['p50_ms']:>8.1f} "
+              f"{lat['p95_ms']:>8.1f} {lat['p99_ms']:>8.1f} {lat['max_ms']:>8.1f} {r['rss_mb']:>8.1f} "
+              f"{r['rss_per_session_mb']:>8.2f} {len(r['errors']):>6}")
+    if detail:
+        for r in results:
+            print(f"\nPer interaction at {r['learners']} learners:")
+            for name, s in r["by_interaction"].items():
+                print(f"  {name:<36} n={s['count']:<5} p50={s['p50_ms']:>7.1f}  p95={s['p95_ms']:>7.1f}  "
+                      f"p99={s['p99_ms']:>7.1f} ms")
+    for r in results:
+        for error in r["errors"][:5]:
+            print(f"⚠️ {r['learners']} learners, {error}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate concurrent learners against lms_app.py.")
+    parser.add_argument("--learners", default="1,5,10", help="Comma-separated concurrency levels to run.")
+    parser.add_argument("--rounds", type=int, default=1, help="Journeys per learner.")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds between a learner's clicks.")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-rerun timeout in seconds.")
+    parser.add_argument("--detail", action="store_true", help="Also print percentiles per interaction.")
+    parser.add_argument("--json", dest="json_path", help="Write the full results to this file.")
+    args = parser.parse_args()
+
+    results = []
+    for level in [int(n) for n in args.learners.split(",")]:
+        print(f"Running {level} learner(s)...")
+        results.append(run_load(level, args.rounds, args.think_time, args.timeout))
+    print_report(results, args.detail)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,127 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Tuple
+
+import streamlit as st
+from streamlit import runtime
+
+import profiling
+import visualization_generator as charts
+from database_manager import DEFAULT_ROLLUP_LOOKBACK, DatabaseManager, create_database_manager, db_config_from_env
+
+# Time range label -> (days covered, rollup granularity). Hourly buckets are only
+# used for short ranges so no chart ever reads more than a few thousand rows.
+TIME_RANGES = {
+    "Last 7 days": (7, "hourly"),
+    "Last 30 days": (30, "daily"),
+    "Last 90 days": (90, "daily"),
+    "Last 365 days": (365, "daily"),
+}
+
+
+def run_rollup_job(db: DatabaseManager, full: bool = False, lookback: timedelta = DEFAULT_ROLLUP_LOOKBACK):
+    """Refreshes the cohort rollup tables from learning_sessions."""
+    watermark = db.refresh_session_rollups(full=full, lookback=lookback)
+    if watermark is None:
+        print("No learning sessions to roll up.")
+    else:
+        print(f"Cohort rollups refreshed up to {watermark}.")
+
+
+@st.cache_resource
+def get_database_manager() -> DatabaseManager:
+    return create_database_manager(db_config_from_env(), lazy_connect=True)
+
+
+@st.cache_data(ttl=300)
+def load_rollups(granularity: str, dimension: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    with profiling.span(f"db:fetch_session_rollups:{dimension}"):
+        return get_database_manager().fetch_session_rollups(granularity, dimension, start, end)
+
+
+def cohort_series(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Tuple[List[Any], List[float]]]]:
+    """
+    Turns cluster rollup rows into completion-rate and average-score lines per cluster.
+
+    Args:
+        rows (list): Rows from fetch_session_rollups with dimension 'cluster', ordered by bucket.
+
+    Returns:
+        dict: 'completion_rate' and 'avg_score', each mapping a cohort name to (buckets, values).
+    """
+    completion = defaultdict(lambda: ([], []))
+    scores = defaultdict(lambda: ([], []))
+    for row in rows:
+        cohort = "Unclustered" if row["dimension_value"] == "-1" else f"Cluster {row['dimension_value']}"
+        completion[cohort][0].append(row["bucket"])
+        completion[cohort][1].append(100 * row["completions"] / row["sessions"])
+        if row["score_count"]:
+            scores[cohort][0].append(row["bucket"])
+            scores[cohort][1].append(row["score_sum"] / row["score_count"])
+    return {"completion_rate": dict(completion), "avg_score": dict(scores)}
+
+
+def module_minutes(rows: List[Dict[str, Any]], limit: int = 15) -> Tuple[List[str], List[float]]:
+    """Totals minutes per content module over the range, largest first."""
+    totals = defaultdict(float)
+    for row in rows:
+        totals[row["dimension_value"]] += row["time_spent_seconds"] / 60
+    top = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [module for module, _ in top], [round(minutes, 1) for _, minutes in top]
+
+
+@profiling.profiled()
+def show_cohort_dashboard():
+    st.set_page_config(page_title="Cohort Dashboard", page_icon="📊", layout="wide")
+    st.title("📊 Cohort Dashboard")
+    st.caption("Completion, scores and time spent across all learners, from pre-rolled aggregates.")
+
+    range_label = st.selectbox("Time range:", list(TIME_RANGES), index=1)
+    days, granularity = TIME_RANGES[range_label]
+    # Round the window to the bucket size so the cached query key stays stable between reruns;
+    # buckets are UTC like the sessions they roll up
+    end = datetime.now(timezone.utc).replace(tzinfo=None, minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    if granularity == "daily":
+        end = end.replace(hour=0) + timedelta(days=1)
+    start = end - timedelta(days=days)
+
+    cluster_rows = load_rollups(granularity, "cluster", start, end)
+    content_rows = load_rollups(granularity, "content", start, end)
+    if not cluster_rows:
+        st.info("No rolled-up sessions in this range yet. Run `python dashboard.py` to refresh the rollups.")
+        return
+
+    sessions = sum(r["sessions"] for r in cluster_rows)
+    completions = sum(r["completions"] for r in cluster_rows)
+    score_count = sum(r["score_count"] for r in cluster_rows)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Sessions", f"{sessions:,}")
+    col2.metric("Completion Rate", f"{100 * completions / sessions:.1f}%")
+    col3.metric("Average Score", f"{sum(r['score_sum'] for r in cluster_rows) / score_count:.1f}" if score_count else "—")
+
+    series = cohort_series(cluster_rows)
+    st.plotly_chart(charts.cohort_trend_lines("Completion Rate by Cohort", "Completion rate (%)",
+                                              series["completion_rate"]), use_container_width=True)
+    st.plotly_chart(charts.cohort_trend_lines("Average Score by Cohort", "Average score",
+                                              series["avg_score"]), use_container_width=True)
+    if content_rows:
+        st.plotly_chart(charts.time_per_module_bar(*module_minutes(content_rows)), use_container_width=True)
+
+
+if __name__ == "__main__":
+    if runtime.exists():
+        # Launched with `streamlit run dashboard.py`
+        show_cohort_dashboard()
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Refresh the cohort rollup tables.")
+        parser.add_argument("--full", action="store_true", help="Rebuild all buckets instead of only recent ones.")
+        parser.add_argument("--lookback-hours", type=float, default=DEFAULT_ROLLUP_LOOKBACK.total_seconds() / 3600,
+                            help="How late a session may arrive and still be rolled up by an incremental run.")
+        args = parser.parse_args()
+        db = create_database_manager(db_config_from_env())
+        try:
+            run_rollup_job(db, full=args.full, lookback=timedelta(hours=args.lookback_hours))
+        finally:
+            db.close()
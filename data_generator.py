@@ -0,0 +1,353 @@
+import gzip
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Iterator, List, Tuple
+
+from contentloader import load_content_from_json
+from startup import lazy_import
+
+np = lazy_import("numpy")
+
+# Seeded, reproducible synthetic learners for load and performance testing. Every
+# chunk of users draws from its own RNG stream keyed by (seed, chunk index), so
+# chunks can be generated in any order or in parallel and still give the same rows.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_FILES = ("civic.json", "financial.json")
+DEFAULT_CHUNK_USERS = 5_000
+MAX_TOPICS_PER_SESSION = 4
+QUIZ_QUESTIONS = 3
+
+USER_COLUMNS = ("user_id", "demographics", "learning_preferences", "behavioral_patterns", "engagement_metrics")
+SESSION_COLUMNS = ("session_id", "user_id", "content_accessed", "time_spent", "interactions",
+                   "performance_metrics", "timestamp")
+ANALYTICS_COLUMNS = ("user_id", "engineered_features", "cluster_label", "predictions", "recommendations", "insights")
+# Insert order, so foreign keys always point at rows that are already loaded
+TABLES = (("user_profiles", USER_COLUMNS), ("learning_sessions", SESSION_COLUMNS),
+          ("user_analytics_data", ANALYTICS_COLUMNS))
+
+REGIONS = ("Nairobi", "Mombasa", "Kisumu", "Nakuru", "Uasin Gishu", "Kiambu", "Machakos", "Kakamega", "Nyeri",
+           "Kilifi", "Garissa", "Turkana")
+EDUCATION_LEVELS = ("primary", "secondary", "tertiary", "out_of_school")
+DEVICES = ("mobile", "desktop", "tablet")
+PACES = ("self_paced", "weekly", "intensive")
+SOURCE_PREFERENCES = ("civic", "financial", "both")
+CLUSTER_SUMMARIES = ("Needs support", "Developing", "Progressing", "Excelling")
+# Share of sessions starting in each hour of the day: quiet nights, after-school evening peak
+HOUR_WEIGHTS = (1, 1, 1, 1, 1, 2, 3, 5, 6, 6, 6, 6, 7, 6, 6, 7, 9, 11, 12, 12, 10, 7, 4, 2)
+
+
+def load_topics() -> Tuple[List[str], List[int]]:
+    """Returns every topic key in the content files and the content source index of each."""
+    topics, sources = [], []
+    for source, file_name in enumerate(CONTENT_FILES):
+        content = load_content_from_json(os.path.join(BASE_DIR, file_name))
+        for category_topics in content.values():
+            topics.extend(category_topics)
+            sources.extend([source] * len(category_topics))
+    return topics, sources
+
+
+def _copy_text(value: str) -> str:
+    """Escapes a field for COPY text format."""
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+class SyntheticDataGenerator:
+    """
+    Generates user_profiles, learning_sessions and user_analytics_data rows in chunks.
+
+    Random draws are vectorized with numpy across the whole chunk; only the final
+    formatting into COPY text lines touches each row in Python. Each learner has a
+    latent ability that drives their quiz scores, a preferred content source that
+    biases which topics they open, and a session count with a long tail. Analytics
+    rows are aggregated from the same sessions, so they agree with what
+    user_analytics.engineer_user_features would compute.
+    """
+
+    def __init__(self, users: int, sessions_per_user: float = 20, seed: int = 42,
+                 start: date = date(2024, 1, 1), end: date = date(2025, 1, 1),
+                 chunk_users: int = DEFAULT_CHUNK_USERS):
+        self.users = users
+        self.sessions_per_user = sessions_per_user
+        self.seed = seed
+        self.start = start
+        self.end = end
+        self.chunk_users = chunk_users
+        self.topics, self.topic_sources = load_topics()
+        # Pre-encoded once: JSON strings of each topic, already safe for COPY text
+        self._topic_json = [_copy_text(json.dumps(topic)) for topic in self.topics]
+
+    @property
+    def chunks(self) -> int:
+        return -(-self.users // self.chunk_users)
+
+    def generate_chunk(self, index: int) -> Dict[str, str]:
+        """
+        Generates one chunk of users with all their sessions and analytics.
+
+        Returns:
+            dict: COPY text for each table, keyed by table name.
+        """
+        rng = np.random.default_rng([self.seed, index])
+        first = index * self.chunk_users
+        n = min(self.chunk_users, self.users - first)
+        user_ids = [f"user_{i:08d}" for i in range(first, first + n)]
+        days = (self.end - self.start).days
+
+        # --- Learners ---
+        ability = rng.beta(4.0, 2.5, n)
+        age = rng.integers(16, 26, n)
+        region = rng.integers(0, len(REGIONS), n)
+        education = rng.choice(len(EDUCATION_LEVELS), n, p=(0.2, 0.5, 0.2, 0.1))
+        device = rng.choice(len(DEVICES), n, p=(0.7, 0.2, 0.1))
+        pace = rng.integers(0, len(PACES), n)
+        preference = rng.choice(len(SOURCE_PREFERENCES), n, p=(0.35, 0.35, 0.3))
+        # Gamma-mixed Poisson: most learners come back a few times, a few come back a lot
+        counts = 1 + rng.poisson(max(self.sessions_per_user - 1, 0) * rng.gamma(1.5, 1 / 1.5, n))
+        joined = rng.integers(0, max(days - 7, 1), n)
+        hour_p = np.array(HOUR_WEIGHTS) / sum(HOUR_WEIGHTS)
+        usual_hour = rng.choice(24, n, p=hour_p)
+
+        # --- Sessions, grouped by learner ---
+        m = int(counts.sum())
+        owner = np.repeat(np.arange(n), counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sequence = np.arange(m) - np.repeat(starts, counts)
+        day = joined[owner] + (rng.random(m) * (days - joined[owner])).astype(np.int64)
+        # Half of a learner's sessions fall around their own usual hour, the rest follow the daily curve
+        hour = np.where(rng.random(m) < 0.5, (usual_hour[owner] + rng.integers(-1, 2, m)) % 24,
+                        rng.choice(24, m, p=hour_p))
+        seconds = day * 86_400 + hour * 3_600 + rng.integers(0, 3_600, m)
+        # Sessions of each learner in time order, so sequence numbers follow the timeline
+        seconds = seconds[np.lexsort((seconds, owner))]
+        timestamps = np.datetime_as_string(np.datetime64(self.start, "s") + seconds.astype("timedelta64[s]"))
+        time_spent = np.clip(rng.lognormal(np.log(900), 0.6, m), 60, 10_800).astype(np.int64)  # seconds, which both backends accept
+
+        # Distinct topics per session: shuffle by random keys, preferred source first most of the time
+        topic_count = rng.integers(1, MAX_TOPICS_PER_SESSION + 1, m)
+        source = np.array(self.topic_sources)
+        preferred = (source[None, :] == preference[owner][:, None]) | (preference[owner] == 2)[:, None]
+        keys = rng.random((m, len(self.topics))) - 0.4 * preferred
+        picked = np.argsort(keys, axis=1)[:, :MAX_TOPICS_PER_SESSION]
+
+        # Quiz sessions score by ability; some are abandoned; the rest are reading only
+        kind = rng.choice(3, m, p=(0.6, 0.05, 0.35))
+        correct = rng.binomial(QUIZ_QUESTIONS, ability[owner])
+        answered = rng.integers(0, QUIZ_QUESTIONS, m)
+        score = np.round(correct * 100 / QUIZ_QUESTIONS, 1)
+        clicks = 1 + rng.poisson(time_spent / 40)
+
+        # Every (kind, correct, answered) combination has one performance_metrics string
+        metrics = []
+        for k in range(3):
+            for c in range(QUIZ_QUESTIONS + 1):
+                for a in range(QUIZ_QUESTIONS + 1):
+                    if k == 0:
+                        metrics.append(json.dumps({"score": round(c * 100 / QUIZ_QUESTIONS, 1), "completed": True,
+                                                   "questions_answered": QUIZ_QUESTIONS, "correct_answers": c}))
+                    elif k == 1:
+                        metrics.append(json.dumps({"completed": False, "questions_answered": a}))
+                    else:
+                        metrics.append("{}")
+        metrics_code = (kind * (QUIZ_QUESTIONS + 1) + correct) * (QUIZ_QUESTIONS + 1) + answered
+        # Join the opened topics with object-array concatenation instead of a join per row
+        slots = np.array(self._topic_json, dtype=object)[picked]
+        content = slots[:, 0]
+        for j in range(1, MAX_TOPICS_PER_SESSION):
+            content = np.where(topic_count > j, content + ", " + slots[:, j], content)
+
+        session_lines = [
+            f"{user}_s{seq}\t{user}\t[{topics}]\t{spent}\t"
+            f'{{"clicks": {cl}, "topics_viewed": {n_topics}, "quiz_attempts": {int(k < 2)}}}\t{metrics[code]}\t{ts[:10]} {ts[11:]}\n'
+            for user, seq, topics, spent, cl, n_topics, k, code, ts in zip(
+                np.array(user_ids, dtype=object)[owner].tolist(), sequence.tolist(), content.tolist(),
+                time_spent.tolist(), clicks.tolist(), topic_count.tolist(), kind.tolist(), metrics_code.tolist(),
+                timestamps.tolist())
+        ]
+
+        # --- Analytics, aggregated from the sessions above ---
+        scored = kind == 0
+        score_sum = np.bincount(owner, weights=np.where(scored, score, 0), minlength=n)
+        score_count = np.bincount(owner, weights=scored, minlength=n)
+        total_minutes = np.round(np.bincount(owner, weights=time_spent, minlength=n) / 60, 2)
+        opened = np.arange(MAX_TOPICS_PER_SESSION)[None, :] < topic_count[:, None]
+        seen = np.unique((owner[:, None] * len(self.topics) + picked)[opened])
+        distinct = np.bincount(seen // len(self.topics), minlength=n)
+        last_active = timestamps[starts + counts - 1]
+        cluster = np.digitize(ability, (0.45, 0.6, 0.75))
+        recommended = rng.integers(0, len(self.topics), n)
+
+        user_lines, analytics_lines = [], []
+        for user, ag, r, e, d, p, pr, h, cnt, ssum, scnt, minutes, dist, last, cl, rec, ab in zip(
+                user_ids, age.tolist(), region.tolist(), education.tolist(), device.tolist(), pace.tolist(),
+                preference.tolist(), usual_hour.tolist(), counts.tolist(), score_sum.tolist(), score_count.tolist(),
+                total_minutes.tolist(), distinct.tolist(), last_active.tolist(), cluster.tolist(),
+                recommended.tolist(), ability.tolist()):
+            avg_score = round(ssum / scnt, 2) if scnt else None
+            user_lines.append(
+                f'{user}\t{{"age": {ag}, "region": "{REGIONS[r]}", "education_level": "{EDUCATION_LEVELS[e]}"}}\t'
+                f'{{"preferred_source": "{SOURCE_PREFERENCES[pr]}", "pace": "{PACES[p]}", "device": "{DEVICES[d]}"}}\t'
+                f'{{"usual_hour": {h}, "avg_session_minutes": {round(minutes / cnt, 1)}}}\t'
+                f'{{"session_count": {cnt}, "quiz_count": {int(scnt)}}}\n'
+            )
+            analytics_lines.append(
+                f'{user}\t{{"session_count": {cnt}, "total_time_spent_minutes": {minutes}, '
+                f'"avg_score": {json.dumps(avg_score)}, "distinct_content_count": {dist}, "last_active": "{last}"}}\t'
+                f'{cl}\t{{"performance": {round(ab, 3)}}}\t[{{"content_id": {self._topic_json[rec]}}}]\t'
+                f'{{"summary": "{CLUSTER_SUMMARIES[cl]}"}}\n'
+            )
+
+        return {"user_profiles": "".join(user_lines), "learning_sessions": "".join(session_lines),
+                "user_analytics_data": "".join(analytics_lines)}
+
+    def iter_chunks(self, workers: int = 1) -> Iterator[Dict[str, str]]:
+        """Yields chunks in order, generating up to `workers` of them in parallel."""
+        if workers <= 1:
+            for index in range(self.chunks):
+                yield self.generate_chunk(index)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Only a couple of chunks per worker in flight, so a slow sink bounds memory
+            pending = deque()
+            for index in range(self.chunks):
+                pending.append(executor.submit(self.generate_chunk, index))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+# --- Sinks ---
+class DatabaseSink:
+    """Streams chunks into PostgreSQL with COPY through DatabaseManager.copy_rows."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def write(self, chunk: Dict[str, str]):
+        for table, columns in TABLES:
+            if chunk[table]:
+                self.db.copy_rows(table, columns, chunk[table])
+
+    def close(self):
+        pass
+
+
+class CopyFileSink:
+    """
+    Appends chunks to one COPY text file per table, gzip-compressed if compress is set.
+
+    Load them with e.g. `\\copy learning_sessions (...) FROM PROGRAM 'zcat learning_sessions.tsv.gz'`
+    in psql, or DatabaseManager.copy_rows.
+    """
+
+    def __init__(self, out_dir: str, compress: bool = False):
+        os.makedirs(out_dir, exist_ok=True)
+        suffix = ".tsv.gz" if compress else ".tsv"
+        # Fastest gzip level: at higher levels compression, not generation, sets the pace
+        self.files = {table: gzip.open(os.path.join(out_dir, table + suffix), "wt", compresslevel=1, encoding="utf-8")
+                      if compress else open(os.path.join(out_dir, table + suffix), "w", encoding="utf-8")
+                      for table, _ in TABLES}
+
+    def write(self, chunk: Dict[str, str]):
+        for table, _ in TABLES:
+            self.files[table].write(chunk[table])
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def _sql_literal(field: str) -> str:
+    if field == "\\N":
+        return "NULL"
+    value = field.replace("\\t", "\t").replace("\\n", "\n").replace("\\\\", "\\")
+    return "'" + value.replace("'", "''") + "'"
+
+
+class SqlScriptSink:
+    """
+    Writes chunks as multi-row INSERT statements, loadable with psql or
+    DatabaseManager.insert_sample_data. Meant for small samples such as sample_data.sql.
+    """
+
+    def __init__(self, path: str, rows_per_statement: int = 500):
+        self.file = open(path, "w", encoding="utf-8")
+        self.rows_per_statement = rows_per_statement
+        self.file.write("-- Synthetic sample data generated by data_generator.py. Regenerate rather than edit.\n")
+
+    def write(self, chunk: Dict[str, str]):
+        for table, columns in TABLES:
+            lines = chunk[table].splitlines()
+            for i in range(0, len(lines), self.rows_per_statement):
+                values = ",\n".join("(" + ", ".join(_sql_literal(field) for field in line.split("\t")) + ")"
+                                    for line in lines[i:i + self.rows_per_statement])
+                self.file.write(f"\nINSERT INTO {table} ({', '.join(columns)}) VALUES\n{values};\n")
+
+    def close(self):
+        self.file.close()
+
+
+def generate(generator: SyntheticDataGenerator, sink, workers: int = 1, progress: bool = False) -> Dict[str, float]:
+    """
+    Generates every chunk into sink.
+
+    Returns:
+        dict: Row counts per table, elapsed seconds and overall rows per second.
+    """
+    counts = {table: 0 for table, _ in TABLES}
+    started = time.perf_counter()
+    try:
+        for i, chunk in enumerate(generator.iter_chunks(workers), 1):
+            sink.write(chunk)
+            for table, _ in TABLES:
+                counts[table] += chunk[table].count("\n")
+            if progress:
+                rows = sum(counts.values())
+                print(f"chunk {i}/{generator.chunks}: {rows} rows, "
+                      f"{rows / (time.perf_counter() - started):,.0f} rows/s", flush=True)
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - started
+    return {**counts, "seconds": round(elapsed, 2), "rows_per_second": round(sum(counts.values()) / elapsed)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate reproducible synthetic learners, sessions and analytics.")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--sessions-per-user", type=float, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2025, 1, 1))
+    parser.add_argument("--chunk-users", type=int, default=DEFAULT_CHUNK_USERS)
+    parser.add_argument("--workers", type=int, default=1, help="Processes generating chunks in parallel.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--database", action="store_true",
+                        help="COPY into the database configured by DATABASE_URL / PG* variables.")
+    target.add_argument("--output", help="A .sql file of INSERT statements, or a directory of COPY .tsv files.")
+    parser.add_argument("--gzip", action="store_true", help="Compress .tsv files.")
+    args = parser.parse_args()
+
+    generator = SyntheticDataGenerator(args.users, args.sessions_per_user, args.seed, args.start, args.end,
+                                       args.chunk_users)
+    db = None
+    if args.database:
+        from database_manager import DatabaseManager, db_config_from_env
+        db = DatabaseManager(db_config_from_env())
+        sink = DatabaseSink(db)
+    elif args.output.endswith(".sql"):
+        sink = SqlScriptSink(args.output)
+    else:
+        sink = CopyFileSink(args.output, args.gzip)
+    try:
+        print(generate(generator, sink, args.workers, progress=True))
+    finally:
+        if db is not None:
+            db.close()
@@ -1,19 +1,177 @@
-import psycopg2
-from psycopg2 import sql
-from psycopg2.extras import Json
-from typing import Dict, List, Any, Optional
+from __future__ import annotations
+
+import io
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Dict, Iterator, List, Any, MutableMapping, Optional, Tuple
+
+import profiling
+from startup import lazy_import
+
+# psycopg2 is only imported when the first query runs
+psycopg2 = lazy_import("psycopg2")
+sql = lazy_import("psycopg2.sql")
+extras = lazy_import("psycopg2.extras")
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database_schema.sql")
+
+# Keys in db_config that configure routing rather than the libpq connection
+ROUTING_KEYS = ("replicas", "read_your_writes_seconds", "max_replica_lag_seconds")
+DEFAULT_READ_YOUR_WRITES_SECONDS = 2.0
+DEFAULT_MAX_REPLICA_LAG_SECONDS = 5.0
+# How often a replica's replay lag is re-measured, and how long a failed replica is skipped
+REPLICA_LAG_CHECK_SECONDS = 1.0
+REPLICA_RETRY_SECONDS = 30.0
+# Incremental rollup refreshes re-scan this far behind the watermark, so sessions that
+# arrive late (e.g. synced from an offline client) are still rolled up
+DEFAULT_ROLLUP_LOOKBACK = timedelta(days=2)
+
+# Where track_writes() keeps the current user session's last write time
+LAST_WRITE_KEY = "_db_last_write"
+_session_writes: ContextVar[Optional[MutableMapping[str, Any]]] = ContextVar("lms_session_writes", default=None)
+
+
+@contextmanager
+def track_writes(state: MutableMapping[str, Any]):
+    """
+    Makes read-your-writes routing follow one user session instead of the manager.
+
+    A manager shared through st.cache_resource serves every session, so its own
+    last-write time would pin everyone's reads to the primary after anyone writes.
+    Inside this block, writes are stamped into state (e.g. st.session_state) and
+    reads only stay on the primary after this session's own writes.
+
+    Args:
+        state (MutableMapping): Per-session storage for the last write time.
+    """
+    token = _session_writes.set(state)
+    try:
+        yield
+    finally:
+        _session_writes.reset(token)
+
+
+def query_span():
+    """
+    Profiling span for one database call, named after the manager method that made it.
+
+    E.g. 'db:fetch_user_profile' for a query run by fetch_user_profile(), so the
+    timing panel attributes every query without each method opening its own span.
+    """
+    if not profiling.ENABLED:
+        return profiling.span("db")
+    frame = sys._getframe(1)
+    # Skip the _execute_* helpers, including a replica retry calling itself
+    while frame.f_code.co_name.startswith("_execute"):
+        frame = frame.f_back
+    return profiling.span(f"db:{frame.f_code.co_name}")
+
+
+# Column order of the rows yielded by iter_session_export_rows
+SESSION_EXPORT_COLUMNS = ("session_id", "user_id", "timestamp", "time_spent_seconds", "score", "completed",
+                          "content_accessed", "interactions", "cluster_label")
+# Column order of the rows yielded by iter_user_analytics_rows; JSON columns are JSON text
+USER_ANALYTICS_EXPORT_COLUMNS = ("user_id", "cluster_label", "engineered_features", "predictions",
+                                 "recommendations", "insights")
+
+# Wrapped in sql.SQL when run, so importing this module doesn't import psycopg2
+_SESSION_EXPORT_QUERY = """
+    SELECT
+        ls.session_id,
+        ls.user_id,
+        ls.timestamp,
+        EXTRACT(EPOCH FROM ls.time_spent)::double precision,
+        (ls.performance_metrics->>'score')::double precision,
+        COALESCE((ls.performance_metrics->>'completed')::boolean, ls.performance_metrics ? 'score'),
+        ARRAY(SELECT jsonb_array_elements_text(ls.content_accessed)),
+        ls.interactions::text,
+        uad.cluster_label
+    FROM
+        learning_sessions ls
+    LEFT JOIN
+        user_analytics_data uad ON ls.user_id = uad.user_id
+    WHERE
+        (%(since)s IS NULL OR ls.timestamp > %(since)s)
+        AND (%(until)s IS NULL OR ls.timestamp <= %(until)s)
+    ORDER BY ls.timestamp;
+"""
+
+
+def db_config_from_env() -> Dict[str, Any]:
+    """
+    Builds a connection config from DATABASE_URL; libpq fills the rest from PG* variables.
+
+    DATABASE_REPLICA_URLS, a comma-separated list of DSNs, adds read replicas.
+    """
+    db_config = {"dsn": os.environ.get("DATABASE_URL", "")}
+    replicas = [url.strip() for url in os.environ.get("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+    if replicas:
+        db_config["replicas"] = replicas
+    return db_config
+
+def create_database_manager(db_config: Dict[str, str], lazy_connect: bool = False):
+    """
+    Returns the storage backend for a connection config.
+
+    Args:
+        db_config (dict): A 'sqlite:///path' DSN (or a 'path' key) selects the embedded
+            SQLiteDatabaseManager; anything else connects to PostgreSQL.
+        lazy_connect (bool): Open the connection on the first query.
+    """
+    if db_config.get("path") or db_config.get("dsn", "").startswith("sqlite:///"):
+        from sqlite_manager import SQLiteDatabaseManager
+        return SQLiteDatabaseManager(db_config, lazy_connect=lazy_connect)
+    return DatabaseManager(db_config, lazy_connect=lazy_connect)
 
 class DatabaseManager:
-    def __init__(self, db_config: Dict[str, str]):
+    """
+    PostgreSQL storage for the LMS.
+
+    Writes go to the primary. If db_config lists 'replicas', fetch_* and get_* reads
+    are spread over them round-robin, skipping replicas that lag more than
+    'max_replica_lag_seconds'. For 'read_your_writes_seconds' after a write, reads
+    stay on the primary so callers see their own writes. Writes are timed per user
+    session inside track_writes(), otherwise per manager.
+    """
+
+    SCHEMA_PATH = SCHEMA_PATH
+
+    def __init__(self, db_config: Dict[str, Any], lazy_connect: bool = False):
         self.db_config = db_config
         self.conn = None
-        self.connect()
+        self.connect_config = {k: v for k, v in db_config.items() if k not in ROUTING_KEYS}
+        self.replica_dsns = list(db_config.get("replicas", []))
+        self.read_your_writes_seconds = db_config.get("read_your_writes_seconds", DEFAULT_READ_YOUR_WRITES_SECONDS)
+        self.max_replica_lag_seconds = db_config.get("max_replica_lag_seconds", DEFAULT_MAX_REPLICA_LAG_SECONDS)
+        self._replica_conns: List[Any] = [None] * len(self.replica_dsns)
+        # Per replica: (monotonic time of last check, lag in seconds, or None while it is down)
+        self._replica_status: List[Tuple[float, Optional[float]]] = [(float("-inf"), 0.0)] * len(self.replica_dsns)
+        self._replica_cycle = itertools.cycle(range(len(self.replica_dsns)))
+        self._replica_lock = threading.Lock()
+        self._last_write = float("-inf")
+        # With lazy_connect the connection opens on the first query instead
+        if not lazy_connect:
+            self.connect()
+
+    def _connect(self, dsn: Optional[str] = None):
+        """Opens an autocommit connection to the primary, or to the replica at dsn, with its session in UTC."""
+        conn = psycopg2.connect(**(self.connect_config if dsn is None else {**self.connect_config, "dsn": dsn}))
+        conn.autocommit = True
+        # Timezone-aware datetimes are then stored as UTC, like the timezone('utc', now()) defaults
+        with conn.cursor() as cur:
+            cur.execute("SET TIME ZONE 'UTC';")
+        return conn
 
     def connect(self):
         """Establishes a connection to the PostgreSQL database."""
         try:
-            self.conn = psycopg2.connect(**self.db_config)
-            self.conn.autocommit = True # Auto-commit transactions
+            self.conn = self._connect() # Auto-commit transactions
             print("Database connection established successfully.")
         except psycopg2.Error as e:
             print(f"Error connecting to database: {e}")
@@ -21,33 +179,137 @@ class DatabaseManager:
 
     def close(self):
         """Closes the database connection."""
+        for i, replica in enumerate(self._replica_conns):
+            if replica is not None:
+                replica.close()
+                self._replica_conns[i] = None
         if self.conn:
             self.conn.close()
             print("Database connection closed.")
 
-    def _execute_query(self, query: sql.Composable, params: Optional[Tuple] = None, fetch_one=False, fetch_all=False):
-        """Helper to execute SQL queries."""
-        if not self.conn:
-            self.connect() # Attempt to reconnect
+    # --- Read Routing ---
+    def _replica_connection(self, index: int):
+        conn = self._replica_conns[index]
+        if conn is None or conn.closed:
+            conn = self._connect(self.replica_dsns[index])
+            conn.set_session(readonly=True)
+            self._replica_conns[index] = conn
+        return conn
+
+    def _replica_lag(self, index: int) -> Optional[float]:
+        """Returns the replica's replay lag in seconds, re-measured at most once per REPLICA_LAG_CHECK_SECONDS."""
+        checked_at, lag = self._replica_status[index]
+        now = time.monotonic()
+        retry_after = REPLICA_RETRY_SECONDS if lag is None else REPLICA_LAG_CHECK_SECONDS
+        if now - checked_at < retry_after:
+            return lag
+        try:
+            with self._replica_connection(index).cursor() as cur:
+                # No lag while everything received has been replayed, even if the primary is idle.
+                # NULL on a server that isn't in recovery, which counts as fully caught up.
+                cur.execute("""
+                    SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                                ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END;
+                """)
+                lag = float(cur.fetchone()[0] or 0.0)
+        except psycopg2.Error as e:
+            print(f"Read replica {index} unavailable: {e}")
+            self._replica_conns[index] = None
+            lag = None
+        self._replica_status[index] = (now, lag)
+        return lag
+
+    def _mark_replica_down(self, conn, error: Exception):
+        with self._replica_lock:
+            for i, replica in enumerate(self._replica_conns):
+                if replica is conn:
+                    print(f"Read replica {i} unavailable: {error}")
+                    self._replica_conns[i] = None
+                    self._replica_status[i] = (time.monotonic(), None)
+
+    def _last_write_time(self) -> float:
+        state = _session_writes.get()
+        return self._last_write if state is None else state.get(LAST_WRITE_KEY, float("-inf"))
+
+    def _record_write(self):
+        state = _session_writes.get()
+        if state is None:
+            self._last_write = time.monotonic()
+        else:
+            state[LAST_WRITE_KEY] = time.monotonic()
+
+    def _read_replica(self) -> Optional[int]:
+        """Picks the next healthy replica for a read, or None to read from the primary."""
+        if not self.replica_dsns or time.monotonic() - self._last_write_time() < self.read_your_writes_seconds:
+            return None
+        with self._replica_lock:
+            for _ in range(len(self.replica_dsns)):
+                index = next(self._replica_cycle)
+                lag = self._replica_lag(index)
+                if lag is not None and lag <= self.max_replica_lag_seconds:
+                    return index
+        return None
+
+    def _read_connection(self):
+        """Picks a connection for a read: the next healthy replica, or the primary."""
+        index = self._read_replica()
+        return None if index is None else self._replica_conns[index]
+
+    def _execute_query(self, query: sql.Composable, params: Optional[Tuple] = None, fetch_one=False, fetch_all=False,
+                       read_only=False):
+        """Helper to execute SQL queries. read_only queries may be served by a replica."""
+        conn = self._read_connection() if read_only else None
+        if conn is None:
             if not self.conn:
-                raise ConnectionError("No database connection available.")
+                self.connect() # Attempt to reconnect
+                if not self.conn:
+                    raise ConnectionError("No database connection available.")
+            conn = self.conn
 
         try:
-            with self.conn.cursor() as cur:
+            with query_span(), conn.cursor() as cur:
                 cur.execute(query, params)
                 if fetch_one:
                     return cur.fetchone()
                 if fetch_all:
                     return cur.fetchall()
                 return None
+        except psycopg2.OperationalError as e:
+            if conn is self.conn:
+                print(f"Database error during query execution: {e}")
+                conn.rollback() # Rollback on error
+                raise # Re-raise the exception
+            # A replica went away mid-read: take it out of rotation and ask the primary
+            self._mark_replica_down(conn, e)
+            return self._execute_query(query, params, fetch_one, fetch_all, read_only=True)
         except psycopg2.Error as e:
             print(f"Database error during query execution: {e}")
+            conn.rollback() # Rollback on error
+            raise # Re-raise the exception
+        finally:
+            if not read_only:
+                self._record_write()
+
+    def _execute_batch(self, query: sql.Composable, rows: List[Tuple], page_size: int = 1000):
+        """Helper to insert or update many rows in one round trip per page."""
+        if not self.conn:
+            self.connect() # Attempt to reconnect
+            if not self.conn:
+                raise ConnectionError("No database connection available.")
+
+        try:
+            with query_span(), self.conn.cursor() as cur:
+                extras.execute_values(cur, query, rows, page_size=page_size)
+        except psycopg2.Error as e:
+            print(f"Database error during batch execution: {e}")
             self.conn.rollback() # Rollback on error
             raise # Re-raise the exception
+        finally:
+            self._record_write()
 
-    def setup_database(self, schema_sql_path: str):
+    def setup_database(self, schema_sql_path: Optional[str] = None):
         """Executes the database schema creation script."""
-        with open(schema_sql_path, 'r') as f:
+        with open(schema_sql_path or self.SCHEMA_PATH, 'r') as f:
             schema_script = f.read()
         self._execute_query(sql.SQL(schema_script))
         print("Database schema setup complete.")
@@ -72,15 +334,20 @@ class DatabaseManager:
         """)
         self._execute_query(query, (
             user_profile['user_id'],
-            Json(user_profile.get('demographics', {})),
-            Json(user_profile.get('learning_preferences', {})),
-            Json(user_profile.get('behavioral_patterns', {})),
-            Json(user_profile.get('engagement_metrics', {}))
+            extras.Json(user_profile.get('demographics', {})),
+            extras.Json(user_profile.get('learning_preferences', {})),
+            extras.Json(user_profile.get('behavioral_patterns', {})),
+            extras.Json(user_profile.get('engagement_metrics', {}))
         ))
 
+    def ensure_user_profile(self, user_id: str):
+        """Creates an empty profile for a learner seen for the first time, leaving existing ones untouched."""
+        query = sql.SQL("INSERT INTO user_profiles (user_id) VALUES (%s) ON CONFLICT (user_id) DO NOTHING;")
+        self._execute_query(query, (user_id,))
+
     def fetch_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         query = sql.SQL("SELECT user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics FROM user_profiles WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         if row:
             return {
                 "user_id": row[0],
@@ -93,7 +360,7 @@ class DatabaseManager:
 
     def fetch_all_user_profiles(self) -> Dict[str, Dict[str, Any]]:
         query = sql.SQL("SELECT user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics FROM user_profiles;")
-        rows = self._execute_query(query, fetch_all=True)
+        rows = self._execute_query(query, fetch_all=True, read_only=True)
         profiles = {}
         for row in rows:
             profiles[row[0]] = {
@@ -107,12 +374,12 @@ class DatabaseManager:
 
     def get_all_user_ids(self) -> List[str]:
         query = sql.SQL("SELECT user_id FROM user_profiles;")
-        rows = self._execute_query(query, fetch_all=True)
+        rows = self._execute_query(query, fetch_all=True, read_only=True)
         return [row[0] for row in rows]
 
     def get_total_users(self) -> int:
         query = sql.SQL("SELECT COUNT(*) FROM user_profiles;")
-        return self._execute_query(query, fetch_one=True)[0]
+        return self._execute_query(query, fetch_one=True, read_only=True)[0]
 
     # --- Learning Session Management ---
     def insert_learning_session(self, session: Dict[str, Any]):
@@ -123,16 +390,16 @@ class DatabaseManager:
         self._execute_query(query, (
             session['session_id'],
             session['user_id'],
-            Json(session.get('content_accessed', [])),
+            extras.Json(session.get('content_accessed', [])),
             session.get('time_spent'), # This should be a string like 'PT1H30M' or timedelta in Python
-            Json(session.get('interactions', {})),
-            Json(session.get('performance_metrics', {})),
+            extras.Json(session.get('interactions', {})),
+            extras.Json(session.get('performance_metrics', {})),
             session.get('timestamp') # Datetime object
         ))
 
     def fetch_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         query = sql.SQL("SELECT session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp FROM learning_sessions WHERE user_id = %s ORDER BY timestamp ASC;")
-        rows = self._execute_query(query, (user_id,), fetch_all=True)
+        rows = self._execute_query(query, (user_id,), fetch_all=True, read_only=True)
         sessions = []
         for row in rows:
             sessions.append({
@@ -148,7 +415,7 @@ class DatabaseManager:
 
     def fetch_all_learning_sessions(self) -> List[Dict[str, Any]]:
         query = sql.SQL("SELECT session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp FROM learning_sessions;")
-        rows = self._execute_query(query, fetch_all=True)
+        rows = self._execute_query(query, fetch_all=True, read_only=True)
         sessions = []
         for row in rows:
             sessions.append({
@@ -169,16 +436,16 @@ class DatabaseManager:
             VALUES (%s, %s)
             ON CONFLICT (user_id) DO UPDATE SET engineered_features = EXCLUDED.engineered_features;
         """)
-        self._execute_query(query, (user_id, Json(features)))
+        self._execute_query(query, (user_id, extras.Json(features)))
 
     def fetch_user_features(self, user_id: str) -> Optional[Dict[str, Any]]:
         query = sql.SQL("SELECT engineered_features FROM user_analytics_data WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         return row[0] if row else None
 
     def fetch_all_user_features(self) -> Dict[str, Dict[str, Any]]:
         query = sql.SQL("SELECT user_id, engineered_features FROM user_analytics_data;")
-        rows = self._execute_query(query, fetch_all=True)
+        rows = self._execute_query(query, fetch_all=True, read_only=True)
         features = {}
         for row in rows:
             features[row[0]] = row[1]
@@ -194,12 +461,12 @@ class DatabaseManager:
 
     def fetch_user_cluster(self, user_id: str) -> Optional[int]:
         query = sql.SQL("SELECT cluster_label FROM user_analytics_data WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         return row[0] if row else None
 
     def fetch_features_by_cluster(self, cluster_label: int) -> Dict[str, Dict[str, Any]]:
         query = sql.SQL("SELECT user_id, engineered_features FROM user_analytics_data WHERE cluster_label = %s;")
-        rows = self._execute_query(query, (cluster_label,), fetch_all=True)
+        rows = self._execute_query(query, (cluster_label,), fetch_all=True, read_only=True)
         features = {}
         for row in rows:
             features[row[0]] = row[1]
@@ -213,11 +480,11 @@ class DatabaseManager:
             SET predictions = jsonb_set(coalesce(predictions, '{{}}'::jsonb), %s, %s, true)
             WHERE user_id = %s;
         """)
-        self._execute_query(query, ([prediction_type], Json(prediction_data), user_id))
+        self._execute_query(query, ([prediction_type], extras.Json(prediction_data), user_id))
 
     def fetch_user_predictions(self, user_id: str) -> Optional[Dict[str, Any]]:
         query = sql.SQL("SELECT predictions FROM user_analytics_data WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         return row[0] if row else None
 
     def update_user_recommendations(self, user_id: str, recommendations: List[Dict[str, Any]]):
@@ -226,11 +493,11 @@ class DatabaseManager:
             SET recommendations = %s
             WHERE user_id = %s;
         """)
-        self._execute_query(query, (Json(recommendations), user_id))
+        self._execute_query(query, (extras.Json(recommendations), user_id))
 
     def fetch_user_recommendations(self, user_id: str) -> Optional[List[Dict[str, Any]]]:
         query = sql.SQL("SELECT recommendations FROM user_analytics_data WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         return row[0] if row else None
 
     def update_user_insights(self, user_id: str, insights: Dict[str, str]):
@@ -239,11 +506,11 @@ class DatabaseManager:
             SET insights = %s
             WHERE user_id = %s;
         """)
-        self._execute_query(query, (Json(insights), user_id))
+        self._execute_query(query, (extras.Json(insights), user_id))
 
     def fetch_user_insights(self, user_id: str) -> Optional[Dict[str, str]]:
         query = sql.SQL("SELECT insights FROM user_analytics_data WHERE user_id = %s;")
-        row = self._execute_query(query, (user_id,), fetch_one=True)
+        row = self._execute_query(query, (user_id,), fetch_one=True, read_only=True)
         return row[0] if row else None
 
     def fetch_all_learning_outcomes(self) -> Dict[str, float]:
@@ -259,7 +526,7 @@ class DatabaseManager:
             GROUP BY
                 ls.user_id;
         """)
-        rows = self._execute_query(query, fetch_all=True)
+        rows = self._execute_query(query, fetch_all=True, read_only=True)
         return {row[0]: float(row[1]) for row in rows}
 
     def fetch_user_completed_content(self, user_id: str) -> List[str]:
@@ -268,7 +535,7 @@ class DatabaseManager:
             FROM learning_sessions
             WHERE user_id = %s;
         """)
-        rows = self._execute_query(query, (user_id,), fetch_all=True)
+        rows = self._execute_query(query, (user_id,), fetch_all=True, read_only=True)
         return [row[0] for row in rows if row and row[0]] # Filter out None or empty strings
 
     def fetch_top_content_by_cluster(self, cluster_label: int, limit: int = 5) -> Dict[str, int]:
@@ -289,6 +556,324 @@ class DatabaseManager:
                 access_count DESC
             LIMIT %s;
         """)
-        rows = self._execute_query(query, (cluster_label, limit), fetch_all=True)
+        rows = self._execute_query(query, (cluster_label, limit), fetch_all=True, read_only=True)
         return {row[0]: row[1] for row in rows}
-    
\ No newline at end of file
+    
+
+    # --- Topic Mastery (Bayesian Knowledge Tracing) ---
+    def upsert_topic_mastery(self, user_id: str, topics: Dict[str, Dict[str, Any]]):
+        """Stores mastery estimates for several topics of one user in a single statement."""
+        if not topics:
+            return
+        query = sql.SQL("""
+            INSERT INTO topic_mastery (user_id, topic, p_mastery, attempts, correct)
+            VALUES %s
+            ON CONFLICT (user_id, topic) DO UPDATE
+            SET p_mastery = EXCLUDED.p_mastery,
+                attempts = EXCLUDED.attempts,
+                correct = EXCLUDED.correct,
+                updated_at = timezone('utc', now());
+        """)
+        rows = [(user_id, topic, state['p_mastery'], state['attempts'], state['correct'])
+                for topic, state in topics.items()]
+        self._execute_batch(query, rows)
+
+    def fetch_topic_mastery(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        query = sql.SQL("SELECT topic, p_mastery, attempts, correct FROM topic_mastery WHERE user_id = %s;")
+        rows = self._execute_query(query, (user_id,), fetch_all=True, read_only=True)
+        return {row[0]: {"p_mastery": row[1], "attempts": row[2], "correct": row[3]} for row in rows}
+
+    # --- Spaced Repetition (SM-2 Review Schedule) ---
+    def upsert_review_schedule(self, user_id: str, items: Dict[str, Dict[str, Any]]):
+        """Stores the scheduling state of several questions of one user in a single statement."""
+        if not items:
+            return
+        query = sql.SQL("""
+            INSERT INTO review_schedule (user_id, question_id, interval_days, ease, repetitions, lapses, due_at)
+            VALUES %s
+            ON CONFLICT (user_id, question_id) DO UPDATE
+            SET interval_days = EXCLUDED.interval_days,
+                ease = EXCLUDED.ease,
+                repetitions = EXCLUDED.repetitions,
+                lapses = EXCLUDED.lapses,
+                due_at = EXCLUDED.due_at,
+                updated_at = timezone('utc', now());
+        """)
+        rows = [(user_id, question_id, item['interval_days'], item['ease'], item['repetitions'], item['lapses'],
+                 item['due_at']) for question_id, item in items.items()]
+        self._execute_batch(query, rows)
+
+    def fetch_review_schedule(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        query = sql.SQL("SELECT question_id, interval_days, ease, repetitions, lapses, due_at FROM review_schedule WHERE user_id = %s;")
+        rows = self._execute_query(query, (user_id,), fetch_all=True, read_only=True)
+        return {row[0]: {"interval_days": row[1], "ease": row[2], "repetitions": row[3], "lapses": row[4],
+                         "due_at": row[5]} for row in rows}
+
+    def fetch_due_learners(self, until: Any, after: Optional[Any] = None) -> List[Tuple[str, Any]]:
+        """
+        Returns (user_id, earliest due_at) for learners with a review due before until.
+
+        Only rows in [after, until) are read, through the due_at index; with after
+        None that includes every overdue review.
+        """
+        query = sql.SQL("""
+            SELECT user_id, MIN(due_at)
+            FROM review_schedule
+            WHERE due_at < %s AND (%s::timestamp IS NULL OR due_at >= %s)
+            GROUP BY user_id;
+        """)
+        return self._execute_query(query, (until, after, after), fetch_all=True, read_only=True)
+
+    def fetch_rescheduled_reviews(self, since: Any, until: Any) -> List[Tuple[str, Any]]:
+        """
+        Returns (user_id, due_at) of reviews saved at or after since that are due before until.
+
+        Read through the updated_at index, so checking for reviews that moved earlier,
+        such as lapses due right away, stays cheap however large the schedule grows.
+        """
+        query = sql.SQL("""
+            SELECT user_id, due_at
+            FROM review_schedule
+            WHERE updated_at >= %s AND due_at < %s;
+        """)
+        return self._execute_query(query, (since, until), fetch_all=True, read_only=True)
+
+    def fetch_next_due(self, bounds: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+        """
+        Returns (user_id, earliest due_at at or after the bound) for each (user_id, bound) given.
+
+        One query through the primary key, however many learners are asked about;
+        learners with nothing due from their bound on are left out.
+        """
+        if not bounds:
+            return []
+        query = sql.SQL("""
+            SELECT rs.user_id, MIN(rs.due_at)
+            FROM unnest(%s::text[], %s::timestamp[]) AS b (user_id, after)
+            JOIN review_schedule rs ON rs.user_id = b.user_id AND rs.due_at >= b.after
+            GROUP BY rs.user_id;
+        """)
+        user_ids, afters = zip(*bounds)
+        return self._execute_query(query, (list(user_ids), list(afters)), fetch_all=True, read_only=True)
+
+    # --- Cohort Rollups ---
+    ROLLUP_TABLES = {"hourly": "session_rollups_hourly", "daily": "session_rollups_daily"}
+    ROLLUP_UNITS = {"hourly": "hour", "daily": "day"}
+
+    def refresh_session_rollups(self, full: bool = False, lookback: timedelta = DEFAULT_ROLLUP_LOOKBACK) -> Optional[Any]:
+        """
+        Rebuilds the hourly and daily cohort rollups for sessions since the last run.
+
+        Every bucket from the start of the day containing (previous watermark - lookback)
+        is recomputed, so only recent sessions are scanned, and sessions that arrive up
+        to lookback late still land in their buckets. Pass full=True to rebuild every
+        bucket from the day of the oldest session on, e.g. after back-filling older
+        sessions; buckets before that, such as those of archived partitions, are kept.
+
+        Returns:
+            The new watermark (latest session timestamp rolled up), or None if there
+            are no sessions.
+        """
+        row = self._execute_query(sql.SQL(
+            "SELECT watermark FROM rollup_watermarks WHERE rollup_name = 'learning_sessions';"
+        ), fetch_one=True)
+        oldest, new_watermark = self._execute_query(sql.SQL(
+            "SELECT MIN(timestamp), MAX(timestamp) FROM learning_sessions;"
+        ), fetch_one=True)
+        if new_watermark is None:
+            return None
+        since = oldest if full or not row else row[0] - lookback
+        since = since.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        for granularity, table in self.ROLLUP_TABLES.items():
+            # DELETE and INSERT are sent as one statement string, so they run in a single
+            # implicit transaction and dashboards never see a half-refreshed bucket.
+            query = sql.SQL("""
+                DELETE FROM {table} WHERE bucket >= %(since)s;
+                WITH sessions AS (
+                    SELECT
+                        ls.user_id,
+                        date_trunc(%(unit)s, ls.timestamp) AS bucket,
+                        ls.content_accessed,
+                        COALESCE(EXTRACT(EPOCH FROM ls.time_spent), 0) AS seconds,
+                        (ls.performance_metrics->>'score')::double precision AS score,
+                        COALESCE((ls.performance_metrics->>'completed')::boolean, ls.performance_metrics ? 'score') AS completed,
+                        COALESCE(uad.cluster_label, -1) AS cluster_label
+                    FROM
+                        learning_sessions ls
+                    LEFT JOIN
+                        user_analytics_data uad ON ls.user_id = uad.user_id
+                    WHERE
+                        ls.timestamp >= %(since)s
+                )
+                INSERT INTO {table} (dimension, bucket, dimension_value, sessions, learners, completions, score_sum, score_count, time_spent_seconds)
+                SELECT 'cluster', bucket, cluster_label::text, COUNT(*), COUNT(DISTINCT user_id),
+                       COUNT(*) FILTER (WHERE completed), COALESCE(SUM(score), 0), COUNT(score), SUM(seconds)
+                FROM sessions
+                GROUP BY bucket, cluster_label
+                UNION ALL
+                -- A session's time is split evenly across the content items it accessed.
+                SELECT 'content', bucket, c.content_id, COUNT(*), COUNT(DISTINCT user_id),
+                       COUNT(*) FILTER (WHERE completed), COALESCE(SUM(score), 0), COUNT(score),
+                       SUM(seconds / jsonb_array_length(content_accessed))
+                FROM sessions
+                CROSS JOIN LATERAL jsonb_array_elements_text(content_accessed) AS c(content_id)
+                GROUP BY bucket, c.content_id;
+            """).format(table=sql.Identifier(table))
+            self._execute_query(query, {"since": since, "unit": self.ROLLUP_UNITS[granularity]})
+
+        self._execute_query(sql.SQL("""
+            INSERT INTO rollup_watermarks (rollup_name, watermark)
+            VALUES ('learning_sessions', %s)
+            ON CONFLICT (rollup_name) DO UPDATE SET watermark = EXCLUDED.watermark;
+        """), (new_watermark,))
+        return new_watermark
+
+    def fetch_session_rollups(self, granularity: str, dimension: str, start: Any, end: Any,
+                              dimension_value: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetches pre-rolled cohort aggregates in [start, end), ordered by bucket.
+
+        Args:
+            granularity (str): 'hourly' or 'daily'.
+            dimension (str): 'cluster' or 'content'.
+            start, end (datetime): Bucket range.
+            dimension_value (str, optional): Restrict to one cluster label or content ID.
+        """
+        query = sql.SQL("""
+            SELECT bucket, dimension_value, sessions, learners, completions, score_sum, score_count, time_spent_seconds
+            FROM {table}
+            WHERE dimension = %s AND bucket >= %s AND bucket < %s AND (%s IS NULL OR dimension_value = %s)
+            ORDER BY bucket;
+        """).format(table=sql.Identifier(self.ROLLUP_TABLES[granularity]))
+        rows = self._execute_query(query, (dimension, start, end, dimension_value, dimension_value), fetch_all=True, read_only=True)
+        return [
+            {
+                "bucket": row[0],
+                "dimension_value": row[1],
+                "sessions": row[2],
+                "learners": row[3],
+                "completions": row[4],
+                "score_sum": row[5],
+                "score_count": row[6],
+                "time_spent_seconds": row[7],
+            }
+            for row in rows
+        ]
+
+    # --- Bulk Load ---
+    def copy_rows(self, table: str, columns: Tuple[str, ...], data: str):
+        """
+        Loads rows into a table with COPY, far faster than INSERT for large volumes.
+
+        Args:
+            table (str): Target table.
+            columns (tuple): Column names, in the order fields appear on each line.
+            data (str): Rows in COPY text format: tab-separated fields, one row per line,
+                \\N for NULL and backslashes escaped.
+        """
+        if not self.conn:
+            self.connect() # Attempt to reconnect
+            if not self.conn:
+                raise ConnectionError("No database connection available.")
+
+        query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table), sql.SQL(", ").join(sql.Identifier(column) for column in columns))
+        try:
+            with self.conn.cursor() as cur:
+                cur.copy_expert(query, io.StringIO(data))
+        except psycopg2.Error as e:
+            print(f"Database error during copy: {e}")
+            self.conn.rollback() # Rollback on error
+            raise # Re-raise the exception
+        finally:
+            self._record_write()
+
+    # --- Bulk Export ---
+    def _iter_server_side(self, query: sql.Composable, params: Optional[Tuple], batch_size: int) -> Iterator[List[Tuple]]:
+        """
+        Streams a query's rows in batches through a server-side cursor, on a replica when one is usable.
+
+        The cursor runs inside a read-only transaction on a connection of its own, so
+        the server sends batch_size rows per round trip instead of materializing the
+        whole result, and the shared autocommit connections stay free for other queries.
+        """
+        index = self._read_replica()
+        conn = self._connect(self.replica_dsns[index] if index is not None else None)
+        try:
+            conn.set_session(readonly=True, autocommit=False)
+            yield from self._iter_named_cursor(conn, query, params, batch_size)
+        finally:
+            # Also ends the transaction when the caller stops iterating early
+            conn.close()
+
+    def _iter_named_cursor(self, conn, query: sql.Composable, params: Optional[Tuple],
+                           batch_size: int) -> Iterator[List[Tuple]]:
+        with conn.cursor(name=f"lms_export_{id(self)}_{time.monotonic_ns()}") as cur:
+            cur.itersize = batch_size
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+
+    def fetch_session_watermark_bounds(self) -> Tuple[Optional[Any], Optional[Any]]:
+        """Returns the earliest and latest learning session timestamps."""
+        query = sql.SQL("SELECT MIN(timestamp), MAX(timestamp) FROM learning_sessions;")
+        return tuple(self._execute_query(query, fetch_one=True, read_only=True))
+
+    def iter_session_export_rows(self, since: Optional[Any] = None, until: Optional[Any] = None,
+                                 batch_size: int = 10000) -> Iterator[List[Tuple]]:
+        """
+        Streams learning sessions in (since, until], oldest first, with JSONB fields flattened.
+
+        Args:
+            since (datetime, optional): Exclusive lower bound; None exports from the start.
+            until (datetime, optional): Inclusive upper bound; None exports to the end.
+            batch_size (int): Rows per yielded batch and per server round trip.
+
+        Yields:
+            list: Row tuples in SESSION_EXPORT_COLUMNS order. content_accessed is a list
+            of strings and interactions is JSON text.
+        """
+        params = {"since": since, "until": until}
+        return self._iter_server_side(sql.SQL(_SESSION_EXPORT_QUERY), params, batch_size)
+
+    @contextmanager
+    def session_export_snapshot(self, since: Optional[Any] = None, batch_size: int = 10000):
+        """
+        Reads the latest session timestamp and the sessions up to it from one snapshot.
+
+        Both come from a single REPEATABLE READ transaction on the primary: a replica
+        may not have the newest sessions yet, and a second snapshot could see rows
+        committed after the bound was read.
+
+        Args:
+            since (datetime, optional): Exclusive lower bound, as in iter_session_export_rows.
+            batch_size (int): Rows per yielded batch and per server round trip.
+
+        Yields:
+            tuple: (until, batches), the latest session timestamp (None if there are no
+            sessions) and an iterator over the sessions in (since, until].
+        """
+        conn = self._connect()
+        try:
+            conn.set_session(isolation_level="REPEATABLE READ", readonly=True, autocommit=False)
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL("SELECT MAX(timestamp) FROM learning_sessions;"))
+                until = cur.fetchone()[0]
+            yield until, self._iter_named_cursor(
+                conn, sql.SQL(_SESSION_EXPORT_QUERY), {"since": since, "until": until}, batch_size)
+        finally:
+            conn.close()
+
+    def iter_user_analytics_rows(self, batch_size: int = 10000) -> Iterator[List[Tuple]]:
+        """Streams user_analytics_data in USER_ANALYTICS_EXPORT_COLUMNS order, JSONB as JSON text."""
+        query = sql.SQL("""
+            SELECT user_id, cluster_label, engineered_features::text, predictions::text,
+                   recommendations::text, insights::text
+            FROM user_analytics_data
+            ORDER BY user_id;
+        """)
+        return self._iter_server_side(query, None, batch_size)
@@ -0,0 +1,122 @@
+-- Schema for the LMS analytics database. Safe to run repeatedly.
+-- Every TIMESTAMP column holds UTC; defaults use timezone('utc', now()).
+
+CREATE TABLE IF NOT EXISTS user_profiles (
+    user_id TEXT PRIMARY KEY,
+    demographics JSONB DEFAULT '{}'::jsonb,
+    learning_preferences JSONB DEFAULT '{}'::jsonb,
+    behavioral_patterns JSONB DEFAULT '{}'::jsonb,
+    engagement_metrics JSONB DEFAULT '{}'::jsonb
+);
+
+-- Range-partitioned by month on timestamp. Rows land in the default partition until
+-- `python migration_scripts.py maintain` (run daily) creates their month's partition.
+-- PostgreSQL requires the partition key in the primary key, so (session_id, timestamp)
+-- is unique but session_id alone is not enforced unique across partitions.
+-- Databases created before partitioning are converted with `migration_scripts.py partition`.
+CREATE TABLE IF NOT EXISTS learning_sessions (
+    session_id TEXT NOT NULL,
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    content_accessed JSONB DEFAULT '[]'::jsonb,
+    time_spent INTERVAL,
+    interactions JSONB DEFAULT '{}'::jsonb,
+    performance_metrics JSONB DEFAULT '{}'::jsonb,
+    timestamp TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+    PRIMARY KEY (session_id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+DO $$
+DECLARE
+    lower_bound TIMESTAMP;
+    partition_name TEXT;
+BEGIN
+    -- Skipped on an unpartitioned table from an older install
+    IF (SELECT relkind FROM pg_class WHERE oid = 'learning_sessions'::regclass) = 'p' THEN
+        CREATE TABLE IF NOT EXISTS learning_sessions_default PARTITION OF learning_sessions DEFAULT;
+        -- This month's and next month's partitions, so a fresh install doesn't write
+        -- everything to the default partition; `migration_scripts.py maintain` adds
+        -- later months. Named like migration_scripts.partition_name().
+        FOR i IN 0..1 LOOP
+            lower_bound := date_trunc('month', timezone('utc', now())) + make_interval(months => i);
+            partition_name := 'learning_sessions_' || to_char(lower_bound, '"y"YYYY"m"MM');
+            -- Months with rows already in the default partition are left to `maintain`,
+            -- which moves them
+            IF to_regclass(partition_name) IS NULL AND NOT EXISTS (
+                SELECT 1 FROM learning_sessions_default
+                WHERE timestamp >= lower_bound AND timestamp < lower_bound + interval '1 month'
+            ) THEN
+                EXECUTE format('CREATE TABLE %I PARTITION OF learning_sessions FOR VALUES FROM (%L) TO (%L)',
+                               partition_name, lower_bound, lower_bound + interval '1 month');
+            END IF;
+        END LOOP;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_learning_sessions_user_timestamp ON learning_sessions (user_id, timestamp);
+
+CREATE TABLE IF NOT EXISTS user_analytics_data (
+    user_id TEXT PRIMARY KEY REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    engineered_features JSONB,
+    cluster_label INTEGER,
+    predictions JSONB,
+    recommendations JSONB,
+    insights JSONB
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_analytics_cluster ON user_analytics_data (cluster_label);
+
+-- Per-topic Bayesian Knowledge Tracing estimates, one row per (user, topic).
+CREATE TABLE IF NOT EXISTS topic_mastery (
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    topic TEXT NOT NULL,
+    p_mastery DOUBLE PRECISION NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+    PRIMARY KEY (user_id, topic)
+);
+
+-- SM-2 spaced-repetition state, one row per (user, quiz question). due_at and updated_at are UTC.
+CREATE TABLE IF NOT EXISTS review_schedule (
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    question_id TEXT NOT NULL,
+    interval_days DOUBLE PRECISION NOT NULL,
+    ease DOUBLE PRECISION NOT NULL,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    lapses INTEGER NOT NULL DEFAULT 0,
+    due_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+    PRIMARY KEY (user_id, question_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_review_schedule_due ON review_schedule (due_at);
+-- Lets the due-learner sweep find reviews rescheduled since its last check
+CREATE INDEX IF NOT EXISTS idx_review_schedule_updated ON review_schedule (updated_at);
+
+-- Pre-rolled cohort aggregates for the educator dashboard. Each row summarises the
+-- sessions in one time bucket for one cluster (dimension = 'cluster') or one
+-- content item (dimension = 'content'). Unclustered users roll up under cluster -1.
+CREATE TABLE IF NOT EXISTS session_rollups_hourly (
+    dimension TEXT NOT NULL,
+    bucket TIMESTAMP NOT NULL,
+    dimension_value TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    learners INTEGER NOT NULL,
+    completions INTEGER NOT NULL,
+    score_sum DOUBLE PRECISION NOT NULL,
+    score_count INTEGER NOT NULL,
+    time_spent_seconds DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (dimension, bucket, dimension_value)
+);
+
+CREATE TABLE IF NOT EXISTS session_rollups_daily (LIKE session_rollups_hourly INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+    rollup_name TEXT PRIMARY KEY,
+    watermark TIMESTAMP NOT NULL
+);
+
+-- Installs created before the defaults above were UTC
+ALTER TABLE learning_sessions ALTER COLUMN timestamp SET DEFAULT timezone('utc', now());
+ALTER TABLE topic_mastery ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+ALTER TABLE review_schedule ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
@@ -0,0 +1,102 @@
+-- SQLite schema for single-node deployments, mirroring database_schema.sql. Safe to run repeatedly.
+-- JSON columns hold JSON text (queried with JSON1), time_spent is seconds and
+-- timestamps are UTC in one fixed ISO-8601 form, 'YYYY-MM-DD HH:MM:SS.ffffff', so
+-- comparing them as strings orders them by time.
+
+CREATE TABLE IF NOT EXISTS user_profiles (
+    user_id TEXT PRIMARY KEY,
+    demographics TEXT DEFAULT '{}',
+    learning_preferences TEXT DEFAULT '{}',
+    behavioral_patterns TEXT DEFAULT '{}',
+    engagement_metrics TEXT DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS learning_sessions (
+    session_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    content_accessed TEXT DEFAULT '[]',
+    time_spent REAL,
+    interactions TEXT DEFAULT '{}',
+    performance_metrics TEXT DEFAULT '{}',
+    timestamp TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')
+);
+
+CREATE INDEX IF NOT EXISTS idx_learning_sessions_user_timestamp ON learning_sessions (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_learning_sessions_timestamp ON learning_sessions (timestamp);
+
+CREATE TABLE IF NOT EXISTS user_analytics_data (
+    user_id TEXT PRIMARY KEY REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    engineered_features TEXT,
+    cluster_label INTEGER,
+    predictions TEXT,
+    recommendations TEXT,
+    insights TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_analytics_cluster ON user_analytics_data (cluster_label);
+
+CREATE TABLE IF NOT EXISTS topic_mastery (
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    topic TEXT NOT NULL,
+    p_mastery REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'),
+    PRIMARY KEY (user_id, topic)
+);
+
+CREATE TABLE IF NOT EXISTS review_schedule (
+    user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+    question_id TEXT NOT NULL,
+    interval_days REAL NOT NULL,
+    ease REAL NOT NULL,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    lapses INTEGER NOT NULL DEFAULT 0,
+    due_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'),
+    PRIMARY KEY (user_id, question_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_review_schedule_due ON review_schedule (due_at);
+CREATE INDEX IF NOT EXISTS idx_review_schedule_updated ON review_schedule (updated_at);
+
+CREATE TABLE IF NOT EXISTS session_rollups_hourly (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    dimension_value TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    learners INTEGER NOT NULL,
+    completions INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    score_count INTEGER NOT NULL,
+    time_spent_seconds REAL NOT NULL,
+    PRIMARY KEY (dimension, bucket, dimension_value)
+);
+
+CREATE TABLE IF NOT EXISTS session_rollups_daily (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    dimension_value TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    learners INTEGER NOT NULL,
+    completions INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    score_count INTEGER NOT NULL,
+    time_spent_seconds REAL NOT NULL,
+    PRIMARY KEY (dimension, bucket, dimension_value)
+);
+
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+    rollup_name TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL
+);
+
+-- Rows written before timestamps had a fixed form may lack the fraction, and sorted
+-- wrongly against those that have it: '... 10:00:00' < '... 10:00:00.000000'
+UPDATE learning_sessions SET timestamp = replace(timestamp, 'T', ' ') || '.000000' WHERE length(timestamp) = 19;
+UPDATE topic_mastery SET updated_at = replace(updated_at, 'T', ' ') || '.000000' WHERE length(updated_at) = 19;
+UPDATE review_schedule SET due_at = replace(due_at, 'T', ' ') || '.000000' WHERE length(due_at) = 19;
+UPDATE review_schedule SET updated_at = replace(updated_at, 'T', ' ') || '.000000' WHERE length(updated_at) = 19;
+UPDATE session_rollups_hourly SET bucket = replace(bucket, 'T', ' ') || '.000000' WHERE length(bucket) = 19;
+UPDATE session_rollups_daily SET bucket = replace(bucket, 'T', ' ') || '.000000' WHERE length(bucket) = 19;
+UPDATE rollup_watermarks SET watermark = replace(watermark, 'T', ' ') || '.000000' WHERE length(watermark) = 19;
@@ -0,0 +1,46 @@
+def future_value(initial_investment, monthly_contribution, annual_return, months):
+    """
+    Returns the value of an investment with monthly compounding and contributions.
+
+    Args:
+        initial_investment (float): Amount invested at the start.
+        monthly_contribution (float): Amount added at the end of every month.
+        annual_return (float): Expected annual return in percent, e.g. 7.0.
+        months (int): Number of months invested.
+
+    Returns:
+        float: The investment value after the given number of months.
+    """
+    monthly_return = annual_return / 100 / 12
+    if monthly_return > 0:
+        value = initial_investment * (1 + monthly_return) ** months
+        if monthly_contribution > 0:
+            value += monthly_contribution * (((1 + monthly_return) ** months - 1) / monthly_return)
+        return value
+    return initial_investment + (monthly_contribution * months)
+
+def investment_growth(initial_investment, monthly_contribution, annual_return, years):
+    """
+    Computes the figures shown by the Investment Growth Calculator.
+
+    Args:
+        initial_investment (float): Amount invested at the start.
+        monthly_contribution (float): Amount added every month.
+        annual_return (float): Expected annual return in percent.
+        years (int): Investment period in years.
+
+    Returns:
+        dict: total_invested, future_value, total_growth, and the year-end
+        values used for the growth chart (years_range, values).
+    """
+    months = years * 12
+    total_invested = initial_investment + (monthly_contribution * months)
+    value = future_value(initial_investment, monthly_contribution, annual_return, months)
+    years_range = list(range(1, years + 1))
+    return {
+        "total_invested": total_invested,
+        "future_value": value,
+        "total_growth": value - total_invested,
+        "years_range": years_range,
+        "values": [future_value(initial_investment, monthly_contribution, annual_return, year * 12) for year in years_range],
+    }
@@ -1,39 +1,126 @@
+import json
+import uuid
+from functools import wraps
+
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 from datetime import datetime
-import pandas as pd
 
 from contentloader import load_content_from_json, get_categories, get_topics, get_topic_details
+from ai_feedback import generate_quiz_feedback, MasteryTracker
+from database_manager import create_database_manager, db_config_from_env, track_writes
+from quiz_engine import ReviewScheduler
+from financial_calculators import investment_growth
+import visualization_generator as charts
+from startup import run_once_in_background
+import profiling
+import session_store
 
-# Dropdown to select content file
-selected_file = st.sidebar.selectbox(
-    "📂 Choose Content Source:",
-    ["civic.json", "financial.json"]
+# Page configuration
+st.set_page_config(
+    page_title="Civic & Financial Education Platform",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
 )
 
-# Load content from the selected file
-content = load_content_from_json(selected_file)
+# Learner state that is saved to LMS_SESSION_STORE, when configured, so any replica
+# can pick up a session. Widget values and one-shot flags are left out.
+PERSISTED_SESSION_KEYS = ["user_progress", "topic_mastery", "review_schedule", "review_queue", "current_page", "quiz_topic"] + [
+    key
+    for quiz in ("civic", "financial")
+    for key in (f"{quiz}_round", f"current_{quiz}_question", f"{quiz}_score", f"{quiz}_answers", f"{quiz}_last_result", f"{quiz}_recorded")
+]
 
+@st.cache_resource(show_spinner=False)
+def get_session_store():
+    return session_store.store_from_env(PERSISTED_SESSION_KEYS)
 
-category = st.selectbox("Select a Category:", get_categories(content))
-topic = st.selectbox("Choose a Topic:", get_topics(content, category))
-topic_info = get_topic_details(content, category, topic)
+def restore_session():
+    """Loads this browser's saved state once per Streamlit session; the id travels in ?sid=."""
+    store = get_session_store()
+    if store is None or 'session_id' in st.session_state:
+        return
+    sid = st.query_params.get("sid")
+    if not sid:
+        sid = uuid.uuid4().hex
+        st.query_params["sid"] = sid
+    st.session_state.session_id = sid
+    for key, value in store.load(sid).items():
+        st.session_state[key] = value
 
-st.markdown(f"### {topic_info['title']}")
-for point in topic_info['content']:
-    st.markdown(f"- {point}")
-st.info(f"**Summary:** {topic_info['summary']}")
+def persist_session():
+    store = get_session_store()
+    if store is not None and 'session_id' in st.session_state:
+        store.save(st.session_state.session_id, st.session_state)
 
+def persists_state(func):
+    """Saves learner state after func returns, so fragment-only reruns are saved too."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            persist_session()
+    return wrapper
 
+@st.cache_resource(show_spinner=False)
+def get_learner_database():
+    """Shared manager for saving learner progress, or None when DATABASE_URL is not set."""
+    db_config = db_config_from_env()
+    if not db_config["dsn"]:
+        return None
+    return create_database_manager(db_config, lazy_connect=True)
 
-# Page configuration
-st.set_page_config(
-    page_title="Civic & Financial Education Platform",
-    page_icon="🎓",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+def start_learner_session():
+    """Identifies the learner from ?user= once per session and loads their saved progress."""
+    if 'user_id' in st.session_state:
+        return
+    # None for guests, whose progress only lives in the session
+    user_id = st.query_params.get("user")
+    st.session_state.user_id = user_id
+    db = get_learner_database()
+    if not user_id or db is None:
+        return
+    try:
+        # The manager is shared, so read-your-writes is tracked in this session's state
+        with track_writes(st.session_state):
+            # Progress rows reference the profile, so make sure it exists before any save
+            db.ensure_user_profile(user_id)
+            st.session_state.learner_registered = True
+            # State restored from the session store is newer than the database copy
+            if 'topic_mastery' not in st.session_state:
+                tracker = MasteryTracker.from_db(db, user_id)
+                st.session_state.mastery_tracker = tracker
+                st.session_state.topic_mastery = tracker.topics
+            if 'review_schedule' not in st.session_state:
+                scheduler = ReviewScheduler.from_db(db, user_id)
+                st.session_state.review_scheduler = scheduler
+                st.session_state.review_schedule = scheduler.items
+                st.session_state.review_queue = scheduler.heap
+    except Exception as e:
+        print(f"Could not load learner progress: {e}")
+
+def save_learner_progress():
+    """Writes what changed during a quiz round in one batch per table."""
+    db = get_learner_database()
+    # Guests have no profile row to attach progress to
+    if db is None or not st.session_state.get('user_id'):
+        return
+    try:
+        with track_writes(st.session_state):
+            if not st.session_state.get('learner_registered'):
+                # The database was unreachable when the session started
+                db.ensure_user_profile(st.session_state.user_id)
+                st.session_state.learner_registered = True
+            get_mastery_tracker().save(db)
+            get_review_scheduler().save(db)
+    except Exception as e:
+        # Changes stay marked dirty and are retried after the next round
+        print(f"Could not save learner progress: {e}")
+
+restore_session()
+start_learner_session()
 
 # Initialize session state for user progress
 if 'user_progress' not in st.session_state:
@@ -45,9 +132,105 @@ if 'user_progress' not in st.session_state:
         'badges_earned': []
     }
 
-def main():
-    # Custom CSS for enhanced styling
-    st.markdown("""
+# Content file and category backing each quiz, used to look up remedial lessons
+QUIZ_CONTENT_SOURCES = {
+    "civic": ("civic.json", "Civic Education"),
+    "financial": ("financial.json", "Financial Literacy"),
+}
+
+@st.cache_resource(show_spinner=False)
+def load_cached_content(file_path):
+    """Loads a content file once per process; the result is shared read-only, not copied per call."""
+    with profiling.span(f"content:{file_path}"):
+        return load_content_from_json(file_path)
+
+def prewarm():
+    """Loads content files and plotly ahead of the first page that needs them."""
+    for file_name, _ in QUIZ_CONTENT_SOURCES.values():
+        load_cached_content(file_name)
+    charts.government_structure_sankey()
+
+def get_mastery_tracker():
+    """Returns this learner's topic mastery tracker, kept for the whole session."""
+    if 'topic_mastery' not in st.session_state:
+        st.session_state.topic_mastery = {}
+    tracker = st.session_state.get('mastery_tracker')
+    if tracker is None or tracker.topics is not st.session_state.topic_mastery:
+        tracker = MasteryTracker(st.session_state.get('user_id') or 'guest', st.session_state.topic_mastery)
+        st.session_state.mastery_tracker = tracker
+    return tracker
+
+def get_review_scheduler():
+    """Returns this learner's spaced-repetition schedule, kept for the whole session."""
+    if 'review_schedule' not in st.session_state:
+        st.session_state.review_schedule = {}
+    scheduler = st.session_state.get('review_scheduler')
+    if scheduler is None or scheduler.items is not st.session_state.review_schedule:
+        scheduler = ReviewScheduler(st.session_state.get('user_id') or 'guest', st.session_state.review_schedule,
+                                    st.session_state.get('review_queue'))
+        st.session_state.review_scheduler = scheduler
+        st.session_state.review_queue = scheduler.heap
+    return scheduler
+
+def show_recommended_review(quiz):
+    """Shows lessons for the learner's weakest topics in the quiz's subject."""
+    file_name, category = QUIZ_CONTENT_SOURCES[quiz]
+    quiz_content = load_cached_content(file_name)
+    topics = get_topics(quiz_content, category)
+    weak_topics = [(t, p) for t, p in get_mastery_tracker().weakest_topics(limit=len(topics)) if t in topics][:3]
+    if not weak_topics:
+        return
+    with st.expander("📖 Recommended Review"):
+        for topic_name, p_mastery in weak_topics:
+            topic_details = get_topic_details(quiz_content, category, topic_name)
+            st.markdown(f"**{topic_details['title']}** — estimated mastery {p_mastery:.0%}")
+            st.caption(topic_details['summary'])
+
+def show_profiling_panel():
+    """Admin-only timing panel, shown with LMS_PROFILING=1 and ?profiling=1 in the URL."""
+    with st.sidebar.expander("⏱️ Profiling"):
+        runs = profiling.recent_runs()
+        if runs:
+            # The current rerun is still in progress, so the newest record is the previous one
+            last = runs[0]
+            st.caption(f"Previous rerun: {last['root']} in {last['total_ms']:.1f} ms")
+            st.dataframe([{
+                "span": "· " * entry["depth"] + entry["name"],
+                "start (ms)": round(entry["start_ms"], 1),
+                "duration (ms)": round(entry["duration_ms"], 1),
+            } for entry in last["spans"]], hide_index=True)
+            st.markdown(f"**Last {len(runs)} reruns, all sessions**")
+            st.dataframe(profiling.span_summary(runs), hide_index=True)
+
+        profiler = st.radio("Profiler", ["cprofile", "pyinstrument"], horizontal=True, key="profiling_profiler")
+        # Requested from a callback so the rerun the click triggers is the one profiled
+        st.button("Profile this click", key="profiling_request",
+                  on_click=lambda: profiling.request_profile(1, st.session_state.profiling_profiler))
+        sampled = next((run for run in runs if run["profile"]), None)
+        if sampled:
+            st.caption(f"Profile of {sampled['root']} at {sampled['started']}")
+            st.code(sampled["profile"], language="text")
+        st.download_button("Export timings", data="\n".join(json.dumps(run) for run in reversed(runs)),
+                           file_name="profiling.jsonl", mime="application/json")
+        st.caption(f"Every rerun is also appended to {profiling.LOG_PATH}.")
+
+# Pages and the content browser are fragments: interacting with a widget inside one
+# reruns only that function, not the sidebar, CSS and the rest of the script.
+@st.fragment
+@profiling.profiled()
+def show_content_browser(selected_file):
+    content = load_cached_content(selected_file)
+
+    category = st.selectbox("Select a Category:", get_categories(content))
+    topic = st.selectbox("Choose a Topic:", get_topics(content, category))
+    topic_info = get_topic_details(content, category, topic)
+
+    st.markdown(f"### {topic_info['title']}")
+    for point in topic_info['content']:
+        st.markdown(f"- {point}")
+    st.info(f"**Summary:** {topic_info['summary']}")
+
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -79,7 +262,20 @@ def main():
         margin: 0.5rem 0;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+@profiling.profiled()
+@persists_state
+def main():
+    # Dropdown to select content file
+    selected_file = st.sidebar.selectbox(
+        "📂 Choose Content Source:",
+        ["civic.json", "financial.json"]
+    )
+    show_content_browser(selected_file)
+
+    # Custom CSS for enhanced styling
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     # Sidebar navigation
     st.sidebar.title("🎓 Navigation")
@@ -112,6 +308,15 @@ def main():
     elif page == "📝 Quizzes":
         show_quizzes()
 
+    # Warm caches once per process, after the first page has been rendered
+    run_once_in_background("lms_app", prewarm, add_script_run_ctx)
+
+    if profiling.ENABLED and st.query_params.get("profiling") == "1":
+        show_profiling_panel()
+
+@st.fragment
+@profiling.profiled()
+@persists_state
 def show_home_page():
     # Hero section
     st.markdown('<h1 class="main-header">🎓 Civic & Financial Education Platform</h1>', unsafe_allow_html=True)
@@ -207,21 +412,15 @@ def show_home_page():
     st.markdown('<h2 class="section-header">🛤️ Your Learning Journey</h2>', unsafe_allow_html=True)
     
     # Create progress visualization
-    progress_data = pd.DataFrame({
-        'Category': ['Civic Education', 'Financial Literacy', 'Quizzes'],
-        'Completed': [
+    fig = charts.learning_progress_bar(
+        ['Civic Education', 'Financial Literacy', 'Quizzes'],
+        [
             st.session_state.user_progress['civic_lessons_completed'],
             st.session_state.user_progress['financial_lessons_completed'],
             st.session_state.user_progress['quizzes_completed']
         ],
-        'Total': [25, 30, 100]
-    })
-    
-    fig = px.bar(progress_data, x='Category', y=['Completed', 'Total'], 
-                 title="Your Learning Progress",
-                 barmode='group',
-                 color_discrete_sequence=['#FF6B6B', '#E0E0E0'])
-    fig.update_layout(height=400)
+        [25, 30, 100]
+    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Quick tips section
@@ -247,6 +446,9 @@ def show_home_page():
         - Challenge yourself with advanced topics
         """)
 
+@st.fragment
+@profiling.profiled()
+@persists_state
 def show_civic_education():
     st.markdown('<h1 class="main-header">🏛️ Civic Education</h1>', unsafe_allow_html=True)
     
@@ -308,23 +510,7 @@ def show_civic_education():
         
         with col2:
             # Visualization of government structure
-            fig = go.Figure(data=[go.Sankey(
-                node = dict(
-                    pad = 15,
-                    thickness = 20,
-                    line = dict(color = "black", width = 0.5),
-                    label = ["Government", "Executive", "Legislative", "Judicial", "President", "Congress", "Courts"],
-                    color = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7", "#DDA0DD", "#98D8C8"]
-                ),
-                link = dict(
-                    source = [0, 0, 0, 1, 2, 3],
-                    target = [1, 2, 3, 4, 5, 6],
-                    value = [1, 1, 1, 1, 1, 1]
-                )
-            )])
-            
-            fig.update_layout(title_text="Government Structure", font_size=10, height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(charts.government_structure_sankey(), use_container_width=True)
 
     elif selected_topic == "Voting Process":
         st.markdown('<h2 class="section-header">🗳️ The Voting Process</h2>', unsafe_allow_html=True)
@@ -368,6 +554,9 @@ def show_civic_education():
                 st.session_state.user_progress['civic_lessons_completed'] += 1
                 st.info("💡 Remember: In real elections, your vote is private and secure!")
 
+@st.fragment
+@profiling.profiled()
+@persists_state
 def show_financial_literacy():
     st.markdown('<h1 class="main-header">💰 Financial Literacy</h1>', unsafe_allow_html=True)
     
@@ -420,14 +609,10 @@ def show_financial_literacy():
             st.metric("Remaining", f"${remaining:,.2f}", delta=remaining)
             
             # Budget breakdown pie chart
-            expenses_data = pd.DataFrame({
-                'Category': ['Rent/Mortgage', 'Food', 'Utilities', 'Entertainment', 'Other', 'Savings'],
-                'Amount': [rent, food, utilities, entertainment, other, max(0, remaining)]
-            })
-            
-            fig = px.pie(expenses_data, values='Amount', names='Category', 
-                        title="Budget Breakdown",
-                        color_discrete_sequence=px.colors.qualitative.Set3)
+            fig = charts.budget_pie(
+                ['Rent/Mortgage', 'Food', 'Utilities', 'Entertainment', 'Other', 'Savings'],
+                [rent, food, utilities, entertainment, other, max(0, remaining)]
+            )
             st.plotly_chart(fig, use_container_width=True)
             
             if remaining > 0:
@@ -461,49 +646,46 @@ def show_financial_literacy():
         
         with col2:
             # Calculate compound growth
-            months = years * 12
-            monthly_return = annual_return / 100 / 12
-            
-            # Future value calculation
-            if monthly_return > 0:
-                future_value = initial_investment * (1 + monthly_return) ** months
-                if monthly_contribution > 0:
-                    future_value += monthly_contribution * (((1 + monthly_return) ** months - 1) / monthly_return)
-            else:
-                future_value = initial_investment + (monthly_contribution * months)
-            
-            total_invested = initial_investment + (monthly_contribution * months)
-            total_growth = future_value - total_invested
+            growth = investment_growth(initial_investment, monthly_contribution, annual_return, years)
+            total_invested = growth["total_invested"]
+            future_value = growth["future_value"]
+            total_growth = growth["total_growth"]
             
             st.metric("Total Invested", f"${total_invested:,.2f}")
             st.metric("Future Value", f"${future_value:,.2f}")
             st.metric("Total Growth", f"${total_growth:,.2f}", delta=f"{(total_growth/total_invested)*100:.1f}%")
             
             # Growth visualization
-            years_range = list(range(1, years + 1))
-            values = []
-            
-            for year in years_range:
-                months_elapsed = year * 12
-                if monthly_return > 0:
-                    value = initial_investment * (1 + monthly_return) ** months_elapsed
-                    if monthly_contribution > 0:
-                        value += monthly_contribution * (((1 + monthly_return) ** months_elapsed - 1) / monthly_return)
-                else:
-                    value = initial_investment + (monthly_contribution * months_elapsed)
-                values.append(value)
-            
-            growth_df = pd.DataFrame({
-                'Year': years_range,
-                'Investment Value': values
-            })
+            years_range = growth["years_range"]
+            values = growth["values"]
             
-            fig = px.line(growth_df, x='Year', y='Investment Value', 
-                         title="Investment Growth Over Time",
-                         line_shape='spline')
-            fig.update_traces(line_color='#FF6B6B', line_width=3)
+            fig = charts.investment_growth_line(years_range, values)
             st.plotly_chart(fig, use_container_width=True)
 
+# Quiz questions live in quiz_bank.json so the content API can serve them too
+QUIZ_BANK = load_cached_content("quiz_bank.json")
+CIVIC_QUESTIONS = QUIZ_BANK["civic"]
+FINANCIAL_QUESTIONS = QUIZ_BANK["financial"]
+
+QUESTIONS_BY_ID = {question["id"]: question for questions in QUIZ_BANK.values() for question in questions}
+
+QUIZZES = {
+    "civic": {
+        "questions": CIVIC_QUESTIONS,
+        "completed_header": "🎉 Quiz Completed!",
+        "champion_badge": "Civic Champion",
+        "show_result_chart": True,
+    },
+    "financial": {
+        "questions": FINANCIAL_QUESTIONS,
+        "completed_header": "🎉 Financial Quiz Completed!",
+        "champion_badge": "Financial Expert",
+        "show_result_chart": False,
+    },
+}
+
+@st.fragment
+@profiling.profiled()
 def show_quizzes():
     st.markdown('<h1 class="main-header">📝 Interactive Quizzes</h1>', unsafe_allow_html=True)
     
@@ -513,217 +695,142 @@ def show_quizzes():
     
     if selected_category == "Civic Knowledge":
         st.markdown('<h2 class="section-header">🏛️ Civic Knowledge Quiz</h2>', unsafe_allow_html=True)
-        
-        # Sample civic quiz questions
-        civic_questions = [
-            {
-                "question": "How many branches of government are there in the United States?",
-                "options": ["Two", "Three", "Four", "Five"],
-                "correct": 1,
-                "explanation": "The U.S. government has three branches: Executive, Legislative, and Judicial."
-            },
-            {
-                "question": "What is the minimum age to vote in federal elections?",
-                "options": ["16", "18", "21", "25"],
-                "correct": 1,
-                "explanation": "The 26th Amendment established 18 as the minimum voting age."
-            },
-            {
-                "question": "Which document begins with 'We the People'?",
-                "options": ["Declaration of Independence", "Bill of Rights", "Constitution", "Federalist Papers"],
-                "correct": 2,
-                "explanation": "The U.S. Constitution begins with the famous preamble 'We the People...'"
-            }
-        ]
-        
-        # Quiz interface
-        if 'current_civic_question' not in st.session_state:
-            st.session_state.current_civic_question = 0
-            st.session_state.civic_score = 0
-            st.session_state.civic_answers = []
-        
-        current_q = st.session_state.current_civic_question
-        
-        if current_q < len(civic_questions):
-            question_data = civic_questions[current_q]
-            
-            st.markdown(f"### Question {current_q + 1} of {len(civic_questions)}")
-            st.write(question_data["question"])
-            
-            answer = st.radio("Choose your answer:", question_data["options"], key=f"civic_q_{current_q}")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.button("Submit Answer", key=f"submit_civic_{current_q}"):
-                    selected_index = question_data["options"].index(answer)
-                    is_correct = selected_index == question_data["correct"]
-                    
-                    st.session_state.civic_answers.append({
-                        "question": question_data["question"],
-                        "selected": answer,
-                        "correct": is_correct,
-                        "explanation": question_data["explanation"]
-                    })
-                    
-                    if is_correct:
-                        st.success("✅ Correct!")
-                        st.session_state.civic_score += 1
-                    else:
-                        st.error(f"❌ Incorrect. The correct answer is: {question_data['options'][question_data['correct']]}")
-                    
-                    st.info(f"💡 {question_data['explanation']}")
-                    st.session_state.current_civic_question += 1
-                    st.rerun()
-            
-            with col2:
-                progress = (current_q + 1) / len(civic_questions)
-                st.progress(progress)
-                st.write(f"Progress: {current_q + 1}/{len(civic_questions)}")
-        
-        else:
-            # Quiz completed
-            st.markdown('<h2 class="section-header">🎉 Quiz Completed!</h2>', unsafe_allow_html=True)
-            
-            score_percentage = (st.session_state.civic_score / len(civic_questions)) * 100
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Score", f"{st.session_state.civic_score}/{len(civic_questions)}")
-            with col2:
-                st.metric("Percentage", f"{score_percentage:.1f}%")
-            with col3:
-                if score_percentage >= 80:
-                    badge = "🏆 Civic Champion"
-                elif score_percentage >= 60:
-                    badge = "🥉 Civic Scholar"
-                else:
-                    badge = "📚 Keep Learning"
-                st.metric("Badge Earned", badge)
-            
-            # Performance visualization
-            correct_answers = st.session_state.civic_score
-            incorrect_answers = len(civic_questions) - correct_answers
-            
-            fig = px.pie(
-                values=[correct_answers, incorrect_answers],
-                names=['Correct', 'Incorrect'],
-                title="Quiz Performance",
-                color_discrete_sequence=['#4ECDC4', '#FF6B6B']
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Update user progress
-            st.session_state.user_progress['quizzes_completed'] += 1
-            st.session_state.user_progress['total_score'] += st.session_state.civic_score
-            
-            if score_percentage >= 80 and "Civic Champion" not in st.session_state.user_progress['badges_earned']:
-                st.session_state.user_progress['badges_earned'].append("Civic Champion")
-                st.balloons()
-            
-            if st.button("Take Another Quiz"):
-                # Reset quiz state
-                st.session_state.current_civic_question = 0
-                st.session_state.civic_score = 0
-                st.session_state.civic_answers = []
-                st.rerun()
+        run_quiz("civic")
 
     elif selected_category == "Financial Literacy":
         st.markdown('<h2 class="section-header">💰 Financial Literacy Quiz</h2>', unsafe_allow_html=True)
+        run_quiz("financial")
+
+def submit_quiz_answer(quiz):
+    """Button callback: scores the selected answer before the quiz fragment reruns."""
+    questions = quiz_round(quiz)
+    current_q = st.session_state[f"current_{quiz}_question"]
+    question_data = questions[current_q]
+    answer = st.session_state[f"{quiz}_q_{current_q}"]
+    selected_index = question_data["options"].index(answer)
+    is_correct = selected_index == question_data["correct"]
+    
+    st.session_state[f"{quiz}_answers"].append({
+        "question": question_data["question"],
+        "selected": answer,
+        "correct": is_correct,
+        "explanation": question_data["explanation"],
+        "topic": question_data["topic"]
+    })
+    get_mastery_tracker().record_answer(question_data["topic"], is_correct)
+    get_review_scheduler().record_review(question_data["id"], is_correct)
+    
+    if is_correct:
+        st.session_state[f"{quiz}_score"] += 1
+    st.session_state[f"{quiz}_last_result"] = (is_correct, question_data["options"][question_data["correct"]], question_data["explanation"])
+    st.session_state[f"current_{quiz}_question"] += 1
+
+def quiz_round(quiz):
+    """Questions of the quiz's current round."""
+    return [QUESTIONS_BY_ID[question_id] for question_id in st.session_state[f"{quiz}_round"]]
+
+def reset_quiz(quiz, practice_all=False):
+    """Starts a round with the questions due for review and any not yet seen, or all of them."""
+    question_ids = [question["id"] for question in QUIZZES[quiz]["questions"]]
+    st.session_state[f"{quiz}_round"] = question_ids if practice_all else get_review_scheduler().review_round(question_ids)
+    st.session_state[f"current_{quiz}_question"] = 0
+    st.session_state[f"{quiz}_score"] = 0
+    st.session_state[f"{quiz}_answers"] = []
+    st.session_state[f"{quiz}_last_result"] = None
+    st.session_state[f"{quiz}_recorded"] = False
+
+@st.fragment
+@profiling.profiled()
+@persists_state
+def run_quiz(quiz):
+    """Quiz widget; answering a question reruns only this fragment."""
+    config = QUIZZES[quiz]
+    
+    # Quiz interface
+    if f"current_{quiz}_question" not in st.session_state or f"{quiz}_round" not in st.session_state:
+        reset_quiz(quiz)
+    questions = quiz_round(quiz)
+    
+    if not questions:
+        # Every question is scheduled for later; offer practice instead of an empty quiz
+        schedule = st.session_state.review_schedule
+        next_review = min(schedule[q["id"]]["due"] for q in config["questions"])
+        st.success("✅ You're all caught up! No questions are due for review yet.")
+        st.caption(f"Next review: {datetime.fromtimestamp(next_review):%b %d, %H:%M}")
+        st.button("Practice All Questions", key=f"practice_{quiz}", on_click=reset_quiz, args=(quiz, True))
+        return
+    
+    current_q = st.session_state[f"current_{quiz}_question"]
+    last_result = st.session_state.get(f"{quiz}_last_result")
+    
+    if current_q < len(questions):
+        if last_result:
+            is_correct, correct_option, explanation = last_result
+            if is_correct:
+                st.success("✅ Correct!")
+            else:
+                st.error(f"❌ Incorrect. The correct answer is: {correct_option}")
+            st.info(f"💡 {explanation}")
         
-        # Sample financial quiz questions
-        financial_questions = [
-            {
-                "question": "What is compound interest?",
-                "options": ["Interest on the principal only", "Interest on principal and accumulated interest", "A type of loan", "A banking fee"],
-                "correct": 1,
-                "explanation": "Compound interest is earned on both the initial principal and previously earned interest."
-            },
-            {
-                "question": "What percentage of income should ideally go to savings according to the 50/30/20 rule?",
-                "options": ["10%", "15%", "20%", "25%"],
-                "correct": 2,
-                "explanation": "The 50/30/20 rule suggests 20% for savings and debt repayment."
-            },
-            {
-                "question": "Which investment typically has the highest risk and potential return?",
-                "options": ["Savings account", "Government bonds", "Corporate stocks", "Certificate of deposit"],
-                "correct": 2,
-                "explanation": "Stocks generally offer higher potential returns but come with higher risk."
-            }
-        ]
-        
-        # Similar quiz interface for financial questions
-        if 'current_financial_question' not in st.session_state:
-            st.session_state.current_financial_question = 0
-            st.session_state.financial_score = 0
-            st.session_state.financial_answers = []
-        
-        current_q = st.session_state.current_financial_question
-        
-        if current_q < len(financial_questions):
-            question_data = financial_questions[current_q]
-            
-            st.markdown(f"### Question {current_q + 1} of {len(financial_questions)}")
-            st.write(question_data["question"])
-            
-            answer = st.radio("Choose your answer:", question_data["options"], key=f"financial_q_{current_q}")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.button("Submit Answer", key=f"submit_financial_{current_q}"):
-                    selected_index = question_data["options"].index(answer)
-                    is_correct = selected_index == question_data["correct"]
-                    
-                    if is_correct:
-                        st.success("✅ Correct!")
-                        st.session_state.financial_score += 1
-                    else:
-                        st.error(f"❌ Incorrect. The correct answer is: {question_data['options'][question_data['correct']]}")
-                    
-                    st.info(f"💡 {question_data['explanation']}")
-                    st.session_state.current_financial_question += 1
-                    st.rerun()
-            
-            with col2:
-                progress = (current_q + 1) / len(financial_questions)
-                st.progress(progress)
-                st.write(f"Progress: {current_q + 1}/{len(financial_questions)}")
-        
-        else:
-            # Quiz completed - similar to civic quiz completion
-            st.markdown('<h2 class="section-header">🎉 Financial Quiz Completed!</h2>', unsafe_allow_html=True)
-            
-            score_percentage = (st.session_state.financial_score / len(financial_questions)) * 100
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Score", f"{st.session_state.financial_score}/{len(financial_questions)}")
-            with col2:
-                st.metric("Percentage", f"{score_percentage:.1f}%")
-            with col3:
-                if score_percentage >= 80:
-                    badge = "💎 Financial Expert"
-                elif score_percentage >= 60:
-                    badge = "💰 Money Smart"
-                else:
-                    badge = "📈 Keep Learning"
-                st.metric("Badge Earned", badge)
-            
-            # Update progress
+        question_data = questions[current_q]
+        
+        st.markdown(f"### Question {current_q + 1} of {len(questions)}")
+        st.write(question_data["question"])
+        
+        st.radio("Choose your answer:", question_data["options"], key=f"{quiz}_q_{current_q}")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.button("Submit Answer", key=f"submit_{quiz}_{current_q}", on_click=submit_quiz_answer, args=(quiz,))
+        
+        with col2:
+            progress = (current_q + 1) / len(questions)
+            st.progress(progress)
+            st.write(f"Progress: {current_q + 1}/{len(questions)}")
+    
+    else:
+        score = st.session_state[f"{quiz}_score"]
+        score_percentage = (score / len(questions)) * 100
+        feedback = generate_quiz_feedback(quiz, score_percentage, st.session_state[f"{quiz}_answers"])
+        
+        if not st.session_state.get(f"{quiz}_recorded"):
+            # Update user progress once per attempt, then rerun the whole app so the
+            # sidebar metrics and badges reflect the finished quiz.
             st.session_state.user_progress['quizzes_completed'] += 1
-            st.session_state.user_progress['total_score'] += st.session_state.financial_score
-            
-            if score_percentage >= 80 and "Financial Expert" not in st.session_state.user_progress['badges_earned']:
-                st.session_state.user_progress['badges_earned'].append("Financial Expert")
-                st.balloons()
-            
-            if st.button("Take Another Quiz"):
-                st.session_state.current_financial_question = 0
-                st.session_state.financial_score = 0
-                st.session_state.financial_answers = []
-                st.rerun()
+            st.session_state.user_progress['total_score'] += score
+            if feedback.band == "excellent" and config["champion_badge"] not in st.session_state.user_progress['badges_earned']:
+                st.session_state.user_progress['badges_earned'].append(config["champion_badge"])
+                st.session_state[f"{quiz}_celebrate"] = True
+            st.session_state[f"{quiz}_recorded"] = True
+            save_learner_progress()
+            st.rerun()
+        
+        # Quiz completed
+        st.markdown(f'<h2 class="section-header">{config["completed_header"]}</h2>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Score", f"{score}/{len(questions)}")
+        with col2:
+            st.metric("Percentage", f"{score_percentage:.1f}%")
+        with col3:
+            st.metric("Badge Earned", feedback.badge)
+        
+        # AI feedback
+        st.info(feedback.headline)
+        st.markdown("\n".join(feedback.weakness_lines))
+        show_recommended_review(quiz)
+        
+        if config["show_result_chart"]:
+            # Performance visualization
+            fig = charts.quiz_result_pie(score, len(questions) - score)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        if st.session_state.pop(f"{quiz}_celebrate", False):
+            st.balloons()
+        
+        st.button("Take Another Quiz", key=f"retry_{quiz}", on_click=reset_quiz, args=(quiz,))
 
 if __name__ == "__main__":
     main()
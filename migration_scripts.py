@@ -0,0 +1,237 @@
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from database_manager import DatabaseManager, db_config_from_env, sql
+
+# learning_sessions is range-partitioned by month on timestamp. Rows outside every
+# monthly partition land in the default partition and are moved out when their
+# month's partition is created, so inserts never fail for lack of a partition.
+# Queries bounded on timestamp (incremental rollup refreshes, Parquet exports) only
+# scan the matching partitions. Per-user lookups such as fetch_user_sessions probe
+# the (user_id, timestamp) index of every attached partition, and whole-table reads
+# such as fetch_all_learning_outcomes still scan all of them.
+PARENT_TABLE = "learning_sessions"
+DEFAULT_PARTITION = "learning_sessions_default"
+ARCHIVE_SCHEMA = "archive"
+DEFAULT_MONTHS_AHEAD = 3
+DEFAULT_RETENTION_MONTHS = 24
+
+_BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def utc_today() -> date:
+    # Session timestamps are UTC, so months are too
+    return datetime.now(timezone.utc).date()
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_y{month.year}m{month.month:02d}"
+
+
+def is_partitioned(db: DatabaseManager) -> bool:
+    row = db._execute_query(sql.SQL("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s);"),
+                            (PARENT_TABLE,), fetch_one=True)
+    return bool(row and row[0])
+
+
+def list_partitions(db: DatabaseManager) -> List[Tuple[str, Optional[date], Optional[date]]]:
+    """
+    Returns (name, lower, upper) for each attached partition, oldest first.
+
+    The default partition has None bounds.
+    """
+    rows = db._execute_query(sql.SQL("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s);
+    """), (PARENT_TABLE,), fetch_all=True)
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_PATTERN.search(bound)
+        if match:
+            lower, upper = (datetime.fromisoformat(value).date() for value in match.groups())
+            partitions.append((name, lower, upper))
+        else:
+            partitions.append((name, None, None))
+    partitions.sort(key=lambda p: (p[1] is not None, p[1]))
+    return partitions
+
+
+def _partition_ddl(month: date) -> sql.Composable:
+    return sql.SQL("CREATE TABLE {name} PARTITION OF {parent} FOR VALUES FROM ({lower}) TO ({upper});").format(
+        name=sql.Identifier(partition_name(month)),
+        parent=sql.Identifier(PARENT_TABLE),
+        lower=sql.Literal(datetime.combine(month, datetime.min.time())),
+        upper=sql.Literal(datetime.combine(add_months(month, 1), datetime.min.time())),
+    )
+
+
+def partition_learning_sessions(db: DatabaseManager, months_ahead: int = DEFAULT_MONTHS_AHEAD,
+                                 today: Optional[date] = None) -> bool:
+    """
+    Converts learning_sessions into a monthly range-partitioned table, in one transaction.
+
+    Partitions are created from the oldest session's month through months_ahead
+    months past the later of today and the newest session. The primary key becomes
+    (session_id, timestamp) because PostgreSQL requires it to include the partition key,
+    so from then on a session_id is only unique together with its timestamp.
+
+    Returns:
+        bool: False if the table was already partitioned.
+    """
+    if is_partitioned(db):
+        print(f"{PARENT_TABLE} is already partitioned.")
+        return False
+    today = today or utc_today()
+    oldest, newest = db._execute_query(sql.SQL("SELECT MIN(timestamp), MAX(timestamp) FROM learning_sessions;"),
+                                       fetch_one=True)
+    first = month_start(oldest.date() if oldest else today)
+    last = add_months(month_start(max(newest.date(), today) if newest else today), months_ahead)
+
+    statements = [sql.SQL("""
+        ALTER TABLE learning_sessions RENAME TO learning_sessions_unpartitioned;
+        ALTER TABLE learning_sessions_unpartitioned RENAME CONSTRAINT learning_sessions_pkey TO learning_sessions_unpartitioned_pkey;
+        ALTER INDEX IF EXISTS idx_learning_sessions_user_timestamp RENAME TO idx_learning_sessions_unpartitioned_user_timestamp;
+        CREATE TABLE learning_sessions (
+            session_id TEXT NOT NULL,
+            user_id TEXT NOT NULL REFERENCES user_profiles (user_id) ON DELETE CASCADE,
+            content_accessed JSONB DEFAULT '[]'::jsonb,
+            time_spent INTERVAL,
+            interactions JSONB DEFAULT '{}'::jsonb,
+            performance_metrics JSONB DEFAULT '{}'::jsonb,
+            timestamp TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+            PRIMARY KEY (session_id, timestamp)
+        ) PARTITION BY RANGE (timestamp);
+        CREATE INDEX idx_learning_sessions_user_timestamp ON learning_sessions (user_id, timestamp);
+    """), sql.SQL("CREATE TABLE {default} PARTITION OF {parent} DEFAULT;").format(
+        default=sql.Identifier(DEFAULT_PARTITION), parent=sql.Identifier(PARENT_TABLE))]
+    month = first
+    while month <= last:
+        statements.append(_partition_ddl(month))
+        month = add_months(month, 1)
+    statements.append(sql.SQL("""
+        INSERT INTO learning_sessions (session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp)
+        SELECT session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp
+        FROM learning_sessions_unpartitioned;
+        DROP TABLE learning_sessions_unpartitioned;
+    """))
+    # Sent as one statement string, so the conversion commits or rolls back as a whole
+    db._execute_query(sql.SQL("\n").join(statements))
+    print(f"Partitioned {PARENT_TABLE} into {len(statements) - 2} monthly partitions.")
+    return True
+
+
+def create_partition(db: DatabaseManager, month: date):
+    """
+    Creates and attaches the partition for one month.
+
+    Rows already sitting in the default partition for that month are moved into
+    the new partition in the same transaction, which ATTACH requires.
+    """
+    name = sql.Identifier(partition_name(month))
+    lower = sql.Literal(datetime.combine(month, datetime.min.time()))
+    upper = sql.Literal(datetime.combine(add_months(month, 1), datetime.min.time()))
+    db._execute_query(sql.SQL("""
+        CREATE TABLE {name} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+        WITH moved AS (
+            DELETE FROM {default} WHERE timestamp >= {lower} AND timestamp < {upper} RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved;
+        ALTER TABLE {parent} ATTACH PARTITION {name} FOR VALUES FROM ({lower}) TO ({upper});
+    """).format(name=name, parent=sql.Identifier(PARENT_TABLE), default=sql.Identifier(DEFAULT_PARTITION),
+                lower=lower, upper=upper))
+
+
+def ensure_partitions(db: DatabaseManager, months_ahead: int = DEFAULT_MONTHS_AHEAD,
+                      today: Optional[date] = None) -> List[str]:
+    """
+    Creates missing partitions for this month and the next months_ahead months, plus
+    any month that has rows waiting in the default partition.
+
+    Returns:
+        list: Names of the partitions created; empty if learning_sessions isn't partitioned.
+    """
+    if not is_partitioned(db):
+        print(f"{PARENT_TABLE} is not partitioned; convert it with `python migration_scripts.py partition` first.")
+        return []
+    today = today or utc_today()
+    existing = {lower for _, lower, _ in list_partitions(db) if lower is not None}
+    months = {add_months(month_start(today), i) for i in range(months_ahead + 1)}
+    stray = db._execute_query(sql.SQL("SELECT DISTINCT date_trunc('month', timestamp) FROM {default};").format(
+        default=sql.Identifier(DEFAULT_PARTITION)), fetch_all=True)
+    months.update(row[0].date() for row in stray)
+
+    created = []
+    for month in sorted(months - existing):
+        create_partition(db, month)
+        created.append(partition_name(month))
+    return created
+
+
+def archive_old_partitions(db: DatabaseManager, retention_months: int = DEFAULT_RETENTION_MONTHS,
+                           today: Optional[date] = None) -> List[str]:
+    """
+    Detaches partitions that end before the retention window and moves them to the
+    archive schema, where they stay queryable but no longer slow down learning_sessions.
+
+    Cohort rollups already built from archived months are kept; a full rollup
+    rebuild only covers attached partitions.
+
+    Returns:
+        list: Names of the partitions archived.
+    """
+    cutoff = add_months(month_start(today or utc_today()), -retention_months)
+    archived = []
+    for name, lower, upper in list_partitions(db):
+        if upper is None or upper > cutoff:
+            continue
+        db._execute_query(sql.SQL("""
+            CREATE SCHEMA IF NOT EXISTS {archive};
+            ALTER TABLE {parent} DETACH PARTITION {name};
+            ALTER TABLE {name} SET SCHEMA {archive};
+        """).format(archive=sql.Identifier(ARCHIVE_SCHEMA), parent=sql.Identifier(PARENT_TABLE),
+                    name=sql.Identifier(name)))
+        archived.append(name)
+    return archived
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage monthly partitions of learning_sessions.")
+    parser.add_argument("command", choices=["partition", "maintain", "list"],
+                        help="'partition' converts the table once; 'maintain' creates upcoming partitions "
+                             "and archives expired ones, e.g. from a daily cron job.")
+    parser.add_argument("--months-ahead", type=int, default=DEFAULT_MONTHS_AHEAD)
+    parser.add_argument("--retention-months", type=int, default=DEFAULT_RETENTION_MONTHS,
+                        help="Archive partitions that ended more than this many months ago.")
+    args = parser.parse_args()
+
+    db = DatabaseManager(db_config_from_env())
+    try:
+        if args.command == "partition":
+            partition_learning_sessions(db, args.months_ahead)
+        elif args.command == "maintain":
+            if not is_partitioned(db):
+                print(f"{PARENT_TABLE} is not partitioned; convert it with `python migration_scripts.py partition` first.")
+                raise SystemExit(1)
+            created = ensure_partitions(db, args.months_ahead)
+            archived = archive_old_partitions(db, args.retention_months)
+            print(f"Created {len(created)} partition(s): {', '.join(created) or '-'}")
+            print(f"Archived {len(archived)} partition(s): {', '.join(archived) or '-'}")
+        else:
+            for name, lower, upper in list_partitions(db):
+                print(f"{name:<32} {lower or 'DEFAULT'} .. {upper or ''}")
+    finally:
+        db.close()
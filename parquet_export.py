@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from database_manager import DEFAULT_ROLLUP_LOOKBACK, SESSION_EXPORT_COLUMNS, USER_ANALYTICS_EXPORT_COLUMNS, create_database_manager, db_config_from_env
+from startup import lazy_import
+
+# pyarrow is only imported when an export runs
+pa = lazy_import("pyarrow")
+pq = lazy_import("pyarrow.parquet")
+
+DEFAULT_BATCH_SIZE = 50_000
+DEFAULT_COMPRESSION = "zstd"
+WATERMARK_FILE = "_watermark.json"
+# Sessions may commit this long after their timestamp (offline sync, long transactions,
+# replica lag) and still be exported; same window as the rollup refresh
+DEFAULT_EXPORT_LOOKBACK = DEFAULT_ROLLUP_LOOKBACK
+
+
+def session_schema() -> pa.Schema:
+    """Typed columns for exported sessions; the session_date partition is in the directory name."""
+    return pa.schema([
+        ("session_id", pa.string()),
+        ("user_id", pa.string()),
+        ("timestamp", pa.timestamp("us")),
+        ("time_spent_seconds", pa.float64()),
+        ("score", pa.float64()),
+        ("completed", pa.bool_()),
+        ("content_accessed", pa.list_(pa.string())),
+        ("content_count", pa.int32()),
+        ("interactions", pa.string()),
+        ("cluster_label", pa.int32()),
+    ])
+
+
+def user_analytics_schema() -> pa.Schema:
+    return pa.schema([
+        ("user_id", pa.string()),
+        ("cluster_label", pa.int32()),
+        ("engineered_features", pa.string()),
+        ("predictions", pa.string()),
+        ("recommendations", pa.string()),
+        ("insights", pa.string()),
+    ])
+
+
+def _read_watermark_file(out_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(out_dir, WATERMARK_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def read_watermark(out_dir: str) -> Optional[datetime]:
+    """Returns the timestamp of the newest session exported to out_dir so far."""
+    value = _read_watermark_file(out_dir).get("learning_sessions")
+    return datetime.fromisoformat(value) if value else None
+
+
+def write_watermark(out_dir: str, watermark: datetime, run_id: Optional[str] = None):
+    """
+    Records a finished session export. This is the commit point of a run: its part
+    files only become visible after the watermark naming its run_id is in place.
+    """
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"learning_sessions": watermark.isoformat(), "run_id": run_id}, f)
+    # Atomic, so a crashed export is simply re-run from the previous watermark
+    os.replace(tmp_path, path)
+
+
+def _pending_name(run_id: str) -> str:
+    # A leading dot hides the file from pyarrow.dataset, Spark and DuckDB until it is published
+    return f".part-{run_id}.parquet"
+
+
+def _final_name(run_id: str) -> str:
+    return f"part-{run_id}.parquet"
+
+
+def publish_run(root: str, committed_run_id: Optional[str]) -> List[str]:
+    """
+    Renames the committed run's pending part files to their final names and deletes
+    pending files left behind by runs that crashed before committing.
+
+    Runs before every export and after each commit, so a crash at any point leaves
+    no duplicate rows: an uncommitted run is discarded and exported again, and a
+    committed one is published on the next start.
+
+    Returns:
+        list: Paths of the files published.
+    """
+    published = []
+    if not os.path.isdir(root):
+        return published
+    for entry in os.scandir(root):
+        if not entry.is_dir():
+            continue
+        for name in os.listdir(entry.path):
+            if not (name.startswith(".part-") and name.endswith(".parquet")):
+                continue
+            path = os.path.join(entry.path, name)
+            run_id = name[len(".part-"):-len(".parquet")]
+            if run_id == committed_run_id:
+                final_path = os.path.join(entry.path, _final_name(run_id))
+                os.replace(path, final_path)
+                published.append(final_path)
+            else:
+                os.remove(path)
+    return published
+
+
+def exported_session_ids(root: str, since: date) -> Set[str]:
+    """Returns the session_ids in the published part files of partitions dated since or later."""
+    session_ids = set()
+    if not os.path.isdir(root):
+        return session_ids
+    for entry in os.scandir(root):
+        if not entry.is_dir() or date.fromisoformat(entry.name.partition("=")[2]) < since:
+            continue
+        for name in os.listdir(entry.path):
+            if name.startswith("part-") and name.endswith(".parquet"):
+                table = pq.read_table(os.path.join(entry.path, name), columns=["session_id"])
+                session_ids.update(table.column("session_id").to_pylist())
+    return session_ids
+
+
+def session_batch(rows: List[Tuple], schema: pa.Schema) -> pa.RecordBatch:
+    """Converts rows in SESSION_EXPORT_COLUMNS order into a typed record batch."""
+    columns = dict(zip(SESSION_EXPORT_COLUMNS, zip(*rows)))
+    columns["content_count"] = [len(items) if items else 0 for items in columns["content_accessed"]]
+    return pa.RecordBatch.from_arrays([pa.array(columns[field.name], type=field.type) for field in schema],
+                                      schema=schema)
+
+
+class PartitionedWriter:
+    """
+    Writes record batches into <root>/<partition>=<value>/.part-<run_id>.parquet.
+
+    Files keep that hidden pending name until publish_run() renames them once the
+    run is committed. Rows arrive ordered by timestamp, so only the current
+    partition's file is open at any time and memory stays at one batch plus one
+    row group.
+    """
+
+    def __init__(self, root: str, partition: str, run_id: str, schema: pa.Schema, compression: str):
+        self.root = root
+        self.partition = partition
+        self.run_id = run_id
+        self.schema = schema
+        self.compression = compression
+        self._value = None
+        self._writer = None
+        self.files: List[str] = []
+
+    def write(self, value: Any, batch: pa.RecordBatch):
+        if value != self._value:
+            self.close()
+            directory = os.path.join(self.root, f"{self.partition}={value}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, _pending_name(self.run_id))
+            self._writer = pq.ParquetWriter(path, self.schema, compression=self.compression)
+            self._value = value
+            self.files.append(path)
+        self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def export_sessions(db, out_dir: str, full: bool = False, batch_size: int = DEFAULT_BATCH_SIZE,
+                    compression: str = DEFAULT_COMPRESSION,
+                    lookback: timedelta = DEFAULT_EXPORT_LOOKBACK) -> Dict[str, Any]:
+    """
+    Exports learning sessions newer than the last export into date-partitioned Parquet.
+
+    Args:
+        db: DatabaseManager or SQLiteDatabaseManager.
+        out_dir (str): Export root; sessions go to learning_sessions/session_date=YYYY-MM-DD/.
+        full (bool): Delete previously exported sessions and export everything again.
+        batch_size (int): Rows fetched and written per record batch.
+        compression (str): Parquet codec, e.g. 'zstd' or 'snappy'.
+        lookback (timedelta): How far below the watermark to look again for sessions
+            that committed late; those already exported are skipped by session_id.
+
+    A run's files are written under hidden names and only published after the
+    watermark is advanced, so a run that crashes part-way leaves nothing behind
+    that the next run would duplicate.
+
+    Returns:
+        dict: rows exported, files written and the new watermark.
+    """
+    sessions_dir = os.path.join(out_dir, "learning_sessions")
+    if full:
+        # Dropping the watermark first means a crash below still ends in a full re-export
+        try:
+            os.remove(os.path.join(out_dir, WATERMARK_FILE))
+        except FileNotFoundError:
+            pass
+    state = _read_watermark_file(out_dir)
+    # Finish publishing a run that crashed after committing, and discard uncommitted ones
+    publish_run(sessions_dir, state.get("run_id"))
+    since = read_watermark(out_dir)
+    if since is None and os.path.isdir(sessions_dir):
+        # Without a watermark nothing here is committed; start over
+        shutil.rmtree(sessions_dir)
+    scan_from = since - lookback if since is not None else None
+    exported = exported_session_ids(sessions_dir, scan_from.date()) if scan_from is not None else set()
+
+    schema = session_schema()
+    # Wall-clock run ids stay unique when only late sessions below the watermark are found
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    writer = PartitionedWriter(sessions_dir, "session_date", run_id, schema, compression)
+    rows_written = 0
+    # The upper bound and the rows come from one snapshot, so sessions committed during
+    # the export wait for the next run instead of being skipped below a newer bound
+    with db.session_export_snapshot(scan_from, batch_size) as (until, batches):
+        if until is None:
+            return {"rows": 0, "files": [], "watermark": since}
+        try:
+            for rows in batches:
+                rows = [row for row in rows if row[0] not in exported]
+                if not rows:
+                    continue
+                batch = session_batch(rows, schema)
+                # Split the batch where the date changes; rows are ordered by timestamp
+                start = 0
+                current = rows[0][2].date()
+                for i in range(1, len(rows)):
+                    day = rows[i][2].date()
+                    if day != current:
+                        writer.write(current, batch.slice(start, i - start))
+                        start, current = i, day
+                writer.write(current, batch.slice(start))
+                rows_written += len(rows)
+        finally:
+            writer.close()
+
+    if rows_written == 0:
+        return {"rows": 0, "files": [], "watermark": since}
+    watermark = max(until, since) if since is not None else until
+    write_watermark(out_dir, watermark, run_id)
+    files = publish_run(sessions_dir, run_id)
+    return {"rows": rows_written, "files": files, "watermark": watermark}
+
+
+def export_user_analytics(db, out_dir: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                          compression: str = DEFAULT_COMPRESSION, snapshot_date: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Writes a snapshot of user_analytics_data to user_analytics/snapshot_date=YYYY-MM-DD/.
+
+    The table holds one current row per user, so it is exported whole rather than
+    incrementally; one snapshot per day is kept and a re-run replaces it.
+    """
+    schema = user_analytics_schema()
+    snapshot_date = snapshot_date or date.today()
+    directory = os.path.join(out_dir, "user_analytics", f"snapshot_date={snapshot_date.isoformat()}")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "part-0.parquet")
+    tmp_path = path + ".tmp"
+    rows_written = 0
+    with pq.ParquetWriter(tmp_path, schema, compression=compression) as writer:
+        for rows in db.iter_user_analytics_rows(batch_size):
+            columns = dict(zip(USER_ANALYTICS_EXPORT_COLUMNS, zip(*rows)))
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(columns[field.name], type=field.type) for field in schema], schema=schema))
+            rows_written += len(rows)
+    os.replace(tmp_path, path)
+    return {"rows": rows_written, "files": [path]}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export learning sessions and user analytics to Parquet.")
+    parser.add_argument("out_dir", help="Export root directory.")
+    parser.add_argument("--full", action="store_true", help="Replace the session export instead of appending to it.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION)
+    parser.add_argument("--lookback-hours", type=float, default=DEFAULT_EXPORT_LOOKBACK.total_seconds() / 3600,
+                        help="How late a session may commit and still be exported by an incremental run.")
+    args = parser.parse_args()
+
+    db = create_database_manager(db_config_from_env())
+    try:
+        sessions = export_sessions(db, args.out_dir, args.full, args.batch_size, args.compression,
+                                   timedelta(hours=args.lookback_hours))
+        print(f"Exported {sessions['rows']} session(s) into {len(sessions['files'])} file(s); "
+              f"watermark {sessions['watermark']}.")
+        analytics = export_user_analytics(db, args.out_dir, args.batch_size, args.compression)
+        print(f"Exported {analytics['rows']} user analytics row(s).")
+    finally:
+        db.close()
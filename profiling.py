@@ -0,0 +1,183 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+# Instrumentation is compiled out unless this is set: profiled() returns functions
+# unchanged and span() returns a shared no-op context manager.
+ENABLED = os.environ.get("LMS_PROFILING") == "1"
+LOG_PATH = os.environ.get("LMS_PROFILING_LOG", "profiling.log")
+MAX_RECENT_RUNS = 200
+PROFILE_STATS_LINES = 40
+
+_NULL_SPAN = nullcontext()
+_local = threading.local()
+_recent_runs = deque(maxlen=MAX_RECENT_RUNS)
+_lock = threading.Lock()
+_log_lock = threading.Lock()
+_pending_profiles = 0
+_profiler_kind = "cprofile"
+
+
+def request_profile(runs: int = 1, profiler: str = "cprofile"):
+    """
+    Samples the next runs reruns with a profiler.
+
+    Args:
+        runs (int): Number of upcoming reruns, across all sessions, to profile.
+        profiler (str): 'cprofile' or 'pyinstrument'. pyinstrument falls back to
+            cProfile if it isn't installed.
+    """
+    global _pending_profiles, _profiler_kind
+    with _lock:
+        _pending_profiles = runs
+        _profiler_kind = profiler
+
+
+def _start_profiler():
+    global _pending_profiles
+    with _lock:
+        if _pending_profiles <= 0:
+            return None
+        _pending_profiles -= 1
+        kind = _profiler_kind
+    if kind == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        except ImportError:
+            pass
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is already active in this interpreter
+        return None
+    return profiler
+
+
+def _stop_profiler(profiler) -> str:
+    if hasattr(profiler, "output_text"):
+        profiler.stop()
+        return profiler.output_text()
+    import io
+    import pstats
+    profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_STATS_LINES)
+    return out.getvalue()
+
+
+def _finish_run(run: Dict[str, Any]):
+    with _lock:
+        _recent_runs.append(run)
+    try:
+        with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run) + "\n")
+    except OSError as e:
+        print(f"Error writing profiling log: {e}")
+
+
+@contextmanager
+def _recording_span(name: str):
+    run = getattr(_local, "run", None)
+    is_root = run is None
+    if is_root:
+        run = {"root": name, "started": datetime.now().isoformat(timespec="milliseconds"),
+               "spans": [], "profile": None, "_t0": time.perf_counter(), "_depth": 0}
+        _local.run = run
+        profiler = _start_profiler()
+    entry = {"name": name, "depth": run["_depth"], "start_ms": (time.perf_counter() - run["_t0"]) * 1000}
+    run["spans"].append(entry)
+    run["_depth"] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        # st.rerun() and st.stop() unwind through here as exceptions too
+        entry["exit"] = type(e).__name__
+        raise
+    finally:
+        entry["duration_ms"] = (time.perf_counter() - start) * 1000
+        run["_depth"] -= 1
+        if is_root:
+            _local.run = None
+            if profiler is not None:
+                run["profile"] = _stop_profiler(profiler)
+            run["total_ms"] = entry["duration_ms"]
+            del run["_t0"], run["_depth"]
+            _finish_run(run)
+
+
+def span(name: str):
+    """
+    Times a block as part of the current rerun.
+
+    The outermost span on a thread starts a new rerun record; nested spans are
+    recorded inside it with their depth and offset.
+
+    Args:
+        name (str): Label shown in the timing panel and log, e.g. 'figure:budget_pie'.
+    """
+    if not ENABLED:
+        return _NULL_SPAN
+    return _recording_span(name)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator that wraps every call to a function in a span named after it."""
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _recording_span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def recent_runs(limit: int = 50) -> List[Dict[str, Any]]:
+    """Returns the most recent rerun records in this process, newest first."""
+    with _lock:
+        runs = list(_recent_runs)
+    return runs[::-1][:limit]
+
+
+def span_summary(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregates span timings across rerun records.
+
+    Args:
+        runs (list): Records from recent_runs().
+
+    Returns:
+        list: One dict per span name with calls, mean_ms, p95_ms and total_ms,
+        slowest total first.
+    """
+    durations = {}
+    for run in runs:
+        for entry in run["spans"]:
+            durations.setdefault(entry["name"], []).append(entry["duration_ms"])
+    summary = []
+    for span_name, values in durations.items():
+        values.sort()
+        summary.append({
+            "span": span_name,
+            "calls": len(values),
+            "mean_ms": sum(values) / len(values),
+            "p95_ms": values[min(len(values) - 1, int(0.95 * len(values)))],
+            "total_ms": sum(values),
+        })
+    summary.sort(key=lambda s: s["total_ms"], reverse=True)
+    return summary
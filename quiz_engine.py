@@ -0,0 +1,366 @@
+import heapq
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+# Spaced-repetition scheduling of quiz questions. Per question, a learner's state is
+# a plain dict that can live in st.session_state; due times are epoch seconds.
+
+DAY_SECONDS = 86_400
+# Each check for rescheduled reviews re-reads this much before the previous one, to
+# cover clock skew between servers and saves that commit after a check has run
+DEFAULT_UPDATE_MARGIN_SECONDS = 60.0
+
+
+# --- SM-2 Scheduling ---
+class SM2Params(NamedTuple):
+    initial_ease: float = 2.5
+    min_ease: float = 1.3
+    first_interval_days: float = 1.0
+    second_interval_days: float = 6.0
+    pass_quality: int = 3       # Answers graded below this are lapses
+    correct_quality: int = 4    # Grade given to a correct multiple-choice answer
+    incorrect_quality: int = 1  # Grade given to a wrong one
+
+
+DEFAULT_SM2_PARAMS = SM2Params()
+
+
+def new_item(params: SM2Params = DEFAULT_SM2_PARAMS) -> Dict[str, Any]:
+    return {"interval_days": 0.0, "ease": params.initial_ease, "repetitions": 0, "lapses": 0, "due": 0.0}
+
+
+def sm2_update(item: Dict[str, Any], quality: int, now: float, params: SM2Params = DEFAULT_SM2_PARAMS) -> Dict[str, Any]:
+    """
+    Applies one SM-2 review to a question's scheduling state, in place.
+
+    A lapse resets the repetition count and makes the question due again right away,
+    so it comes back in the same study session, as SM-2 prescribes for items graded
+    below 4; the next successful review then starts over at the first interval.
+
+    Args:
+        item (dict): interval_days, ease, repetitions, lapses and due.
+        quality (int): Answer grade from 0 (blackout) to 5 (perfect recall).
+        now (float): Review time in epoch seconds.
+        params (SM2Params): Intervals and ease bounds.
+
+    Returns:
+        dict: The updated item.
+    """
+    if quality < params.pass_quality:
+        item["repetitions"] = 0
+        item["lapses"] += 1
+        item["interval_days"] = 0.0
+    else:
+        if item["repetitions"] == 0:
+            item["interval_days"] = params.first_interval_days
+        elif item["repetitions"] == 1:
+            item["interval_days"] = params.second_interval_days
+        else:
+            item["interval_days"] = round(item["interval_days"] * item["ease"], 2)
+        item["repetitions"] += 1
+    item["ease"] = max(params.min_ease, item["ease"] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    item["due"] = now + item["interval_days"] * DAY_SECONDS
+    return item
+
+
+def to_datetime(ts: float) -> datetime:
+    """Epoch seconds to the naive UTC datetime stored in the database."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+
+def to_epoch(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class ReviewScheduler:
+    """
+    Keeps one learner's review schedule and a min-heap of their due questions.
+
+    The heap holds [due, question_id] entries: rescheduling pushes a new entry and
+    the old one is dropped lazily when it reaches the top, so reviews and next_due
+    are O(log n). Once stale entries outnumber live ones the heap is rebuilt in
+    place, so it stays under twice the number of questions. Both the items dict and
+    the heap are plain data and can live in st.session_state. Only questions changed
+    since the last save are written back.
+    """
+
+    def __init__(self, user_id: str, items: Optional[Dict[str, Dict[str, Any]]] = None,
+                 heap: Optional[List[List[Any]]] = None, params: SM2Params = DEFAULT_SM2_PARAMS):
+        self.user_id = user_id
+        self.items = items if items is not None else {}
+        self.params = params
+        if heap is None:
+            heap = [[item["due"], question_id] for question_id, item in self.items.items()]
+            heapq.heapify(heap)
+        self.heap = heap
+        self._dirty = set()
+
+    @classmethod
+    def from_db(cls, db, user_id: str, params: SM2Params = DEFAULT_SM2_PARAMS) -> "ReviewScheduler":
+        """Loads a learner's stored schedule with a single query."""
+        items = db.fetch_review_schedule(user_id)
+        for item in items.values():
+            item["due"] = to_epoch(item.pop("due_at"))
+        return cls(user_id, items, params=params)
+
+    def _is_current(self, entry: List[Any]) -> bool:
+        item = self.items.get(entry[1])
+        return item is not None and item["due"] == entry[0]
+
+    def _drop_stale(self):
+        while self.heap and not self._is_current(self.heap[0]):
+            heapq.heappop(self.heap)
+
+    def _compact(self):
+        # In place, so a heap kept in st.session_state stays the same list
+        self.heap[:] = [[item["due"], question_id] for question_id, item in self.items.items()]
+        heapq.heapify(self.heap)
+
+    def record_review(self, question_id: str, correct: bool, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Grades an answer and reschedules the question.
+
+        Returns:
+            dict: The question's new scheduling state.
+        """
+        item = self.items.get(question_id)
+        if item is None:
+            item = self.items[question_id] = new_item(self.params)
+        quality = self.params.correct_quality if correct else self.params.incorrect_quality
+        sm2_update(item, quality, time.time() if now is None else now, self.params)
+        heapq.heappush(self.heap, [item["due"], question_id])
+        if len(self.heap) > 2 * len(self.items):
+            self._compact()
+        self._dirty.add(question_id)
+        return item
+
+    def next_due(self) -> Optional[Tuple[float, str]]:
+        """Returns (due, question_id) of the earliest scheduled review, or None."""
+        self._drop_stale()
+        return tuple(self.heap[0]) if self.heap else None
+
+    def due_questions(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Returns questions due by now, most overdue first, in O(k log n) for k results.
+
+        The entries are popped to find them and pushed back, so they stay scheduled
+        until they are reviewed.
+        """
+        now = time.time() if now is None else now
+        due = []
+        self._drop_stale()
+        while self.heap and self.heap[0][0] <= now and (limit is None or len(due) < limit):
+            due.append(heapq.heappop(self.heap))
+            self._drop_stale()
+        for entry in due:
+            heapq.heappush(self.heap, entry)
+        return [question_id for _, question_id in due]
+
+    def review_round(self, question_ids: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """
+        Picks the questions of a quiz to ask next: due ones first, then ones never seen.
+
+        Args:
+            question_ids (iterable): Every question of the quiz, in quiz order.
+
+        Returns:
+            list: Question IDs to ask; empty when nothing in the quiz is due yet.
+        """
+        question_ids = list(question_ids)
+        in_quiz = set(question_ids)
+        due = [q for q in self.due_questions(now) if q in in_quiz]
+        return due + [q for q in question_ids if q not in self.items]
+
+    def save(self, db):
+        """Writes questions changed since the last save in one batch."""
+        if not self._dirty:
+            return
+        db.upsert_review_schedule(self.user_id, {
+            question_id: {**self.items[question_id], "due_at": to_datetime(self.items[question_id]["due"])}
+            for question_id in self._dirty
+        })
+        self._dirty.clear()
+
+
+# --- Due Learner Sweep ---
+class TimingWheel:
+    """
+    Hashed timing wheel of keys that fire at a due time.
+
+    Scheduling is O(1): a key goes into the slot of its tick. advance() only visits
+    the slots whose ticks have elapsed, so its cost depends on how much time passed
+    and how many keys fell due, not on how many are scheduled. Keys further out than
+    one revolution wait in an overflow heap and move into a slot as the wheel turns.
+    Rescheduling a key leaves its old entry behind, which is skipped when reached.
+    """
+
+    def __init__(self, tick_seconds: float = 60, slots: int = 1440, now: Optional[float] = None):
+        self.tick_seconds = tick_seconds
+        self.slots: List[Dict[Hashable, float]] = [{} for _ in range(slots)]
+        self.current_tick = int((time.time() if now is None else now) // tick_seconds)
+        self._due: Dict[Hashable, float] = {}
+        self._overflow: List[Tuple[float, int, Hashable]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def get(self, key: Hashable) -> Optional[float]:
+        """Returns when key is scheduled to fire, or None."""
+        return self._due.get(key)
+
+    def schedule(self, key: Hashable, due: float):
+        """Schedules key to fire at due, replacing any earlier schedule for it."""
+        self._due[key] = due
+        tick = max(int(due // self.tick_seconds), self.current_tick)
+        if tick - self.current_tick < len(self.slots):
+            self.slots[tick % len(self.slots)][key] = due
+        else:
+            self._sequence += 1
+            heapq.heappush(self._overflow, (due, self._sequence, key))
+
+    def cancel(self, key: Hashable):
+        self._due.pop(key, None)
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Turns the wheel up to now and returns the keys that fell due, removing them."""
+        return [key for key, _ in self.pop_due(now)]
+
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """Like advance(), but returns (key, due) pairs."""
+        now = time.time() if now is None else now
+        target = int(now // self.tick_seconds)
+        fired = []
+        while True:
+            slot = self.slots[self.current_tick % len(self.slots)]
+            for key, due in list(slot.items()):
+                if self._due.get(key) != due:
+                    del slot[key]
+                elif due <= now:
+                    del slot[key]
+                    del self._due[key]
+                    fired.append((key, due))
+            if self.current_tick >= target:
+                return fired
+            self.current_tick += 1
+            horizon = (self.current_tick + len(self.slots)) * self.tick_seconds
+            while self._overflow and self._overflow[0][0] < horizon:
+                due, _, key = heapq.heappop(self._overflow)
+                if self._due.get(key) == due:
+                    self.slots[int(due // self.tick_seconds) % len(self.slots)][key] = due
+
+
+class DueLearnerSweeper:
+    """
+    Finds learners with reviews due, for reminders, without scanning every schedule row.
+
+    Every horizon_seconds it loads each learner's earliest due time within the next
+    horizon with one range query on the due_at index, and puts them on a timing wheel.
+    Each sweep() also asks, through the updated_at index, for reviews saved since the
+    previous sweep that fall due before the loaded horizon, so a lapse, due right
+    away, is picked up within a tick. Each sweep then turns the wheel. Learners that
+    fall due are checked against their stored schedule in one query, since a review
+    may have been moved later after it was put on the wheel; those with nothing due
+    any more, and those reported, are put back on it at their next review. A learner
+    is reported at most once for everything due by the time of that report.
+    """
+
+    def __init__(self, db, tick_seconds: float = 60, horizon_seconds: float = DAY_SECONDS,
+                 margin_seconds: float = DEFAULT_UPDATE_MARGIN_SECONDS, now: Optional[float] = None):
+        self.db = db
+        self.horizon_seconds = horizon_seconds
+        self.margin_seconds = margin_seconds
+        self.wheel = TimingWheel(tick_seconds, int(-(-horizon_seconds // tick_seconds)) + 1, now)
+        self._loaded_until: Optional[float] = None
+        self._checked_at: Optional[float] = None
+        # When each recently reported learner was reported
+        self._reported: Dict[str, float] = {}
+
+    def schedule(self, user_id: str, due: float):
+        self.wheel.schedule(user_id, due)
+
+    def _schedule_earliest(self, user_id: str, due: float):
+        pending = self.wheel.get(user_id)
+        if pending is None or due < pending:
+            self.wheel.schedule(user_id, due)
+
+    def _load(self, now: float):
+        until = now + self.horizon_seconds
+        after = to_datetime(self._loaded_until) if self._loaded_until is not None else None
+        for user_id, due_at in self.db.fetch_due_learners(to_datetime(until), after):
+            self._schedule_earliest(user_id, to_epoch(due_at))
+        self._loaded_until = until
+
+    def _load_rescheduled(self):
+        since = self._checked_at - self.margin_seconds
+        # Rows read again within the margin are due no earlier than this, so older
+        # reports can no longer suppress anything
+        cutoff = since - self.margin_seconds
+        self._reported = {user_id: at for user_id, at in self._reported.items() if at >= cutoff}
+        for user_id, due_at in self.db.fetch_rescheduled_reviews(to_datetime(since), to_datetime(self._loaded_until)):
+            due = to_epoch(due_at)
+            if due > self._reported.get(user_id, float("-inf")):
+                self._schedule_earliest(user_id, due)
+
+    def _confirm(self, fired: List[Tuple[str, float]], now: float) -> List[str]:
+        # Each learner's earliest review from the time they were put on the wheel; older
+        # ones were reported already
+        current = dict(self.db.fetch_next_due([(user_id, to_datetime(due)) for user_id, due in fired]))
+        due = [user_id for user_id, _ in fired if user_id in current and to_epoch(current[user_id]) <= now]
+        upcoming = [(user_id, current[user_id]) for user_id, _ in fired
+                    if user_id in current and to_epoch(current[user_id]) > now]
+        if due:
+            # Reported learners go back on the wheel at their first review after this report
+            after = to_datetime(now) + timedelta(microseconds=1)
+            upcoming += self.db.fetch_next_due([(user_id, after) for user_id in due])
+        for user_id, due_at in upcoming:
+            next_due = to_epoch(due_at)
+            # Later ones are picked up when the next horizon is loaded
+            if next_due < self._loaded_until:
+                self._schedule_earliest(user_id, next_due)
+        return due
+
+    def sweep(self, now: Optional[float] = None) -> List[str]:
+        """Returns learners whose earliest review fell due since the last sweep."""
+        now = time.time() if now is None else now
+        if self._checked_at is not None:
+            self._load_rescheduled()
+        if self._loaded_until is None or now + self.wheel.tick_seconds >= self._loaded_until:
+            self._load(now)
+        self._checked_at = now
+        fired = self.wheel.pop_due(now)
+        due = self._confirm(fired, now) if fired else []
+        for user_id in due:
+            self._reported[user_id] = now
+        return due
+
+    def run(self, on_due: Callable[[List[str]], None], stop: Optional[Callable[[], bool]] = None):
+        """Sweeps once per tick until stop() returns True, passing each batch of due learners to on_due."""
+        while not (stop and stop()):
+            due = self.sweep()
+            if due:
+                on_due(due)
+            time.sleep(self.wheel.tick_seconds)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from database_manager import create_database_manager, db_config_from_env
+
+    parser = argparse.ArgumentParser(description="Report learners as their spaced-repetition reviews fall due.")
+    parser.add_argument("--tick", type=float, default=60, help="Sweep interval in seconds.")
+    parser.add_argument("--horizon", type=float, default=DAY_SECONDS, help="Seconds of schedule loaded at a time.")
+    args = parser.parse_args()
+
+    db = create_database_manager(db_config_from_env())
+    sweeper = DueLearnerSweeper(db, args.tick, args.horizon)
+    try:
+        sweeper.run(lambda learners: print(f"{datetime.now():%Y-%m-%d %H:%M:%S} {len(learners)} learner(s) due: "
+                                           f"{', '.join(learners[:20])}{' ...' if len(learners) > 20 else ''}",
+                                           flush=True))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
@@ -0,0 +1,247 @@
+-- Synthetic sample data generated by data_generator.py. Regenerate rather than edit.
+
+INSERT INTO user_profiles (user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics) VALUES
+('user_00000000', '{"age": 18, "region": "Kilifi", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 21, "avg_session_minutes": 15.4}', '{"session_count": 2, "quiz_count": 1}'),
+('user_00000001', '{"age": 23, "region": "Kiambu", "education_level": "primary"}', '{"preferred_source": "both", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 8, "avg_session_minutes": 16.5}', '{"session_count": 9, "quiz_count": 5}'),
+('user_00000002', '{"age": 18, "region": "Nyeri", "education_level": "out_of_school"}', '{"preferred_source": "civic", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 20, "avg_session_minutes": 19.8}', '{"session_count": 9, "quiz_count": 3}'),
+('user_00000003', '{"age": 23, "region": "Kakamega", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 17, "avg_session_minutes": 18.2}', '{"session_count": 3, "quiz_count": 1}'),
+('user_00000004', '{"age": 23, "region": "Kiambu", "education_level": "secondary"}', '{"preferred_source": "financial", "pace": "self_paced", "device": "desktop"}', '{"usual_hour": 8, "avg_session_minutes": 8.9}', '{"session_count": 5, "quiz_count": 4}'),
+('user_00000005', '{"age": 20, "region": "Nakuru", "education_level": "secondary"}', '{"preferred_source": "both", "pace": "intensive", "device": "desktop"}', '{"usual_hour": 17, "avg_session_minutes": 8.6}', '{"session_count": 2, "quiz_count": 1}'),
+('user_00000006', '{"age": 23, "region": "Kakamega", "education_level": "primary"}', '{"preferred_source": "civic", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 18, "avg_session_minutes": 17.9}', '{"session_count": 11, "quiz_count": 7}'),
+('user_00000007', '{"age": 18, "region": "Mombasa", "education_level": "out_of_school"}', '{"preferred_source": "civic", "pace": "weekly", "device": "tablet"}', '{"usual_hour": 1, "avg_session_minutes": 17.7}', '{"session_count": 16, "quiz_count": 11}'),
+('user_00000008', '{"age": 16, "region": "Kakamega", "education_level": "secondary"}', '{"preferred_source": "both", "pace": "weekly", "device": "mobile"}', '{"usual_hour": 15, "avg_session_minutes": 40.0}', '{"session_count": 3, "quiz_count": 2}'),
+('user_00000009', '{"age": 16, "region": "Mombasa", "education_level": "tertiary"}', '{"preferred_source": "both", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 19, "avg_session_minutes": 17.4}', '{"session_count": 3, "quiz_count": 1}'),
+('user_00000010', '{"age": 20, "region": "Kakamega", "education_level": "primary"}', '{"preferred_source": "financial", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 11, "avg_session_minutes": 15.7}', '{"session_count": 10, "quiz_count": 6}'),
+('user_00000011', '{"age": 25, "region": "Kakamega", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 15, "avg_session_minutes": 21.7}', '{"session_count": 2, "quiz_count": 2}'),
+('user_00000012', '{"age": 17, "region": "Mombasa", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "weekly", "device": "desktop"}', '{"usual_hour": 15, "avg_session_minutes": 8.2}', '{"session_count": 6, "quiz_count": 2}'),
+('user_00000013', '{"age": 20, "region": "Kilifi", "education_level": "out_of_school"}', '{"preferred_source": "civic", "pace": "weekly", "device": "desktop"}', '{"usual_hour": 12, "avg_session_minutes": 18.5}', '{"session_count": 6, "quiz_count": 4}'),
+('user_00000014', '{"age": 23, "region": "Uasin Gishu", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "weekly", "device": "mobile"}', '{"usual_hour": 21, "avg_session_minutes": 15.5}', '{"session_count": 10, "quiz_count": 2}'),
+('user_00000015', '{"age": 18, "region": "Kilifi", "education_level": "secondary"}', '{"preferred_source": "financial", "pace": "weekly", "device": "tablet"}', '{"usual_hour": 19, "avg_session_minutes": 17.0}', '{"session_count": 2, "quiz_count": 2}'),
+('user_00000016', '{"age": 23, "region": "Nairobi", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 7, "avg_session_minutes": 18.9}', '{"session_count": 20, "quiz_count": 9}'),
+('user_00000017', '{"age": 19, "region": "Kisumu", "education_level": "secondary"}', '{"preferred_source": "financial", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 23, "avg_session_minutes": 16.3}', '{"session_count": 3, "quiz_count": 1}'),
+('user_00000018', '{"age": 24, "region": "Kiambu", "education_level": "secondary"}', '{"preferred_source": "financial", "pace": "intensive", "device": "mobile"}', '{"usual_hour": 20, "avg_session_minutes": 19.0}', '{"session_count": 29, "quiz_count": 21}'),
+('user_00000019', '{"age": 21, "region": "Kisumu", "education_level": "secondary"}', '{"preferred_source": "financial", "pace": "intensive", "device": "tablet"}', '{"usual_hour": 11, "avg_session_minutes": 29.8}', '{"session_count": 3, "quiz_count": 2}'),
+('user_00000020', '{"age": 21, "region": "Nakuru", "education_level": "primary"}', '{"preferred_source": "civic", "pace": "weekly", "device": "mobile"}', '{"usual_hour": 20, "avg_session_minutes": 12.5}', '{"session_count": 16, "quiz_count": 7}'),
+('user_00000021', '{"age": 17, "region": "Kakamega", "education_level": "tertiary"}', '{"preferred_source": "both", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 7, "avg_session_minutes": 13.8}', '{"session_count": 7, "quiz_count": 4}'),
+('user_00000022', '{"age": 20, "region": "Mombasa", "education_level": "tertiary"}', '{"preferred_source": "both", "pace": "self_paced", "device": "mobile"}', '{"usual_hour": 23, "avg_session_minutes": 24.6}', '{"session_count": 4, "quiz_count": 3}'),
+('user_00000023', '{"age": 24, "region": "Nyeri", "education_level": "primary"}', '{"preferred_source": "both", "pace": "intensive", "device": "tablet"}', '{"usual_hour": 18, "avg_session_minutes": 15.1}', '{"session_count": 6, "quiz_count": 1}'),
+('user_00000024', '{"age": 16, "region": "Mombasa", "education_level": "secondary"}', '{"preferred_source": "civic", "pace": "intensive", "device": "desktop"}', '{"usual_hour": 18, "avg_session_minutes": 16.6}', '{"session_count": 3, "quiz_count": 3}');
+
+INSERT INTO learning_sessions (session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp) VALUES
+('user_00000000_s0', 'user_00000000', '["The Constitution", "Governance and Leadership", "National Values", "Borrowing"]', '933', '{"clicks": 35, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-04-21 08:42:16'),
+('user_00000000_s1', 'user_00000000', '["Devolution and County Government", "Democracy and Participation", "Governance and Leadership"]', '920', '{"clicks": 22, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-03 09:29:23'),
+('user_00000001_s0', 'user_00000001', '["Types of Income", "Budgeting Basics", "Short-Term vs Long-Term Planning", "Avoiding Scams"]', '853', '{"clicks": 24, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-11 09:57:16'),
+('user_00000001_s1', 'user_00000001', '["Improving Literacy"]', '902', '{"clicks": 31, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-11 11:54:45'),
+('user_00000001_s2', 'user_00000001', '["Budgeting Basics", "Governance and Leadership"]', '2524', '{"clicks": 49, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-11 18:26:33'),
+('user_00000001_s3', 'user_00000001', '["Overview"]', '223', '{"clicks": 8, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-14 22:48:46'),
+('user_00000001_s4', 'user_00000001', '["Saving & Investing", "Spending Wisely", "Needs vs Wants"]', '270', '{"clicks": 5, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-15 07:48:32'),
+('user_00000001_s5', 'user_00000001', '["Types of Income"]', '649', '{"clicks": 17, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-16 12:37:55'),
+('user_00000001_s6', 'user_00000001', '["Governance and Leadership", "Overview"]', '907', '{"clicks": 22, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-12-24 20:24:10'),
+('user_00000001_s7', 'user_00000001', '["Avoiding Scams", "Democracy and Participation"]', '1361', '{"clicks": 32, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-27 07:20:02'),
+('user_00000001_s8', 'user_00000001', '["Earning Money"]', '1195', '{"clicks": 26, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-30 08:14:39'),
+('user_00000002_s0', 'user_00000002', '["Rights and Responsibilities"]', '714', '{"clicks": 15, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-03-10 09:55:25'),
+('user_00000002_s1', 'user_00000002', '["National Values", "The Constitution", "Rights and Responsibilities"]', '1658', '{"clicks": 46, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-03-11 19:01:15'),
+('user_00000002_s2', 'user_00000002', '["Understanding Citizenship", "Devolution and County Government", "Democracy and Participation", "National Values"]', '1669', '{"clicks": 47, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-05-07 11:56:09'),
+('user_00000002_s3', 'user_00000002', '["The Constitution"]', '1005', '{"clicks": 26, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-08-30 20:18:57'),
+('user_00000002_s4', 'user_00000002', '["Devolution and County Government", "Governance and Leadership"]', '1603', '{"clicks": 36, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-10-21 19:45:52'),
+('user_00000002_s5', 'user_00000002', '["Governance and Leadership"]', '1059', '{"clicks": 34, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-10-30 15:50:35'),
+('user_00000002_s6', 'user_00000002', '["National Values", "The Constitution", "Spending Wisely", "Understanding Citizenship"]', '642', '{"clicks": 21, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-10-30 21:44:41'),
+('user_00000002_s7', 'user_00000002', '["Devolution and County Government", "Types of Income"]', '1367', '{"clicks": 41, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-14 21:58:41'),
+('user_00000002_s8', 'user_00000002', '["Understanding Citizenship", "The Constitution", "Rights and Responsibilities", "National Values"]', '961', '{"clicks": 19, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-09 18:59:48'),
+('user_00000003_s0', 'user_00000003', '["Governance and Leadership"]', '900', '{"clicks": 28, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-02-13 11:06:18'),
+('user_00000003_s1', 'user_00000003', '["National Values"]', '2178', '{"clicks": 56, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-09-21 07:13:59'),
+('user_00000003_s2', 'user_00000003', '["Democracy and Participation", "Governance and Leadership", "Budgeting Basics"]', '206', '{"clicks": 11, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-11-07 18:45:45'),
+('user_00000004_s0', 'user_00000004', '["Earning Money", "Avoiding Scams", "The Value of Money"]', '384', '{"clicks": 11, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-05 20:37:34'),
+('user_00000004_s1', 'user_00000004', '["Saving & Investing", "Earning Money", "Needs vs Wants", "Types of Income"]', '441', '{"clicks": 14, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-08 08:28:50'),
+('user_00000004_s2', 'user_00000004', '["Improving Literacy", "Avoiding Scams", "The Value of Money", "Budgeting Basics"]', '723', '{"clicks": 17, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-17 07:27:23'),
+('user_00000004_s3', 'user_00000004', '["Protecting Assets", "Budgeting Basics", "Spending Wisely", "Types of Income"]', '772', '{"clicks": 23, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-20 22:14:24'),
+('user_00000004_s4', 'user_00000004', '["Needs vs Wants", "Budgeting Basics", "Borrowing"]', '364', '{"clicks": 12, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-24 22:41:59'),
+('user_00000005_s0', 'user_00000005', '["The Constitution", "Budgeting Basics"]', '498', '{"clicks": 12, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-08-12 06:38:41'),
+('user_00000005_s1', 'user_00000005', '["Saving & Investing", "Devolution and County Government"]', '536', '{"clicks": 12, "topics_viewed": 2, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 0}', '2024-12-07 21:36:22'),
+('user_00000006_s0', 'user_00000006', '["Governance and Leadership"]', '3931', '{"clicks": 98, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-06-14 11:17:11'),
+('user_00000006_s1', 'user_00000006', '["Governance and Leadership", "Democracy and Participation"]', '2652', '{"clicks": 84, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-06-17 16:21:45'),
+('user_00000006_s2', 'user_00000006', '["Democracy and Participation", "Improving Literacy"]', '702', '{"clicks": 12, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-07-16 17:17:21'),
+('user_00000006_s3', 'user_00000006', '["Democracy and Participation"]', '723', '{"clicks": 20, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-08-01 19:18:19'),
+('user_00000006_s4', 'user_00000006', '["National Values"]', '451', '{"clicks": 13, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-10-11 17:35:09'),
+('user_00000006_s5', 'user_00000006', '["Democracy and Participation", "Devolution and County Government", "The Constitution"]', '286', '{"clicks": 9, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-10-12 09:24:35'),
+('user_00000006_s6', 'user_00000006', '["Governance and Leadership", "Devolution and County Government"]', '839', '{"clicks": 17, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-11-01 18:15:28'),
+('user_00000006_s7', 'user_00000006', '["Understanding Citizenship", "Governance and Leadership", "Rights and Responsibilities", "The Value of Money"]', '494', '{"clicks": 11, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-11-01 18:39:26'),
+('user_00000006_s8', 'user_00000006', '["Governance and Leadership", "Devolution and County Government"]', '855', '{"clicks": 17, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-06 17:38:01'),
+('user_00000006_s9', 'user_00000006', '["Democracy and Participation", "Devolution and County Government", "Governance and Leadership", "National Values"]', '344', '{"clicks": 11, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-07 09:13:07'),
+('user_00000006_s10', 'user_00000006', '["Governance and Leadership", "Devolution and County Government", "The Value of Money"]', '569', '{"clicks": 12, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-27 20:27:42'),
+('user_00000007_s0', 'user_00000007', '["Devolution and County Government"]', '983', '{"clicks": 31, "topics_viewed": 1, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 1}', '2024-09-30 19:17:26'),
+('user_00000007_s1', 'user_00000007', '["Devolution and County Government"]', '1121', '{"clicks": 29, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-10-05 21:20:10'),
+('user_00000007_s2', 'user_00000007', '["Understanding Citizenship", "Democracy and Participation", "Governance and Leadership"]', '1156', '{"clicks": 30, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-10-06 14:41:59'),
+('user_00000007_s3', 'user_00000007', '["Devolution and County Government", "Democracy and Participation", "Understanding Citizenship"]', '407', '{"clicks": 15, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-10-08 02:48:57'),
+('user_00000007_s4', 'user_00000007', '["Democracy and Participation", "National Values"]', '1502', '{"clicks": 31, "topics_viewed": 2, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 1}', '2024-10-09 12:51:38'),
+('user_00000007_s5', 'user_00000007', '["Governance and Leadership", "Rights and Responsibilities", "The Constitution"]', '556', '{"clicks": 14, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-10-21 01:47:51'),
+('user_00000007_s6', 'user_00000007', '["Devolution and County Government", "Short-Term vs Long-Term Planning", "The Value of Money", "National Values"]', '1315', '{"clicks": 36, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-06 14:10:03'),
+('user_00000007_s7', 'user_00000007', '["National Values", "Governance and Leadership"]', '894', '{"clicks": 20, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-11-18 00:02:21'),
+('user_00000007_s8', 'user_00000007', '["National Values"]', '394', '{"clicks": 12, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-18 07:08:03'),
+('user_00000007_s9', 'user_00000007', '["The Constitution", "Rights and Responsibilities"]', '744', '{"clicks": 23, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-24 02:00:27'),
+('user_00000007_s10', 'user_00000007', '["The Constitution", "Democracy and Participation", "Governance and Leadership", "Devolution and County Government"]', '1120', '{"clicks": 30, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-26 20:14:04'),
+('user_00000007_s11', 'user_00000007', '["Understanding Citizenship", "Devolution and County Government", "Rights and Responsibilities", "Protecting Assets"]', '1300', '{"clicks": 39, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-12-01 01:50:21'),
+('user_00000007_s12', 'user_00000007', '["Devolution and County Government", "Understanding Citizenship", "The Constitution", "Short-Term vs Long-Term Planning"]', '826', '{"clicks": 28, "topics_viewed": 4, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 0}', '2024-12-09 19:21:57'),
+('user_00000007_s13', 'user_00000007', '["Governance and Leadership", "The Constitution", "Devolution and County Government", "Types of Income"]', '2256', '{"clicks": 53, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-25 00:08:17'),
+('user_00000007_s14', 'user_00000007', '["National Values"]', '1647', '{"clicks": 37, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-26 08:27:16'),
+('user_00000007_s15', 'user_00000007', '["Rights and Responsibilities", "Understanding Citizenship"]', '771', '{"clicks": 17, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-29 01:34:15'),
+('user_00000008_s0', 'user_00000008', '["Rights and Responsibilities"]', '1411', '{"clicks": 39, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-08-17 15:36:17'),
+('user_00000008_s1', 'user_00000008', '["Budgeting Basics"]', '2871', '{"clicks": 78, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-02 18:06:56'),
+('user_00000008_s2', 'user_00000008', '["Short-Term vs Long-Term Planning", "Avoiding Scams", "Rights and Responsibilities", "Types of Income"]', '2918', '{"clicks": 64, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-10 14:46:27'),
+('user_00000009_s0', 'user_00000009', '["Overview", "Governance and Leadership", "Avoiding Scams", "The Constitution"]', '430', '{"clicks": 10, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-03-24 18:06:55'),
+('user_00000009_s1', 'user_00000009', '["Needs vs Wants"]', '516', '{"clicks": 12, "topics_viewed": 1, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 1}', '2024-03-29 18:23:24'),
+('user_00000009_s2', 'user_00000009', '["Short-Term vs Long-Term Planning", "Protecting Assets", "Earning Money"]', '2193', '{"clicks": 55, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-05-14 19:27:02'),
+('user_00000010_s0', 'user_00000010', '["Budgeting Basics", "Overview", "Types of Income"]', '476', '{"clicks": 12, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-21 16:52:39'),
+('user_00000010_s1', 'user_00000010', '["Spending Wisely"]', '407', '{"clicks": 12, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-10-10 19:25:22'),
+('user_00000010_s2', 'user_00000010', '["Protecting Assets", "Avoiding Scams", "Budgeting Basics", "Short-Term vs Long-Term Planning"]', '672', '{"clicks": 20, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-10-19 16:59:54'),
+('user_00000010_s3', 'user_00000010', '["Saving & Investing", "Needs vs Wants", "Spending Wisely", "Democracy and Participation"]', '1158', '{"clicks": 30, "topics_viewed": 4, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 1}', '2024-10-21 15:37:10'),
+('user_00000010_s4', 'user_00000010', '["Improving Literacy", "Protecting Assets", "Budgeting Basics"]', '846', '{"clicks": 25, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-10-30 10:01:35'),
+('user_00000010_s5', 'user_00000010', '["Avoiding Scams", "Overview", "Budgeting Basics"]', '609', '{"clicks": 20, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-10-31 10:09:14'),
+('user_00000010_s6', 'user_00000010', '["Overview", "Protecting Assets"]', '600', '{"clicks": 17, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-01 10:17:11'),
+('user_00000010_s7', 'user_00000010', '["Avoiding Scams", "Borrowing", "Spending Wisely", "Improving Literacy"]', '586', '{"clicks": 14, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-11-18 16:24:03'),
+('user_00000010_s8', 'user_00000010', '["The Value of Money", "Earning Money"]', '530', '{"clicks": 25, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-11-21 10:11:33'),
+('user_00000010_s9', 'user_00000010', '["Short-Term vs Long-Term Planning", "Overview", "Saving & Investing", "The Value of Money"]', '3538', '{"clicks": 97, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-23 10:56:45'),
+('user_00000011_s0', 'user_00000011', '["Democracy and Participation"]', '1075', '{"clicks": 22, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-07-08 16:55:58'),
+('user_00000011_s1', 'user_00000011', '["Governance and Leadership"]', '1532', '{"clicks": 39, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-07-25 14:17:22'),
+('user_00000012_s0', 'user_00000012', '["The Constitution", "Rights and Responsibilities", "National Values", "Borrowing"]', '671', '{"clicks": 22, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-08-23 14:58:50'),
+('user_00000012_s1', 'user_00000012', '["National Values", "Rights and Responsibilities"]', '804', '{"clicks": 23, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-10-20 15:04:10'),
+('user_00000012_s2', 'user_00000012', '["Rights and Responsibilities", "The Constitution"]', '586', '{"clicks": 24, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-10-21 15:37:57'),
+('user_00000012_s3', 'user_00000012', '["Devolution and County Government", "National Values", "Rights and Responsibilities", "Understanding Citizenship"]', '183', '{"clicks": 7, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-11-02 15:08:16'),
+('user_00000012_s4', 'user_00000012', '["Understanding Citizenship"]', '393', '{"clicks": 11, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-03 15:35:18'),
+('user_00000012_s5', 'user_00000012', '["The Constitution", "Rights and Responsibilities", "National Values"]', '303', '{"clicks": 7, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-11-11 14:56:18'),
+('user_00000013_s0', 'user_00000013', '["Democracy and Participation", "National Values"]', '233', '{"clicks": 8, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-14 12:47:26'),
+('user_00000013_s1', 'user_00000013', '["Democracy and Participation"]', '439', '{"clicks": 16, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-15 21:13:24'),
+('user_00000013_s2', 'user_00000013', '["Understanding Citizenship", "Rights and Responsibilities", "Devolution and County Government", "The Constitution"]', '1992', '{"clicks": 43, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-17 12:28:34'),
+('user_00000013_s3', 'user_00000013', '["Governance and Leadership"]', '876', '{"clicks": 22, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-20 13:16:14'),
+('user_00000013_s4', 'user_00000013', '["National Values"]', '1952', '{"clicks": 45, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-22 08:53:05'),
+('user_00000013_s5', 'user_00000013', '["Rights and Responsibilities", "Devolution and County Government", "Governance and Leadership"]', '1151', '{"clicks": 29, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-26 10:14:57'),
+('user_00000014_s0', 'user_00000014', '["National Values", "Needs vs Wants", "Devolution and County Government", "Overview"]', '1439', '{"clicks": 35, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-11 19:09:20'),
+('user_00000014_s1', 'user_00000014', '["Rights and Responsibilities"]', '524', '{"clicks": 8, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-16 15:30:23'),
+('user_00000014_s2', 'user_00000014', '["Rights and Responsibilities", "Governance and Leadership", "National Values"]', '1232', '{"clicks": 32, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-17 09:34:32'),
+('user_00000014_s3', 'user_00000014', '["The Constitution", "Understanding Citizenship", "National Values"]', '1393', '{"clicks": 37, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-17 12:39:48'),
+('user_00000014_s4', 'user_00000014', '["Democracy and Participation", "Governance and Leadership", "Rights and Responsibilities", "The Constitution"]', '636', '{"clicks": 13, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-17 22:49:57'),
+('user_00000014_s5', 'user_00000014', '["Devolution and County Government"]', '1259', '{"clicks": 18, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-24 20:27:09'),
+('user_00000014_s6', 'user_00000014', '["Understanding Citizenship", "National Values", "Borrowing", "Democracy and Participation"]', '1264', '{"clicks": 34, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-25 23:10:34'),
+('user_00000014_s7', 'user_00000014', '["Governance and Leadership", "The Constitution", "Understanding Citizenship"]', '647', '{"clicks": 23, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-27 19:25:24'),
+('user_00000014_s8', 'user_00000014', '["Rights and Responsibilities", "Understanding Citizenship", "Devolution and County Government", "Democracy and Participation"]', '458', '{"clicks": 11, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-28 15:06:42'),
+('user_00000014_s9', 'user_00000014', '["Rights and Responsibilities", "Understanding Citizenship"]', '442', '{"clicks": 11, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-29 22:42:39'),
+('user_00000015_s0', 'user_00000015', '["Protecting Assets", "Short-Term vs Long-Term Planning", "Spending Wisely", "Saving & Investing"]', '947', '{"clicks": 31, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-05-26 18:14:37'),
+('user_00000015_s1', 'user_00000015', '["Short-Term vs Long-Term Planning", "Improving Literacy", "Protecting Assets"]', '1095', '{"clicks": 24, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-06-05 18:33:07'),
+('user_00000016_s0', 'user_00000016', '["The Constitution"]', '559', '{"clicks": 7, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-10-08 08:01:25'),
+('user_00000016_s1', 'user_00000016', '["The Constitution", "Governance and Leadership", "Understanding Citizenship", "National Values"]', '914', '{"clicks": 19, "topics_viewed": 4, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 0}', '2024-10-11 07:17:42'),
+('user_00000016_s2', 'user_00000016', '["Saving & Investing", "Understanding Citizenship", "Improving Literacy", "Governance and Leadership"]', '1267', '{"clicks": 33, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-10-17 11:41:00'),
+('user_00000016_s3', 'user_00000016', '["The Constitution", "Understanding Citizenship"]', '1304', '{"clicks": 31, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-10-20 00:06:21'),
+('user_00000016_s4', 'user_00000016', '["National Values", "The Constitution", "Governance and Leadership"]', '2283', '{"clicks": 67, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-10-21 17:39:09'),
+('user_00000016_s5', 'user_00000016', '["Governance and Leadership", "Rights and Responsibilities"]', '1936', '{"clicks": 38, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-10-31 12:41:10'),
+('user_00000016_s6', 'user_00000016', '["Governance and Leadership", "Avoiding Scams", "Democracy and Participation"]', '493', '{"clicks": 17, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-11-02 17:19:05'),
+('user_00000016_s7', 'user_00000016', '["National Values", "The Constitution", "Improving Literacy", "Protecting Assets"]', '2471', '{"clicks": 56, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-02 19:00:04'),
+('user_00000016_s8', 'user_00000016', '["Devolution and County Government", "Democracy and Participation", "National Values", "Governance and Leadership"]', '654', '{"clicks": 20, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-11-04 07:47:47'),
+('user_00000016_s9', 'user_00000016', '["Democracy and Participation"]', '1684', '{"clicks": 34, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-11-07 06:43:40'),
+('user_00000016_s10', 'user_00000016', '["Democracy and Participation", "Rights and Responsibilities", "Governance and Leadership", "Understanding Citizenship"]', '937', '{"clicks": 23, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-11-08 17:30:59'),
+('user_00000016_s11', 'user_00000016', '["National Values", "Understanding Citizenship"]', '702', '{"clicks": 19, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-11-27 23:05:42'),
+('user_00000016_s12', 'user_00000016', '["Devolution and County Government", "Democracy and Participation", "Rights and Responsibilities"]', '304', '{"clicks": 10, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-05 13:17:49'),
+('user_00000016_s13', 'user_00000016', '["Rights and Responsibilities", "Devolution and County Government", "Democracy and Participation", "National Values"]', '811', '{"clicks": 23, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-12-09 19:59:31'),
+('user_00000016_s14', 'user_00000016', '["Governance and Leadership", "Democracy and Participation"]', '353', '{"clicks": 9, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-12 08:19:13'),
+('user_00000016_s15', 'user_00000016', '["Rights and Responsibilities", "Democracy and Participation"]', '1608', '{"clicks": 28, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-12-17 08:59:57'),
+('user_00000016_s16', 'user_00000016', '["Rights and Responsibilities", "The Constitution"]', '2236', '{"clicks": 61, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-12-18 08:30:02'),
+('user_00000016_s17', 'user_00000016', '["Understanding Citizenship", "Governance and Leadership", "Borrowing", "Rights and Responsibilities"]', '557', '{"clicks": 8, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-19 14:01:54'),
+('user_00000016_s18', 'user_00000016', '["Understanding Citizenship", "Rights and Responsibilities"]', '1078', '{"clicks": 24, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-12-28 15:07:05'),
+('user_00000016_s19', 'user_00000016', '["Governance and Leadership", "National Values"]', '582', '{"clicks": 16, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-12-31 08:58:35'),
+('user_00000017_s0', 'user_00000017', '["Avoiding Scams", "The Value of Money"]', '617', '{"clicks": 14, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-10-03 00:10:40'),
+('user_00000017_s1', 'user_00000017', '["Types of Income"]', '1432', '{"clicks": 41, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-11-09 18:25:29'),
+('user_00000017_s2', 'user_00000017', '["Short-Term vs Long-Term Planning", "Budgeting Basics"]', '879', '{"clicks": 20, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-11-18 22:27:40'),
+('user_00000018_s0', 'user_00000018', '["The Value of Money"]', '2555', '{"clicks": 84, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-06-23 21:12:35'),
+('user_00000018_s1', 'user_00000018', '["Protecting Assets"]', '673', '{"clicks": 13, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-06-29 14:10:02'),
+('user_00000018_s2', 'user_00000018', '["Improving Literacy", "Overview", "Short-Term vs Long-Term Planning"]', '1639', '{"clicks": 35, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-07-06 20:24:59'),
+('user_00000018_s3', 'user_00000018', '["Types of Income"]', '954', '{"clicks": 17, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-07-07 21:34:11'),
+('user_00000018_s4', 'user_00000018', '["The Value of Money", "Borrowing", "Types of Income"]', '1450', '{"clicks": 39, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 0.0, "completed": true, "questions_answered": 3, "correct_answers": 0}', '2024-07-18 20:54:21'),
+('user_00000018_s5', 'user_00000018', '["Protecting Assets", "Short-Term vs Long-Term Planning", "Overview", "Earning Money"]', '688', '{"clicks": 22, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-07-20 21:44:55'),
+('user_00000018_s6', 'user_00000018', '["Improving Literacy", "Types of Income", "Saving & Investing"]', '873', '{"clicks": 31, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-07-22 19:40:20'),
+('user_00000018_s7', 'user_00000018', '["Overview", "Types of Income"]', '839', '{"clicks": 20, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-07-23 20:45:47'),
+('user_00000018_s8', 'user_00000018', '["Improving Literacy"]', '544', '{"clicks": 14, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-07-26 13:42:52'),
+('user_00000018_s9', 'user_00000018', '["Earning Money", "Budgeting Basics", "Spending Wisely", "Protecting Assets"]', '1338', '{"clicks": 34, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-07-31 21:03:05'),
+('user_00000018_s10', 'user_00000018', '["The Value of Money", "Short-Term vs Long-Term Planning", "Budgeting Basics", "Avoiding Scams"]', '1329', '{"clicks": 37, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-08-05 20:29:28'),
+('user_00000018_s11', 'user_00000018', '["The Value of Money", "Borrowing", "Overview"]', '1285', '{"clicks": 30, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-08-07 21:52:44'),
+('user_00000018_s12', 'user_00000018', '["The Value of Money"]', '2263', '{"clicks": 68, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-08-16 20:13:19'),
+('user_00000018_s13', 'user_00000018', '["Protecting Assets"]', '2147', '{"clicks": 57, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-09-05 20:56:11'),
+('user_00000018_s14', 'user_00000018', '["Earning Money", "Budgeting Basics"]', '718', '{"clicks": 17, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-13 21:19:17'),
+('user_00000018_s15', 'user_00000018', '["Overview"]', '1125', '{"clicks": 27, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-09-15 20:49:16'),
+('user_00000018_s16', 'user_00000018', '["Saving & Investing", "Improving Literacy", "The Value of Money", "Overview"]', '619', '{"clicks": 19, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-09-20 20:14:06'),
+('user_00000018_s17', 'user_00000018', '["Overview"]', '912', '{"clicks": 22, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-24 14:08:38'),
+('user_00000018_s18', 'user_00000018', '["The Value of Money", "Improving Literacy"]', '628', '{"clicks": 21, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-09-24 19:53:34'),
+('user_00000018_s19', 'user_00000018', '["Saving & Investing", "Borrowing", "Budgeting Basics", "Overview"]', '2379', '{"clicks": 53, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-30 19:22:07'),
+('user_00000018_s20', 'user_00000018', '["Improving Literacy", "Borrowing", "Overview", "Avoiding Scams"]', '1119', '{"clicks": 33, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-10-06 21:47:14'),
+('user_00000018_s21', 'user_00000018', '["Types of Income"]', '789', '{"clicks": 22, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-10-12 21:16:02'),
+('user_00000018_s22', 'user_00000018', '["Protecting Assets", "Saving & Investing"]', '1841', '{"clicks": 55, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-14 19:23:40'),
+('user_00000018_s23', 'user_00000018', '["Avoiding Scams", "Saving & Investing", "Earning Money"]', '244', '{"clicks": 4, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-11-30 12:21:12'),
+('user_00000018_s24', 'user_00000018', '["Overview", "Short-Term vs Long-Term Planning", "Types of Income"]', '268', '{"clicks": 9, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-11-30 20:40:52'),
+('user_00000018_s25', 'user_00000018', '["Short-Term vs Long-Term Planning", "Needs vs Wants", "Saving & Investing", "Protecting Assets"]', '1450', '{"clicks": 40, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-01 21:54:56'),
+('user_00000018_s26', 'user_00000018', '["Spending Wisely", "Overview", "Needs vs Wants", "Earning Money"]', '933', '{"clicks": 21, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-13 21:48:05'),
+('user_00000018_s27', 'user_00000018', '["Spending Wisely", "Short-Term vs Long-Term Planning", "Types of Income", "The Value of Money"]', '1045', '{"clicks": 33, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-12-29 21:19:25'),
+('user_00000018_s28', 'user_00000018', '["Protecting Assets"]', '406', '{"clicks": 14, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-30 21:49:55'),
+('user_00000019_s0', 'user_00000019', '["Protecting Assets"]', '887', '{"clicks": 25, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-09-08 12:05:45'),
+('user_00000019_s1', 'user_00000019', '["Improving Literacy", "Protecting Assets", "Overview"]', '2994', '{"clicks": 66, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-09-12 08:19:33'),
+('user_00000019_s2', 'user_00000019', '["The Value of Money"]', '1475', '{"clicks": 41, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-09-18 10:09:12'),
+('user_00000020_s0', 'user_00000020', '["Democracy and Participation", "Understanding Citizenship"]', '996', '{"clicks": 25, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-05-28 18:32:01'),
+('user_00000020_s1', 'user_00000020', '["Rights and Responsibilities"]', '691', '{"clicks": 14, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-08-01 11:02:05'),
+('user_00000020_s2', 'user_00000020', '["National Values", "Needs vs Wants", "Protecting Assets", "Improving Literacy"]', '710', '{"clicks": 13, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-08-01 12:30:36'),
+('user_00000020_s3', 'user_00000020', '["Devolution and County Government"]', '250', '{"clicks": 7, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-08-07 20:16:50'),
+('user_00000020_s4', 'user_00000020', '["Rights and Responsibilities"]', '1050', '{"clicks": 33, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-09-03 19:13:36'),
+('user_00000020_s5', 'user_00000020', '["Democracy and Participation"]', '1494', '{"clicks": 36, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-07 20:20:17'),
+('user_00000020_s6', 'user_00000020', '["Governance and Leadership"]', '349', '{"clicks": 9, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-09-08 20:26:10'),
+('user_00000020_s7', 'user_00000020', '["Democracy and Participation", "National Values", "Devolution and County Government"]', '605', '{"clicks": 26, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-14 21:39:08'),
+('user_00000020_s8', 'user_00000020', '["National Values", "Rights and Responsibilities"]', '449', '{"clicks": 11, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-09-16 21:04:03'),
+('user_00000020_s9', 'user_00000020', '["Rights and Responsibilities", "The Constitution", "Devolution and County Government", "Understanding Citizenship"]', '504', '{"clicks": 10, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-27 21:46:28'),
+('user_00000020_s10', 'user_00000020', '["Devolution and County Government", "Rights and Responsibilities"]', '929', '{"clicks": 22, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-11-07 19:18:28'),
+('user_00000020_s11', 'user_00000020', '["Devolution and County Government", "Borrowing", "Improving Literacy"]', '257', '{"clicks": 7, "topics_viewed": 3, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 0}', '2024-11-08 21:00:01'),
+('user_00000020_s12', 'user_00000020', '["Understanding Citizenship", "National Values", "Saving & Investing"]', '1301', '{"clicks": 33, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-11-26 19:03:10'),
+('user_00000020_s13', 'user_00000020', '["The Constitution", "Democracy and Participation", "National Values"]', '1414', '{"clicks": 26, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-11-27 10:05:12'),
+('user_00000020_s14', 'user_00000020', '["National Values", "Democracy and Participation", "Devolution and County Government", "Needs vs Wants"]', '774', '{"clicks": 9, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-11-27 21:05:55'),
+('user_00000020_s15', 'user_00000020', '["National Values"]', '203', '{"clicks": 4, "topics_viewed": 1, "quiz_attempts": 1}', '{"completed": false, "questions_answered": 2}', '2024-12-11 21:51:02'),
+('user_00000021_s0', 'user_00000021', '["Devolution and County Government", "Types of Income", "Overview"]', '494', '{"clicks": 10, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-09-04 09:44:48'),
+('user_00000021_s1', 'user_00000021', '["National Values", "Understanding Citizenship", "Types of Income", "Budgeting Basics"]', '1885', '{"clicks": 53, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 33.3, "completed": true, "questions_answered": 3, "correct_answers": 1}', '2024-09-14 17:01:34'),
+('user_00000021_s2', 'user_00000021', '["Budgeting Basics", "Overview", "The Constitution", "Spending Wisely"]', '169', '{"clicks": 4, "topics_viewed": 4, "quiz_attempts": 0}', '{}', '2024-09-16 17:03:54'),
+('user_00000021_s3', 'user_00000021', '["The Value of Money", "Democracy and Participation", "Avoiding Scams"]', '730', '{"clicks": 24, "topics_viewed": 3, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-10-05 07:08:48'),
+('user_00000021_s4', 'user_00000021', '["Democracy and Participation", "Improving Literacy", "Budgeting Basics"]', '443', '{"clicks": 8, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-10-13 16:49:23'),
+('user_00000021_s5', 'user_00000021', '["Devolution and County Government", "Earning Money", "Saving & Investing", "Understanding Citizenship"]', '1458', '{"clicks": 43, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-13 21:10:04'),
+('user_00000021_s6', 'user_00000021', '["Budgeting Basics", "Spending Wisely", "Governance and Leadership"]', '600', '{"clicks": 12, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-21 07:20:31'),
+('user_00000022_s0', 'user_00000022', '["Rights and Responsibilities", "Governance and Leadership", "Improving Literacy", "Borrowing"]', '1146', '{"clicks": 30, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-20 12:51:38'),
+('user_00000022_s1', 'user_00000022', '["Budgeting Basics"]', '1263', '{"clicks": 36, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-12-23 23:33:11'),
+('user_00000022_s2', 'user_00000022', '["Avoiding Scams", "Protecting Assets"]', '2708', '{"clicks": 73, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-25 14:49:23'),
+('user_00000022_s3', 'user_00000022', '["Governance and Leadership"]', '796', '{"clicks": 19, "topics_viewed": 1, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-12-31 22:16:06'),
+('user_00000023_s0', 'user_00000023', '["Governance and Leadership"]', '1127', '{"clicks": 23, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-01-04 14:27:17'),
+('user_00000023_s1', 'user_00000023', '["The Constitution", "Short-Term vs Long-Term Planning"]', '369', '{"clicks": 12, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-04-12 18:49:09'),
+('user_00000023_s2', 'user_00000023', '["Needs vs Wants"]', '1838', '{"clicks": 49, "topics_viewed": 1, "quiz_attempts": 0}', '{}', '2024-08-07 03:32:20'),
+('user_00000023_s3', 'user_00000023', '["The Value of Money", "Improving Literacy"]', '570', '{"clicks": 20, "topics_viewed": 2, "quiz_attempts": 0}', '{}', '2024-08-20 17:05:33'),
+('user_00000023_s4', 'user_00000023', '["Needs vs Wants", "Protecting Assets"]', '642', '{"clicks": 16, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-09-14 17:02:36'),
+('user_00000023_s5', 'user_00000023', '["The Constitution", "National Values", "Rights and Responsibilities"]', '888', '{"clicks": 22, "topics_viewed": 3, "quiz_attempts": 0}', '{}', '2024-12-25 21:25:24'),
+('user_00000024_s0', 'user_00000024', '["Devolution and County Government", "National Values", "Rights and Responsibilities", "The Constitution"]', '352', '{"clicks": 13, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-11-05 18:32:44'),
+('user_00000024_s1', 'user_00000024', '["The Constitution", "Understanding Citizenship", "Governance and Leadership", "National Values"]', '1032', '{"clicks": 30, "topics_viewed": 4, "quiz_attempts": 1}', '{"score": 100.0, "completed": true, "questions_answered": 3, "correct_answers": 3}', '2024-11-20 20:23:40'),
+('user_00000024_s2', 'user_00000024', '["Understanding Citizenship", "Governance and Leadership"]', '1608', '{"clicks": 45, "topics_viewed": 2, "quiz_attempts": 1}', '{"score": 66.7, "completed": true, "questions_answered": 3, "correct_answers": 2}', '2024-12-05 18:44:16');
+
+INSERT INTO user_analytics_data (user_id, engineered_features, cluster_label, predictions, recommendations, insights) VALUES
+('user_00000000', '{"session_count": 2, "total_time_spent_minutes": 30.88, "avg_score": 66.7, "distinct_content_count": 6, "last_active": "2024-12-03T09:29:23"}', '1', '{"performance": 0.552}', '[{"content_id": "Borrowing"}]', '{"summary": "Developing"}'),
+('user_00000001', '{"session_count": 9, "total_time_spent_minutes": 148.07, "avg_score": 66.66, "distinct_content_count": 12, "last_active": "2024-12-30T08:14:39"}', '2', '{"performance": 0.646}', '[{"content_id": "Short-Term vs Long-Term Planning"}]', '{"summary": "Progressing"}'),
+('user_00000002', '{"session_count": 9, "total_time_spent_minutes": 177.97, "avg_score": 77.8, "distinct_content_count": 9, "last_active": "2024-12-09T18:59:48"}', '2', '{"performance": 0.713}', '[{"content_id": "The Constitution"}]', '{"summary": "Progressing"}'),
+('user_00000003', '{"session_count": 3, "total_time_spent_minutes": 54.73, "avg_score": 100.0, "distinct_content_count": 4, "last_active": "2024-11-07T18:45:45"}', '2', '{"performance": 0.627}', '[{"content_id": "The Value of Money"}]', '{"summary": "Progressing"}'),
+('user_00000004', '{"session_count": 5, "total_time_spent_minutes": 44.73, "avg_score": 83.35, "distinct_content_count": 11, "last_active": "2024-12-24T22:41:59"}', '2', '{"performance": 0.747}', '[{"content_id": "Overview"}]', '{"summary": "Progressing"}'),
+('user_00000005', '{"session_count": 2, "total_time_spent_minutes": 17.23, "avg_score": 66.7, "distinct_content_count": 4, "last_active": "2024-12-07T21:36:22"}', '3', '{"performance": 0.804}', '[{"content_id": "Earning Money"}]', '{"summary": "Excelling"}'),
+('user_00000006', '{"session_count": 11, "total_time_spent_minutes": 197.43, "avg_score": 71.43, "distinct_content_count": 9, "last_active": "2024-12-27T20:27:42"}', '2', '{"performance": 0.628}', '[{"content_id": "The Value of Money"}]', '{"summary": "Progressing"}'),
+('user_00000007', '{"session_count": 16, "total_time_spent_minutes": 283.2, "avg_score": 33.32, "distinct_content_count": 11, "last_active": "2024-12-29T01:34:15"}', '1', '{"performance": 0.464}', '[{"content_id": "Devolution and County Government"}]', '{"summary": "Developing"}'),
+('user_00000008', '{"session_count": 3, "total_time_spent_minutes": 120.0, "avg_score": 66.7, "distinct_content_count": 5, "last_active": "2024-09-10T14:46:27"}', '2', '{"performance": 0.748}', '[{"content_id": "Needs vs Wants"}]', '{"summary": "Progressing"}'),
+('user_00000009', '{"session_count": 3, "total_time_spent_minutes": 52.32, "avg_score": 100.0, "distinct_content_count": 8, "last_active": "2024-05-14T19:27:02"}', '3', '{"performance": 0.86}', '[{"content_id": "Spending Wisely"}]', '{"summary": "Excelling"}'),
+('user_00000010', '{"session_count": 10, "total_time_spent_minutes": 157.03, "avg_score": 55.57, "distinct_content_count": 14, "last_active": "2024-11-23T10:56:45"}', '1', '{"performance": 0.52}', '[{"content_id": "National Values"}]', '{"summary": "Developing"}'),
+('user_00000011', '{"session_count": 2, "total_time_spent_minutes": 43.45, "avg_score": 66.7, "distinct_content_count": 2, "last_active": "2024-07-25T14:17:22"}', '2', '{"performance": 0.627}', '[{"content_id": "National Values"}]', '{"summary": "Progressing"}'),
+('user_00000012', '{"session_count": 6, "total_time_spent_minutes": 49.0, "avg_score": 83.35, "distinct_content_count": 6, "last_active": "2024-11-11T14:56:18"}', '3', '{"performance": 0.867}', '[{"content_id": "Earning Money"}]', '{"summary": "Excelling"}'),
+('user_00000013', '{"session_count": 6, "total_time_spent_minutes": 110.72, "avg_score": 41.65, "distinct_content_count": 7, "last_active": "2024-12-26T10:14:57"}', '2', '{"performance": 0.614}', '[{"content_id": "Short-Term vs Long-Term Planning"}]', '{"summary": "Progressing"}'),
+('user_00000014', '{"session_count": 10, "total_time_spent_minutes": 154.9, "avg_score": 66.65, "distinct_content_count": 10, "last_active": "2024-12-29T22:42:39"}', '3', '{"performance": 0.814}', '[{"content_id": "The Constitution"}]', '{"summary": "Excelling"}'),
+('user_00000015', '{"session_count": 2, "total_time_spent_minutes": 34.03, "avg_score": 33.3, "distinct_content_count": 5, "last_active": "2024-06-05T18:33:07"}', '1', '{"performance": 0.54}', '[{"content_id": "Budgeting Basics"}]', '{"summary": "Developing"}'),
+('user_00000016', '{"session_count": 20, "total_time_spent_minutes": 378.88, "avg_score": 33.32, "distinct_content_count": 12, "last_active": "2024-12-31T08:58:35"}', '1', '{"performance": 0.452}', '[{"content_id": "Types of Income"}]', '{"summary": "Developing"}'),
+('user_00000017', '{"session_count": 3, "total_time_spent_minutes": 48.8, "avg_score": 100.0, "distinct_content_count": 5, "last_active": "2024-11-18T22:27:40"}', '2', '{"performance": 0.616}', '[{"content_id": "Spending Wisely"}]', '{"summary": "Progressing"}'),
+('user_00000018', '{"session_count": 29, "total_time_spent_minutes": 550.88, "avg_score": 61.92, "distinct_content_count": 13, "last_active": "2024-12-30T21:49:55"}', '2', '{"performance": 0.712}', '[{"content_id": "Saving & Investing"}]', '{"summary": "Progressing"}'),
+('user_00000019', '{"session_count": 3, "total_time_spent_minutes": 89.27, "avg_score": 33.3, "distinct_content_count": 4, "last_active": "2024-09-18T10:09:12"}', '2', '{"performance": 0.632}', '[{"content_id": "National Values"}]', '{"summary": "Progressing"}'),
+('user_00000020', '{"session_count": 16, "total_time_spent_minutes": 199.6, "avg_score": 80.97, "distinct_content_count": 12, "last_active": "2024-12-11T21:51:02"}', '3', '{"performance": 0.782}', '[{"content_id": "The Constitution"}]', '{"summary": "Excelling"}'),
+('user_00000021', '{"session_count": 7, "total_time_spent_minutes": 96.32, "avg_score": 50.0, "distinct_content_count": 15, "last_active": "2024-12-21T07:20:31"}', '1', '{"performance": 0.49}', '[{"content_id": "Borrowing"}]', '{"summary": "Developing"}'),
+('user_00000022', '{"session_count": 4, "total_time_spent_minutes": 98.55, "avg_score": 88.9, "distinct_content_count": 7, "last_active": "2024-12-31T22:16:06"}', '3', '{"performance": 0.761}', '[{"content_id": "Short-Term vs Long-Term Planning"}]', '{"summary": "Excelling"}'),
+('user_00000023', '{"session_count": 6, "total_time_spent_minutes": 90.57, "avg_score": 66.7, "distinct_content_count": 9, "last_active": "2024-12-25T21:25:24"}', '2', '{"performance": 0.634}', '[{"content_id": "Budgeting Basics"}]', '{"summary": "Progressing"}'),
+('user_00000024', '{"session_count": 3, "total_time_spent_minutes": 49.87, "avg_score": 77.8, "distinct_content_count": 6, "last_active": "2024-12-05T18:44:16"}', '2', '{"performance": 0.73}', '[{"content_id": "Earning Money"}]', '{"summary": "Progressing"}');
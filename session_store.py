@@ -0,0 +1,268 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from startup import lazy_import
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; sessions are then written as JSON
+    msgpack = None
+
+redis = lazy_import("redis")
+
+# Encoded blobs start with a format byte so the encoding can change without
+# invalidating sessions written by older replicas. Every replica can read JSON;
+# install msgpack on all replicas before any of them starts writing it.
+FORMAT_JSON = b"\x00"
+FORMAT_JSON_ZLIB = b"\x01"
+FORMAT_MSGPACK = b"\x02"
+FORMAT_MSGPACK_ZLIB = b"\x03"
+# Payloads smaller than this aren't worth compressing
+COMPRESS_MIN_BYTES = 256
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_FLUSH_INTERVAL = 0.2
+# Sessions whose last written digest is remembered, to skip unchanged saves
+DEFAULT_MAX_TRACKED_SESSIONS = 10_000
+
+
+def encode_state(state: Dict[str, Any], use_msgpack: Optional[bool] = None) -> bytes:
+    """
+    Encodes learner state as MessagePack, or compact JSON where msgpack isn't
+    installed, zlib-compressed when that pays off.
+
+    MessagePack stores floats and ints in binary rather than as text, so a review
+    schedule full of due times decodes faster and is smaller before compression.
+
+    Args:
+        state (dict): JSON-compatible session values. Tuples come back as lists.
+        use_msgpack (bool): Force the encoding; defaults to msgpack when importable.
+
+    Returns:
+        bytes: Format byte followed by the payload.
+    """
+    if use_msgpack is None:
+        use_msgpack = msgpack is not None
+    if use_msgpack:
+        payload = msgpack.packb(state, use_bin_type=True, default=str)
+        fmt, fmt_zlib = FORMAT_MSGPACK, FORMAT_MSGPACK_ZLIB
+    else:
+        payload = json.dumps(state, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+        fmt, fmt_zlib = FORMAT_JSON, FORMAT_JSON_ZLIB
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(payload, 6)
+        if len(compressed) < len(payload):
+            return fmt_zlib + compressed
+    return fmt + payload
+
+
+def decode_state(blob: bytes) -> Dict[str, Any]:
+    """Decodes a blob written by encode_state in any of its formats."""
+    fmt, payload = blob[:1], blob[1:]
+    if fmt in (FORMAT_JSON_ZLIB, FORMAT_MSGPACK_ZLIB):
+        payload = zlib.decompress(payload)
+    if fmt in (FORMAT_MSGPACK, FORMAT_MSGPACK_ZLIB):
+        if msgpack is None:
+            raise ValueError("Session was written as MessagePack but msgpack isn't installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if fmt not in (FORMAT_JSON, FORMAT_JSON_ZLIB):
+        raise ValueError(f"Unknown session encoding {fmt!r}")
+    return json.loads(payload)
+
+
+class SQLiteSessionBackend:
+    """Session blobs in a local SQLite file, for single-node deployments and development."""
+
+    def __init__(self, path: str, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS learner_sessions ("
+            "sid TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("DELETE FROM learner_sessions WHERE expires_at < ?", (time.time(),))
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, and every script run is its own thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, sid: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT data FROM learner_sessions WHERE sid = ? AND expires_at >= ?", (sid, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_many(self, blobs: Dict[str, bytes]):
+        expires_at = time.time() + self.ttl_seconds
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO learner_sessions (sid, data, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (sid) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at",
+                [(sid, blob, expires_at) for sid, blob in blobs.items()],
+            )
+
+    def delete(self, sid: str):
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM learner_sessions WHERE sid = ?", (sid,))
+
+
+class RedisSessionBackend:
+    """Session blobs in Redis or any server speaking its protocol (Valkey, KeyDB, Dragonfly)."""
+
+    def __init__(self, url: str, ttl_seconds: int = DEFAULT_TTL_SECONDS, prefix: str = "lms:session:"):
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, sid: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + sid)
+
+    def set_many(self, blobs: Dict[str, bytes]):
+        pipe = self.client.pipeline(transaction=False)
+        for sid, blob in blobs.items():
+            pipe.set(self.prefix + sid, blob, ex=self.ttl_seconds)
+        pipe.execute()
+
+    def delete(self, sid: str):
+        self.client.delete(self.prefix + sid)
+
+
+class SessionStore:
+    """
+    Learner state kept outside the app process so any replica can serve any session.
+
+    Saves are coalesced: each save replaces the session's pending blob, and a
+    background thread writes all pending blobs in one batch every flush_interval
+    seconds. A session whose state hasn't changed since its last write is skipped;
+    the digests that check uses are kept for the max_tracked_sessions most recently
+    used sessions only, so an idle session costs nothing once it falls out.
+    """
+
+    def __init__(self, backend, keys: Iterable[str], flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_tracked_sessions: int = DEFAULT_MAX_TRACKED_SESSIONS):
+        self.backend = backend
+        self.keys = tuple(keys)
+        self.flush_interval = flush_interval
+        self.max_tracked_sessions = max_tracked_sessions
+        self._pending: Dict[str, bytes] = {}
+        self._written_digests: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="session-store-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def load(self, sid: str) -> Dict[str, Any]:
+        """Returns the stored state for sid, or an empty dict for a new session."""
+        with self._lock:
+            blob = self._pending.get(sid)
+        try:
+            if blob is None:
+                blob = self.backend.get(sid)
+                if blob is None:
+                    return {}
+                # Only blobs the backend already holds count as written; a pending one
+                # must stay queued until flush() has stored it
+                with self._lock:
+                    if sid not in self._written_digests:
+                        self._remember_digest(sid, hashlib.blake2b(blob, digest_size=16).digest())
+            return decode_state(blob)
+        except Exception as e:
+            print(f"Error loading session {sid}: {e}")
+            return {}
+
+    def _remember_digest(self, sid: str, digest: bytes):
+        # Callers hold self._lock
+        self._written_digests[sid] = digest
+        self._written_digests.move_to_end(sid)
+        while len(self._written_digests) > self.max_tracked_sessions:
+            self._written_digests.popitem(last=False)
+
+    def save(self, sid: str, state: Dict[str, Any]):
+        """Queues the persisted keys of state for the next flush."""
+        blob = encode_state({key: state[key] for key in self.keys if key in state})
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        with self._lock:
+            if self._written_digests.get(sid) == digest:
+                self._written_digests.move_to_end(sid)
+                self._pending.pop(sid, None)
+                return
+            self._pending[sid] = blob
+        self._wake.set()
+
+    def flush(self):
+        """Writes every pending session now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            self.backend.set_many(pending)
+        except Exception as e:
+            print(f"Error writing {len(pending)} session(s): {e}")
+            with self._lock:
+                # Keep newer saves that arrived while we were writing
+                for sid, blob in pending.items():
+                    self._pending.setdefault(sid, blob)
+            return
+        with self._lock:
+            for sid, blob in pending.items():
+                self._remember_digest(sid, hashlib.blake2b(blob, digest_size=16).digest())
+
+    def _flush_loop(self):
+        while True:
+            self._wake.wait()
+            # Let saves from the same burst of reruns land in this batch
+            time.sleep(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def backend_from_url(url: str, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+    """
+    Creates a session backend from a URL.
+
+    Args:
+        url (str): 'sqlite:///path/to/sessions.db' or 'redis://host:6379/0' (also 'rediss://').
+        ttl_seconds (int): How long an idle session is kept.
+    """
+    if url.startswith("sqlite:///"):
+        return SQLiteSessionBackend(url[len("sqlite:///"):], ttl_seconds)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisSessionBackend(url, ttl_seconds)
+    raise ValueError(f"Unsupported session store URL: {url}")
+
+
+def store_from_env(keys: Iterable[str]) -> Optional[SessionStore]:
+    """
+    Builds the session store configured by LMS_SESSION_STORE, or None if it isn't set.
+
+    LMS_SESSION_TTL (seconds) and LMS_SESSION_FLUSH_MS tune expiry and write coalescing;
+    LMS_SESSION_TRACKED caps how many sessions' last-write digests are kept in memory.
+    """
+    url = os.environ.get("LMS_SESSION_STORE", "")
+    if not url:
+        return None
+    ttl = int(os.environ.get("LMS_SESSION_TTL", DEFAULT_TTL_SECONDS))
+    flush_interval = float(os.environ.get("LMS_SESSION_FLUSH_MS", DEFAULT_FLUSH_INTERVAL * 1000)) / 1000
+    max_tracked = int(os.environ.get("LMS_SESSION_TRACKED", DEFAULT_MAX_TRACKED_SESSIONS))
+    return SessionStore(backend_from_url(url, ttl), keys, flush_interval, max_tracked)
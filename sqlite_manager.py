@@ -0,0 +1,622 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+
+from database_manager import DEFAULT_ROLLUP_LOOKBACK, query_span
+
+SQLITE_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database_schema_sqlite.sql")
+
+# The one form timestamps are stored in, UTC; the schema's defaults produce the same
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+_VALUES_PLACEHOLDER = re.compile(r"VALUES\s+%s", re.IGNORECASE)
+
+
+def sqlite_path_from_config(db_config: Dict[str, str]) -> str:
+    """Returns the database file from a {'dsn': 'sqlite:///path'} or {'path': ...} config."""
+    if db_config.get("path"):
+        return db_config["path"]
+    dsn = db_config.get("dsn", "")
+    if not dsn.startswith("sqlite:///"):
+        raise ValueError(f"Not a SQLite DSN: {dsn!r}")
+    return dsn[len("sqlite:///"):]
+
+
+def _adapt(value: Any) -> Any:
+    """Converts a Python parameter to what the SQLite schema stores."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        # Always with microseconds, so string comparisons in SQL order timestamps correctly
+        return value.strftime(TIMESTAMP_FORMAT)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def _json(value: Optional[str]) -> Any:
+    return json.loads(value) if value is not None else None
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+class SQLiteDatabaseManager:
+    """
+    Embedded SQLite storage with the same methods as DatabaseManager.
+
+    For classroom and edge deployments without a PostgreSQL server. The database
+    runs in WAL mode so the dashboard can read while jobs write, JSON columns are
+    queried with JSON1, and writes grouped in transaction() commit once.
+    """
+
+    SCHEMA_PATH = SQLITE_SCHEMA_PATH
+
+    def __init__(self, db_config: Dict[str, str], lazy_connect: bool = False):
+        self.db_config = db_config
+        self.path = sqlite_path_from_config(db_config)
+        self.conn = None
+        # One connection is shared by Streamlit's script threads, so statements take turns
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        if not lazy_connect:
+            self.connect()
+
+    def connect(self):
+        """Opens the SQLite database file, creating it if needed."""
+        try:
+            # isolation_level=None: statements autocommit unless inside transaction()
+            self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            print("Database connection established successfully.")
+        except sqlite3.Error as e:
+            print(f"Error connecting to database: {e}")
+            self.conn = None
+
+    def close(self):
+        """Closes the database connection."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+            print("Database connection closed.")
+
+    def _ensure_connection(self):
+        if not self.conn:
+            self.connect() # Attempt to reconnect
+            if not self.conn:
+                raise ConnectionError("No database connection available.")
+
+    @contextmanager
+    def transaction(self):
+        """Groups the writes made inside the block into one commit. Nested blocks join the outer one."""
+        with self._lock:
+            self._ensure_connection()
+            if self._transaction_depth == 0:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.conn.execute("ROLLBACK")
+                raise
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.execute("COMMIT")
+
+    def _execute_query(self, query: str, params: Optional[Union[Tuple, Dict[str, Any]]] = None,
+                       fetch_one=False, fetch_all=False):
+        """Helper to execute SQL queries."""
+        if isinstance(params, dict):
+            params = {key: _adapt(value) for key, value in params.items()}
+        elif params is not None:
+            params = tuple(_adapt(value) for value in params)
+        with self._lock, query_span():
+            self._ensure_connection()
+            try:
+                cur = self.conn.execute(query, params or ())
+                if fetch_one:
+                    return cur.fetchone()
+                if fetch_all:
+                    return cur.fetchall()
+                return None
+            except sqlite3.Error as e:
+                print(f"Database error during query execution: {e}")
+                raise # Re-raise the exception
+
+    def _execute_batch(self, query: str, rows: List[Tuple], page_size: int = 1000):
+        """
+        Helper to insert or update many rows in one transaction.
+
+        Accepts DatabaseManager's 'VALUES %s' form as well as '?' placeholders.
+        """
+        if not rows:
+            return
+        query = _VALUES_PLACEHOLDER.sub(lambda _: "VALUES (" + ", ".join("?" * len(rows[0])) + ")", query, count=1)
+        try:
+            with query_span(), self.transaction():
+                for i in range(0, len(rows), page_size):
+                    self.conn.executemany(query, [tuple(_adapt(v) for v in row) for row in rows[i:i + page_size]])
+        except sqlite3.Error as e:
+            print(f"Database error during batch execution: {e}")
+            raise # Re-raise the exception
+
+    def setup_database(self, schema_sql_path: Optional[str] = None):
+        """Executes the database schema creation script."""
+        with open(schema_sql_path or self.SCHEMA_PATH, 'r') as f:
+            schema_script = f.read()
+        with self._lock:
+            self._ensure_connection()
+            self.conn.executescript(schema_script)
+        print("Database schema setup complete.")
+
+    def insert_sample_data(self, sample_data_sql_path: str):
+        """Inserts sample data into the database."""
+        with open(sample_data_sql_path, 'r') as f:
+            sample_data_script = f.read()
+        with self._lock:
+            self._ensure_connection()
+            self.conn.executescript(sample_data_script)
+            # Sample scripts are shared with PostgreSQL and leave out the fraction
+            self.conn.execute("UPDATE learning_sessions SET timestamp = replace(timestamp, 'T', ' ') || '.000000' "
+                              "WHERE length(timestamp) = 19;")
+        print("Sample data inserted.")
+
+    # --- User Profile Management ---
+    def insert_user_profile(self, user_profile: Dict[str, Any]):
+        query = """
+            INSERT INTO user_profiles (user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (user_id) DO UPDATE
+            SET demographics = excluded.demographics,
+                learning_preferences = excluded.learning_preferences,
+                behavioral_patterns = excluded.behavioral_patterns,
+                engagement_metrics = excluded.engagement_metrics;
+        """
+        self._execute_query(query, (
+            user_profile['user_id'],
+            user_profile.get('demographics', {}),
+            user_profile.get('learning_preferences', {}),
+            user_profile.get('behavioral_patterns', {}),
+            user_profile.get('engagement_metrics', {})
+        ))
+
+    def ensure_user_profile(self, user_id: str):
+        """Creates an empty profile for a learner seen for the first time, leaving existing ones untouched."""
+        self._execute_query("INSERT INTO user_profiles (user_id) VALUES (?) ON CONFLICT (user_id) DO NOTHING;", (user_id,))
+
+    @staticmethod
+    def _profile(row) -> Dict[str, Any]:
+        return {
+            "user_id": row[0],
+            "demographics": _json(row[1]),
+            "learning_preferences": _json(row[2]),
+            "behavioral_patterns": _json(row[3]),
+            "engagement_metrics": _json(row[4]),
+        }
+
+    def fetch_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        query = "SELECT user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics FROM user_profiles WHERE user_id = ?;"
+        row = self._execute_query(query, (user_id,), fetch_one=True)
+        return self._profile(row) if row else None
+
+    def fetch_all_user_profiles(self) -> Dict[str, Dict[str, Any]]:
+        query = "SELECT user_id, demographics, learning_preferences, behavioral_patterns, engagement_metrics FROM user_profiles;"
+        rows = self._execute_query(query, fetch_all=True)
+        return {row[0]: self._profile(row) for row in rows}
+
+    def get_all_user_ids(self) -> List[str]:
+        rows = self._execute_query("SELECT user_id FROM user_profiles;", fetch_all=True)
+        return [row[0] for row in rows]
+
+    def get_total_users(self) -> int:
+        return self._execute_query("SELECT COUNT(*) FROM user_profiles;", fetch_one=True)[0]
+
+    # --- Learning Session Management ---
+    def insert_learning_session(self, session: Dict[str, Any]):
+        query = """
+            INSERT INTO learning_sessions (session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'));
+        """
+        self._execute_query(query, (
+            session['session_id'],
+            session['user_id'],
+            session.get('content_accessed', []),
+            session.get('time_spent'), # timedelta or seconds
+            session.get('interactions', {}),
+            session.get('performance_metrics', {}),
+            session.get('timestamp') # Datetime object
+        ))
+
+    @staticmethod
+    def _session(row) -> Dict[str, Any]:
+        return {
+            "session_id": row[0],
+            "user_id": row[1],
+            "content_accessed": _json(row[2]),
+            "time_spent": timedelta(seconds=row[3]) if row[3] is not None else None,
+            "interactions": _json(row[4]),
+            "performance_metrics": _json(row[5]),
+            "timestamp": _timestamp(row[6])
+        }
+
+    def fetch_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
+        query = "SELECT session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp FROM learning_sessions WHERE user_id = ? ORDER BY timestamp ASC;"
+        rows = self._execute_query(query, (user_id,), fetch_all=True)
+        return [self._session(row) for row in rows]
+
+    def fetch_all_learning_sessions(self) -> List[Dict[str, Any]]:
+        query = "SELECT session_id, user_id, content_accessed, time_spent, interactions, performance_metrics, timestamp FROM learning_sessions;"
+        rows = self._execute_query(query, fetch_all=True)
+        return [self._session(row) for row in rows]
+
+    # --- Analytics Data Storage (Engineered Features, Predictions, Recommendations, Insights) ---
+    def update_user_features(self, user_id: str, features: Dict[str, Any]):
+        query = """
+            INSERT INTO user_analytics_data (user_id, engineered_features)
+            VALUES (?, ?)
+            ON CONFLICT (user_id) DO UPDATE SET engineered_features = excluded.engineered_features;
+        """
+        self._execute_query(query, (user_id, features))
+
+    def fetch_user_features(self, user_id: str) -> Optional[Dict[str, Any]]:
+        row = self._execute_query("SELECT engineered_features FROM user_analytics_data WHERE user_id = ?;",
+                                  (user_id,), fetch_one=True)
+        return _json(row[0]) if row else None
+
+    def fetch_all_user_features(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute_query("SELECT user_id, engineered_features FROM user_analytics_data;", fetch_all=True)
+        return {row[0]: _json(row[1]) for row in rows}
+
+    def update_user_cluster(self, user_id: str, cluster_label: int):
+        query = """
+            INSERT INTO user_analytics_data (user_id, cluster_label)
+            VALUES (?, ?)
+            ON CONFLICT (user_id) DO UPDATE SET cluster_label = excluded.cluster_label;
+        """
+        self._execute_query(query, (user_id, cluster_label))
+
+    def fetch_user_cluster(self, user_id: str) -> Optional[int]:
+        row = self._execute_query("SELECT cluster_label FROM user_analytics_data WHERE user_id = ?;",
+                                  (user_id,), fetch_one=True)
+        return row[0] if row else None
+
+    def fetch_features_by_cluster(self, cluster_label: int) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute_query("SELECT user_id, engineered_features FROM user_analytics_data WHERE cluster_label = ?;",
+                                   (cluster_label,), fetch_all=True)
+        return {row[0]: _json(row[1]) for row in rows}
+
+    def update_user_predictions(self, user_id: str, prediction_type: str, prediction_data: Any):
+        # Same effect as jsonb_set(..., create_missing => true): only this prediction type changes
+        query = """
+            UPDATE user_analytics_data
+            SET predictions = json_set(coalesce(predictions, '{}'), '$."' || ? || '"', json(?))
+            WHERE user_id = ?;
+        """
+        self._execute_query(query, (prediction_type, json.dumps(prediction_data), user_id))
+
+    def fetch_user_predictions(self, user_id: str) -> Optional[Dict[str, Any]]:
+        row = self._execute_query("SELECT predictions FROM user_analytics_data WHERE user_id = ?;",
+                                  (user_id,), fetch_one=True)
+        return _json(row[0]) if row else None
+
+    def update_user_recommendations(self, user_id: str, recommendations: List[Dict[str, Any]]):
+        self._execute_query("UPDATE user_analytics_data SET recommendations = ? WHERE user_id = ?;",
+                            (recommendations, user_id))
+
+    def fetch_user_recommendations(self, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        row = self._execute_query("SELECT recommendations FROM user_analytics_data WHERE user_id = ?;",
+                                  (user_id,), fetch_one=True)
+        return _json(row[0]) if row else None
+
+    def update_user_insights(self, user_id: str, insights: Dict[str, str]):
+        self._execute_query("UPDATE user_analytics_data SET insights = ? WHERE user_id = ?;", (insights, user_id))
+
+    def fetch_user_insights(self, user_id: str) -> Optional[Dict[str, str]]:
+        row = self._execute_query("SELECT insights FROM user_analytics_data WHERE user_id = ?;",
+                                  (user_id,), fetch_one=True)
+        return _json(row[0]) if row else None
+
+    def fetch_all_learning_outcomes(self) -> Dict[str, float]:
+        """Fetches the average quiz score for each user to be used as ML target."""
+        query = """
+            SELECT
+                user_id,
+                AVG(CAST(json_extract(performance_metrics, '$.score') AS REAL)) AS avg_score
+            FROM
+                learning_sessions
+            WHERE
+                json_extract(performance_metrics, '$.score') IS NOT NULL
+            GROUP BY
+                user_id;
+        """
+        rows = self._execute_query(query, fetch_all=True)
+        return {row[0]: float(row[1]) for row in rows}
+
+    def fetch_user_completed_content(self, user_id: str) -> List[str]:
+        query = """
+            SELECT DISTINCT c.value
+            FROM learning_sessions ls, json_each(ls.content_accessed) AS c
+            WHERE ls.user_id = ?;
+        """
+        rows = self._execute_query(query, (user_id,), fetch_all=True)
+        return [row[0] for row in rows if row and row[0]] # Filter out None or empty strings
+
+    def fetch_top_content_by_cluster(self, cluster_label: int, limit: int = 5) -> Dict[str, int]:
+        """Fetches most frequently accessed content by users in a specific cluster."""
+        query = """
+            SELECT
+                c.value AS content_id,
+                COUNT(*) AS access_count
+            FROM
+                learning_sessions ls
+            JOIN
+                user_analytics_data uad ON ls.user_id = uad.user_id,
+                json_each(ls.content_accessed) AS c
+            WHERE
+                uad.cluster_label = ?
+            GROUP BY
+                content_id
+            ORDER BY
+                access_count DESC
+            LIMIT ?;
+        """
+        rows = self._execute_query(query, (cluster_label, limit), fetch_all=True)
+        return {row[0]: row[1] for row in rows}
+
+    # --- Topic Mastery (Bayesian Knowledge Tracing) ---
+    def upsert_topic_mastery(self, user_id: str, topics: Dict[str, Dict[str, Any]]):
+        """Stores mastery estimates for several topics of one user in a single transaction."""
+        if not topics:
+            return
+        query = """
+            INSERT INTO topic_mastery (user_id, topic, p_mastery, attempts, correct)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, topic) DO UPDATE
+            SET p_mastery = excluded.p_mastery,
+                attempts = excluded.attempts,
+                correct = excluded.correct,
+                updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') || '000';
+        """
+        rows = [(user_id, topic, state['p_mastery'], state['attempts'], state['correct'])
+                for topic, state in topics.items()]
+        self._execute_batch(query, rows)
+
+    def fetch_topic_mastery(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute_query("SELECT topic, p_mastery, attempts, correct FROM topic_mastery WHERE user_id = ?;",
+                                   (user_id,), fetch_all=True)
+        return {row[0]: {"p_mastery": row[1], "attempts": row[2], "correct": row[3]} for row in rows}
+
+    # --- Spaced Repetition (SM-2 Review Schedule) ---
+    def upsert_review_schedule(self, user_id: str, items: Dict[str, Dict[str, Any]]):
+        """Stores the scheduling state of several questions of one user in a single transaction."""
+        if not items:
+            return
+        query = """
+            INSERT INTO review_schedule (user_id, question_id, interval_days, ease, repetitions, lapses, due_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, question_id) DO UPDATE
+            SET interval_days = excluded.interval_days,
+                ease = excluded.ease,
+                repetitions = excluded.repetitions,
+                lapses = excluded.lapses,
+                due_at = excluded.due_at,
+                updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') || '000';
+        """
+        rows = [(user_id, question_id, item['interval_days'], item['ease'], item['repetitions'], item['lapses'],
+                 item['due_at']) for question_id, item in items.items()]
+        self._execute_batch(query, rows)
+
+    def fetch_review_schedule(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute_query("SELECT question_id, interval_days, ease, repetitions, lapses, due_at "
+                                   "FROM review_schedule WHERE user_id = ?;", (user_id,), fetch_all=True)
+        return {row[0]: {"interval_days": row[1], "ease": row[2], "repetitions": row[3], "lapses": row[4],
+                         "due_at": _timestamp(row[5])} for row in rows}
+
+    def fetch_due_learners(self, until: Any, after: Optional[Any] = None) -> List[Tuple[str, Any]]:
+        """Returns (user_id, earliest due_at) for learners with a review due in [after, until)."""
+        # Separate forms, so SQLite can use both bounds of the due_at index
+        if after is None:
+            rows = self._execute_query("SELECT user_id, MIN(due_at) FROM review_schedule WHERE due_at < ? GROUP BY user_id;",
+                                       (until,), fetch_all=True)
+        else:
+            rows = self._execute_query("SELECT user_id, MIN(due_at) FROM review_schedule "
+                                       "WHERE due_at >= ? AND due_at < ? GROUP BY user_id;", (after, until), fetch_all=True)
+        return [(row[0], _timestamp(row[1])) for row in rows]
+
+    def fetch_rescheduled_reviews(self, since: Any, until: Any) -> List[Tuple[str, Any]]:
+        """Returns (user_id, due_at) of reviews saved at or after since that are due before until."""
+        rows = self._execute_query("SELECT user_id, due_at FROM review_schedule WHERE updated_at >= ? AND due_at < ?;",
+                                   (since, until), fetch_all=True)
+        return [(row[0], _timestamp(row[1])) for row in rows]
+
+    def fetch_next_due(self, bounds: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+        """Returns (user_id, earliest due_at at or after the bound) for each (user_id, bound) given."""
+        rows = []
+        # In chunks, to stay under SQLite's limit on bound parameters
+        for i in range(0, len(bounds), 5000):
+            chunk = bounds[i:i + 5000]
+            query = (
+                "WITH b (user_id, after) AS (VALUES " + ", ".join(["(?, ?)"] * len(chunk)) + ") "
+                "SELECT rs.user_id, MIN(rs.due_at) FROM b "
+                "JOIN review_schedule rs ON rs.user_id = b.user_id AND rs.due_at >= b.after "
+                "GROUP BY rs.user_id;"
+            )
+            rows += self._execute_query(query, tuple(v for bound in chunk for v in bound), fetch_all=True)
+        return [(row[0], _timestamp(row[1])) for row in rows]
+
+    # --- Cohort Rollups ---
+    ROLLUP_TABLES = {"hourly": "session_rollups_hourly", "daily": "session_rollups_daily"}
+    ROLLUP_BUCKET_FORMATS = {"hourly": "%Y-%m-%d %H:00:00.000000", "daily": "%Y-%m-%d 00:00:00.000000"}
+
+    def refresh_session_rollups(self, full: bool = False, lookback: timedelta = DEFAULT_ROLLUP_LOOKBACK) -> Optional[datetime]:
+        """
+        Rebuilds the hourly and daily cohort rollups for sessions since the last run.
+
+        Same semantics as DatabaseManager.refresh_session_rollups; the whole refresh
+        is one transaction.
+        """
+        with self.transaction():
+            row = self._execute_query(
+                "SELECT watermark FROM rollup_watermarks WHERE rollup_name = 'learning_sessions';", fetch_one=True)
+            oldest, new_watermark = (_timestamp(value) for value in self._execute_query(
+                "SELECT MIN(timestamp), MAX(timestamp) FROM learning_sessions;", fetch_one=True))
+            if new_watermark is None:
+                return None
+            since = oldest if full or not row else _timestamp(row[0]) - lookback
+            since = since.replace(hour=0, minute=0, second=0, microsecond=0)
+
+            for granularity, table in self.ROLLUP_TABLES.items():
+                self._execute_query(f"DELETE FROM {table} WHERE bucket >= :since;", {"since": since})
+                self._execute_query(f"""
+                    WITH sessions AS (
+                        SELECT
+                            ls.user_id,
+                            strftime(:bucket_format, ls.timestamp) AS bucket,
+                            ls.content_accessed,
+                            COALESCE(ls.time_spent, 0.0) AS seconds,
+                            CAST(json_extract(ls.performance_metrics, '$.score') AS REAL) AS score,
+                            COALESCE(json_extract(ls.performance_metrics, '$.completed'),
+                                     json_type(ls.performance_metrics, '$.score') IS NOT NULL) AS completed,
+                            COALESCE(uad.cluster_label, -1) AS cluster_label
+                        FROM
+                            learning_sessions ls
+                        LEFT JOIN
+                            user_analytics_data uad ON ls.user_id = uad.user_id
+                        WHERE
+                            ls.timestamp >= :since
+                    )
+                    INSERT INTO {table} (dimension, bucket, dimension_value, sessions, learners, completions, score_sum, score_count, time_spent_seconds)
+                    SELECT 'cluster', bucket, CAST(cluster_label AS TEXT), COUNT(*), COUNT(DISTINCT user_id),
+                           COUNT(*) FILTER (WHERE completed), COALESCE(SUM(score), 0), COUNT(score), SUM(seconds)
+                    FROM sessions
+                    GROUP BY bucket, cluster_label
+                    UNION ALL
+                    -- A session's time is split evenly across the content items it accessed.
+                    SELECT 'content', bucket, c.value, COUNT(*), COUNT(DISTINCT user_id),
+                           COUNT(*) FILTER (WHERE completed), COALESCE(SUM(score), 0), COUNT(score),
+                           SUM(seconds / json_array_length(content_accessed))
+                    FROM sessions, json_each(sessions.content_accessed) AS c
+                    GROUP BY bucket, c.value;
+                """, {"since": since, "bucket_format": self.ROLLUP_BUCKET_FORMATS[granularity]})
+
+            self._execute_query("""
+                INSERT INTO rollup_watermarks (rollup_name, watermark)
+                VALUES ('learning_sessions', ?)
+                ON CONFLICT (rollup_name) DO UPDATE SET watermark = excluded.watermark;
+            """, (new_watermark,))
+        return new_watermark
+
+    def fetch_session_rollups(self, granularity: str, dimension: str, start: Any, end: Any,
+                              dimension_value: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetches pre-rolled cohort aggregates in [start, end), ordered by bucket."""
+        query = f"""
+            SELECT bucket, dimension_value, sessions, learners, completions, score_sum, score_count, time_spent_seconds
+            FROM {self.ROLLUP_TABLES[granularity]}
+            WHERE dimension = ? AND bucket >= ? AND bucket < ? AND (? IS NULL OR dimension_value = ?)
+            ORDER BY bucket;
+        """
+        rows = self._execute_query(query, (dimension, start, end, dimension_value, dimension_value), fetch_all=True)
+        return [
+            {
+                "bucket": _timestamp(row[0]),
+                "dimension_value": row[1],
+                "sessions": row[2],
+                "learners": row[3],
+                "completions": row[4],
+                "score_sum": row[5],
+                "score_count": row[6],
+                "time_spent_seconds": row[7],
+            }
+            for row in rows
+        ]
+
+    # --- Bulk Export ---
+    def _iter_batches(self, query: str, params: Union[Tuple, Dict[str, Any]], batch_size: int) -> Iterator[List[Tuple]]:
+        with self._lock:
+            self._ensure_connection()
+            # A separate cursor keeps the read consistent while other statements run on the connection
+            cur = self.conn.cursor()
+        try:
+            with self._lock:
+                cur.execute(query, params)
+            while True:
+                with self._lock:
+                    rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cur.close()
+
+    def fetch_session_watermark_bounds(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Returns the earliest and latest learning session timestamps."""
+        row = self._execute_query("SELECT MIN(timestamp), MAX(timestamp) FROM learning_sessions;", fetch_one=True)
+        return _timestamp(row[0]), _timestamp(row[1])
+
+    def iter_session_export_rows(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                                 batch_size: int = 10000) -> Iterator[List[Tuple]]:
+        """Streams learning sessions in (since, until] like DatabaseManager.iter_session_export_rows."""
+        query = """
+            SELECT
+                ls.session_id,
+                ls.user_id,
+                ls.timestamp,
+                ls.time_spent,
+                CAST(json_extract(ls.performance_metrics, '$.score') AS REAL),
+                COALESCE(json_extract(ls.performance_metrics, '$.completed'),
+                         json_type(ls.performance_metrics, '$.score') IS NOT NULL),
+                ls.content_accessed,
+                ls.interactions,
+                uad.cluster_label
+            FROM
+                learning_sessions ls
+            LEFT JOIN
+                user_analytics_data uad ON ls.user_id = uad.user_id
+            WHERE
+                (:since IS NULL OR ls.timestamp > :since)
+                AND (:until IS NULL OR ls.timestamp <= :until)
+            ORDER BY ls.timestamp;
+        """
+        params = {"since": _adapt(since), "until": _adapt(until)}
+        for rows in self._iter_batches(query, params, batch_size):
+            yield [
+                (r[0], r[1], _timestamp(r[2]), r[3], r[4], bool(r[5]), _json(r[6]) or [], r[7], r[8])
+                for r in rows
+            ]
+
+    @contextmanager
+    def session_export_snapshot(self, since: Optional[datetime] = None, batch_size: int = 10000):
+        """
+        Reads the latest session timestamp and the sessions up to it in one read transaction,
+        like DatabaseManager.session_export_snapshot.
+        """
+        with self._lock:
+            self._ensure_connection()
+            self.conn.execute("BEGIN")
+            try:
+                row = self.conn.execute("SELECT MAX(timestamp) FROM learning_sessions;").fetchone()
+                until = _timestamp(row[0])
+                yield until, self.iter_session_export_rows(since, until, batch_size)
+            finally:
+                self.conn.execute("COMMIT")
+
+    def iter_user_analytics_rows(self, batch_size: int = 10000) -> Iterator[List[Tuple]]:
+        """Streams user_analytics_data in USER_ANALYTICS_EXPORT_COLUMNS order, JSON columns as JSON text."""
+        query = """
+            SELECT user_id, cluster_label, engineered_features, predictions, recommendations, insights
+            FROM user_analytics_data
+            ORDER BY user_id;
+        """
+        return self._iter_batches(query, (), batch_size)
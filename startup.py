@@ -0,0 +1,166 @@
+import importlib
+import os
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Heavy modules are imported on first attribute access unless this is set, e.g. for
+# pre-forked workers that would rather pay the import cost once at boot.
+EAGER_IMPORTS = os.environ.get("LMS_EAGER_IMPORTS") == "1"
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a module that is imported the first time one of its attributes is used.
+
+    Unlike importlib.util.LazyLoader this never imports parent packages up front, so
+    lazy_import("plotly.graph_objects") costs nothing until a figure is built.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns a module that is only imported when first used.
+
+    Args:
+        name (str): Dotted module name, e.g. 'plotly.graph_objects'.
+
+    Returns:
+        module: The real module if LMS_EAGER_IMPORTS=1 or it is already imported,
+        otherwise a LazyModule proxy.
+    """
+    if EAGER_IMPORTS or name in sys.modules:
+        return importlib.import_module(name)
+    return LazyModule(name)
+
+
+_background_started = set()
+_background_lock = threading.Lock()
+
+
+def run_once_in_background(name: str, task: Callable[[], None],
+                           prepare_thread: Optional[Callable[[threading.Thread], Any]] = None) -> bool:
+    """
+    Starts a daemon thread for task the first time name is seen in this process.
+
+    Used to prewarm caches and heavy imports after the first page has been served.
+
+    Args:
+        name (str): Identifies the task; later calls with the same name do nothing.
+        task (callable): Work to run.
+        prepare_thread (callable, optional): Called with the thread before it starts,
+            e.g. streamlit's add_script_run_ctx so the task can use st.cache_*.
+
+    Returns:
+        bool: True if the thread was started by this call.
+    """
+    with _background_lock:
+        if name in _background_started:
+            return False
+        _background_started.add(name)
+
+    def run():
+        try:
+            task()
+        except Exception as e:
+            print(f"Background task '{name}' failed: {e}")
+
+    thread = threading.Thread(target=run, name=f"prewarm-{name}", daemon=True)
+    if prepare_thread is not None:
+        prepare_thread(thread)
+    thread.start()
+    return True
+
+
+def import_time_report(module: str) -> List[Dict[str, Any]]:
+    """
+    Measures what importing a module costs, like `python -X importtime`.
+
+    The import runs in a fresh interpreter so nothing is already cached.
+
+    Args:
+        module (str): Module to import, e.g. 'lms_app'.
+
+    Returns:
+        list: One dict per imported module with self_ms, cumulative_ms and depth,
+        in import order. The last entry is the requested module itself.
+    """
+    # Imported here so modules using lazy_import don't pay for them at startup
+    import re
+    import subprocess
+
+    line_pattern = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env.pop("LMS_EAGER_IMPORTS", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+    entries = []
+    for line in result.stderr.splitlines():
+        match = line_pattern.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            })
+    if result.returncode != 0 and not entries:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return entries
+
+
+def top_level_imports(entries: List[Dict[str, Any]], limit: int = 15) -> List[Tuple[str, float]]:
+    """Returns the requested module's slowest direct imports as (module, cumulative_ms) pairs."""
+    # Entries before the previous top-level import belong to interpreter startup (site, encodings)
+    start = len(entries) - 1
+    while start > 0 and entries[start - 1]["depth"] > 0:
+        start -= 1
+    direct = [e for e in entries[start:-1] if e["depth"] == 1]
+    direct.sort(key=lambda e: e["cumulative_ms"], reverse=True)
+    return [(e["module"], e["cumulative_ms"]) for e in direct[:limit]]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report import time for the app's entry modules.")
+    parser.add_argument("modules", nargs="*", default=["lms_app", "database_manager", "visualization_generator"])
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list per module.")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Exit with status 1 if any module takes longer than this to import.")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module_name in args.modules:
+        report = import_time_report(module_name)
+        total = report[-1]["cumulative_ms"] if report else 0.0
+        print(f"\n{module_name}: {total:.1f} ms")
+        for name, cumulative_ms in top_level_imports(report, args.top):
+            print(f"  {cumulative_ms:>9.1f} ms  {name}")
+        if args.budget_ms is not None and total > args.budget_ms:
+            print(f"  ⚠️ over budget of {args.budget_ms:.1f} ms")
+            over_budget = True
+    sys.exit(1 if over_budget else 0)
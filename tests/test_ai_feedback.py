@@ -0,0 +1,102 @@
+import json
+import os
+
+import pytest
+
+from ai_feedback import DEFAULT_BKT_PARAMS, FeedbackGenerator, MasteryTracker, _bind_static, bkt_update
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "feedback_template.json")
+
+
+# --- Bayesian Knowledge Tracing ---
+@pytest.mark.parametrize("p_mastery", [0.05, 0.3, 0.6, 0.9])
+def test_bkt_correct_answer_raises_mastery(p_mastery):
+    assert p_mastery < bkt_update(p_mastery, True) <= 1.0
+
+
+@pytest.mark.parametrize("p_mastery", [0.3, 0.6, 0.9, 0.99])
+def test_bkt_incorrect_answer_lowers_mastery(p_mastery):
+    assert 0.0 <= bkt_update(p_mastery, False) < p_mastery
+
+
+def test_bkt_learning_rate_applies_after_the_posterior():
+    # Guessing and slipping both at 0.5 make an answer uninformative, leaving only learning
+    params = DEFAULT_BKT_PARAMS._replace(p_slip=0.5, p_guess=0.5, p_learn=0.2)
+    assert bkt_update(0.5, True, params) == pytest.approx(0.5 + 0.5 * 0.2)
+    assert bkt_update(0.5, False, params) == pytest.approx(0.5 + 0.5 * 0.2)
+
+
+class RecordingDb:
+    def __init__(self, stored=None):
+        self.stored = stored or {}
+        self.upserts = []
+
+    def fetch_topic_mastery(self, user_id):
+        return {topic: dict(state) for topic, state in self.stored.items()}
+
+    def upsert_topic_mastery(self, user_id, topics):
+        self.upserts.append((user_id, {topic: dict(state) for topic, state in topics.items()}))
+
+
+def test_mastery_tracker_saves_only_changed_topics():
+    db = RecordingDb({"Taxes": {"p_mastery": 0.5, "attempts": 2, "correct": 1},
+                      "Voting": {"p_mastery": 0.8, "attempts": 4, "correct": 3}})
+    tracker = MasteryTracker.from_db(db, "u1")
+    tracker.save(db)
+    assert db.upserts == []
+
+    tracker.record_answer("Taxes", True)
+    tracker.record_answer("Budgeting", False)
+    tracker.save(db)
+    assert db.upserts == [("u1", {
+        "Taxes": {"p_mastery": bkt_update(0.5, True), "attempts": 3, "correct": 2},
+        "Budgeting": {"p_mastery": bkt_update(DEFAULT_BKT_PARAMS.p_init, False), "attempts": 1, "correct": 0},
+    })]
+
+    tracker.save(db)
+    assert len(db.upserts) == 1
+
+
+def test_mastery_tracker_weakest_topics():
+    tracker = MasteryTracker("u1", {
+        "a": {"p_mastery": 0.7, "attempts": 1, "correct": 1},
+        "b": {"p_mastery": 0.2, "attempts": 1, "correct": 0},
+        "c": {"p_mastery": 0.97, "attempts": 5, "correct": 5},
+    })
+    assert tracker.weakest_topics(limit=5) == [("b", 0.2), ("a", 0.7)]
+    assert tracker.mastery("unseen") == DEFAULT_BKT_PARAMS.p_init
+
+
+# --- Feedback Templates ---
+@pytest.fixture(scope="module")
+def generator():
+    return FeedbackGenerator(TEMPLATE_PATH)
+
+
+def test_bind_static_keeps_dynamic_fields_and_escapes_literals():
+    bound = _bind_static("{{x}} {label} {score:.0f}%", {"label": "Q{1}"}, {"score"})
+    assert bound == "{{x}} Q{{1}} {score:.0f}%"
+    assert bound.format(score=72.4) == "{x} Q{1} 72%"
+    with pytest.raises(ValueError):
+        _bind_static("{unknown}", {}, set())
+
+
+def test_compiled_template_renders_bands_and_badges(generator):
+    with open(TEMPLATE_PATH, encoding="utf-8") as f:
+        template = json.load(f)
+    feedback = generator.generate("civic", 85.0)
+    assert feedback.band == "excellent"
+    assert feedback.badge == template["quizzes"]["civic"]["badges"]["excellent"]
+    assert "85%" in feedback.headline and "Civic Knowledge" in feedback.headline
+    assert feedback.weakness_lines == (template["weakness"]["none"],)
+    assert generator.generate("financial", 60.0).band == "good"
+    assert generator.generate("financial", 59.9).band == "needs_work"
+
+
+def test_unknown_topic_uses_default_tip_without_changing_compiled_items(generator):
+    compiled = dict(generator._weakness_items)
+    feedback = generator.generate("civic", 40.0, (("Unlisted Topic", 2), ("The Constitution", 1)))
+    assert feedback.weakness_lines[0] == "**Topics to review:**"
+    assert feedback.weakness_lines[1] == f"- **Unlisted Topic** (2 missed): {generator._default_tip}"
+    assert feedback.weakness_lines[2].startswith("- **The Constitution** (1 missed): Review what the constitution")
+    assert generator._weakness_items == compiled
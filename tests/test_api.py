@@ -0,0 +1,90 @@
+import gzip
+import json
+import os
+
+import pytest
+
+pytest.importorskip("httpx")  # needed by Starlette's TestClient
+from starlette.testclient import TestClient
+
+import api
+
+QUIZ_PATH = "/quizzes/civic"
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(api.app)
+
+
+@pytest.fixture(scope="module")
+def quiz_body():
+    with open(os.path.join(api.BASE_DIR, api.QUIZ_BANK_FILE), encoding="utf-8") as f:
+        return {"quiz": "civic", "questions": json.load(f)["civic"]}
+
+
+def test_identity_when_only_identity_is_accepted(client, quiz_body):
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == quiz_body
+    digest = api.encode_body(quiz_body).digest
+    assert response.headers["etag"] == f'"{digest}"'
+
+
+def test_gzip_when_accepted(client, quiz_body):
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == quiz_body
+
+
+def test_brotli_preferred_over_gzip(client, quiz_body):
+    if api.brotli is None:
+        pytest.skip("brotli is not installed")
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"].endswith('-br"')
+    assert response.json() == quiz_body
+
+
+def test_refused_codings_fall_back_to_identity(client, quiz_body):
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "gzip;q=0, br;q=0, *;q=0.5"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == quiz_body
+
+
+def test_small_bodies_are_not_compressed(client):
+    response = client.get("/content", headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"sources": list(api.CONTENT_SOURCES)}
+
+
+def test_matching_weak_etag_gets_304(client):
+    etag = client.get(QUIZ_PATH, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    # The tag of one coding revalidates any other: the comparison is weak
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "identity", "If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == etag.replace("-gzip", "")
+
+
+def test_stale_etag_gets_full_response(client, quiz_body):
+    response = client.get(QUIZ_PATH, headers={"Accept-Encoding": "identity", "If-None-Match": 'W/"0000", "1111-gzip"'})
+    assert response.status_code == 200
+    assert response.json() == quiz_body
+
+
+def test_unknown_resource_is_404(client):
+    response = client.get("/content/unknown")
+    assert response.status_code == 404
+    assert response.json() == {"error": "Unknown content source 'unknown'"}
+
+
+def test_gzip_variant_is_deterministic(quiz_body):
+    encoded = api.encode_body(quiz_body)
+    assert gzip.decompress(encoded.gzip) == encoded.identity
+    assert api.encode_body(quiz_body).gzip == encoded.gzip
@@ -0,0 +1,366 @@
+"""
+Checks that SQLiteDatabaseManager and DatabaseManager return the same results.
+
+Every fetch method runs against the same seeded data on each available backend and
+is compared with values computed here in Python. SQLite stores timestamps as text
+and filters them by string comparison, so the seed puts rows exactly on, just
+before and just after the filter bounds, with and without microseconds.
+
+PostgreSQL needs LMS_TEST_DATABASE_URL pointing at a disposable server where the
+user may create databases and is skipped otherwise. Run from the repository root:
+
+    python -m pytest tests
+"""
+import json
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import profiling
+
+T0 = datetime(2024, 3, 1)
+USERS = [f"user_{i}" for i in range(5)]
+CLUSTERS = {"user_0": 0, "user_1": 0, "user_2": 1, "user_3": 2}  # user_4 has no analytics row
+CONTENT = ["Budgeting", "Voting Rights", "Taxes", "Credit Scores"]
+
+# Filter bounds used throughout; sessions and reviews sit on and around them
+LOWER = T0 + timedelta(hours=10)
+UPPER = T0 + timedelta(days=1, hours=2, microseconds=500_000)
+
+
+def _sessions():
+    offsets = [
+        timedelta(0),                                         # midnight, first bucket
+        timedelta(hours=10) - timedelta(microseconds=1),      # just before LOWER
+        timedelta(hours=10),                                  # exactly LOWER
+        timedelta(hours=10, microseconds=1),                  # just after LOWER
+        timedelta(hours=10, minutes=59, seconds=59, microseconds=999_999),
+        timedelta(hours=23, minutes=59, seconds=59),
+        timedelta(days=1),                                    # next day's first instant
+        timedelta(days=1, hours=2, microseconds=500_000),     # exactly UPPER
+        timedelta(days=1, hours=2, microseconds=500_001),     # just after UPPER
+        timedelta(days=1, hours=2, minutes=30),
+        timedelta(days=2, hours=7, seconds=1),
+        timedelta(days=31),                                   # next month
+    ]
+    sessions = []
+    for i, offset in enumerate(offsets):
+        metrics = {}
+        if i % 3 != 2:
+            metrics["score"] = 40 + 5 * i
+        if i % 4 == 1:
+            metrics["completed"] = i % 8 == 1
+        sessions.append({
+            "session_id": f"s{i:02d}",
+            "user_id": USERS[i % len(USERS)],
+            "content_accessed": [CONTENT[(i + k) % len(CONTENT)] for k in range(1 + i % 3)],
+            "time_spent": timedelta(minutes=5 + 7 * i),
+            "interactions": {"clicks": i, "pages": [i, i + 1]},
+            "performance_metrics": metrics,
+            "timestamp": T0 + offset,
+        })
+    return sessions
+
+
+SESSIONS = _sessions()
+REVIEWS = {
+    "user_0": {"q1": LOWER - timedelta(microseconds=1), "q2": UPPER},
+    "user_1": {"q1": LOWER},
+    "user_2": {"q1": LOWER + timedelta(microseconds=1), "q2": UPPER - timedelta(microseconds=1)},
+    "user_3": {"q1": UPPER + timedelta(microseconds=1)},
+}
+
+
+def _seed(db):
+    for user_id in USERS:
+        db.insert_user_profile({"user_id": user_id, "demographics": {"age": 20 + len(user_id)},
+                                "learning_preferences": {"style": "visual"}})
+    for session in SESSIONS:
+        db.insert_learning_session(session)
+    for user_id, cluster in CLUSTERS.items():
+        db.update_user_features(user_id, {"avg_score": 50.5 + cluster, "sessions": 3})
+        db.update_user_cluster(user_id, cluster)
+        db.update_user_predictions(user_id, "performance", {"score": 0.25 * cluster})
+        db.update_user_predictions(user_id, "dropout", 0.1)
+        db.update_user_recommendations(user_id, [{"content_id": CONTENT[cluster]}])
+        db.update_user_insights(user_id, {"summary": f"cluster {cluster}"})
+    for user_id in USERS[:3]:
+        db.upsert_topic_mastery(user_id, {"Budgeting": {"p_mastery": 0.4, "attempts": 2, "correct": 1},
+                                          "Taxes": {"p_mastery": 0.75, "attempts": 4, "correct": 3}})
+    for user_id, items in REVIEWS.items():
+        db.upsert_review_schedule(user_id, {
+            question_id: {"interval_days": 1.0, "ease": 2.5, "repetitions": 1, "lapses": 0, "due_at": due_at}
+            for question_id, due_at in items.items()
+        })
+
+
+def _postgres_db(tmp_path_factory):
+    admin_dsn = os.environ.get("LMS_TEST_DATABASE_URL")
+    if not admin_dsn:
+        pytest.skip("LMS_TEST_DATABASE_URL is not set")
+    psycopg2 = pytest.importorskip("psycopg2")
+    from database_manager import DatabaseManager
+
+    db_name = f"lms_parity_{os.getpid()}"
+    admin = psycopg2.connect(admin_dsn)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        cur.execute(f"CREATE DATABASE {db_name};")
+
+    db = DatabaseManager({"dsn": admin_dsn, "dbname": db_name})
+    try:
+        db.setup_database()
+        _seed(db)
+        yield db
+    finally:
+        db.close()
+        with admin.cursor() as cur:
+            cur.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        admin.close()
+
+
+def _sqlite_db(tmp_path_factory):
+    from sqlite_manager import SQLiteDatabaseManager
+
+    db = SQLiteDatabaseManager({"path": str(tmp_path_factory.mktemp("sqlite") / "lms_parity.db")})
+    try:
+        db.setup_database()
+        _seed(db)
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="module", params=["postgres", "sqlite"])
+def db(request, tmp_path_factory):
+    if request.param == "postgres":
+        yield from _postgres_db(tmp_path_factory)
+    else:
+        yield from _sqlite_db(tmp_path_factory)
+
+
+def _in_range(ts, since=None, until=None):
+    return (since is None or ts > since) and (until is None or ts <= until)
+
+
+def _completed(session):
+    metrics = session["performance_metrics"]
+    return metrics.get("completed", "score" in metrics)
+
+
+# --- Profiles and Sessions ---
+def test_profiles(db):
+    assert sorted(db.get_all_user_ids()) == USERS
+    assert db.get_total_users() == len(USERS)
+    profile = db.fetch_user_profile("user_1")
+    assert profile["demographics"] == {"age": 26}
+    assert profile["learning_preferences"] == {"style": "visual"}
+    assert db.fetch_user_profile("nobody") is None
+    assert sorted(db.fetch_all_user_profiles()) == USERS
+
+
+def test_sessions(db):
+    expected = {s["session_id"]: s for s in SESSIONS}
+    fetched = db.fetch_all_learning_sessions()
+    assert sorted(s["session_id"] for s in fetched) == sorted(expected)
+    for session in fetched:
+        source = expected[session["session_id"]]
+        assert session["timestamp"] == source["timestamp"]
+        assert session["time_spent"] == source["time_spent"]
+        assert session["content_accessed"] == source["content_accessed"]
+        assert session["interactions"] == source["interactions"]
+        assert session["performance_metrics"] == source["performance_metrics"]
+
+    user_sessions = db.fetch_user_sessions("user_0")
+    assert [s["session_id"] for s in user_sessions] == [
+        s["session_id"] for s in sorted(SESSIONS, key=lambda s: s["timestamp"]) if s["user_id"] == "user_0"]
+
+
+# --- Analytics ---
+def test_analytics(db):
+    assert db.fetch_user_features("user_2") == {"avg_score": 51.5, "sessions": 3}
+    assert sorted(db.fetch_all_user_features()) == sorted(CLUSTERS)
+    assert db.fetch_user_cluster("user_3") == 2
+    assert db.fetch_user_cluster("user_4") is None
+    assert sorted(db.fetch_features_by_cluster(0)) == ["user_0", "user_1"]
+    assert db.fetch_user_predictions("user_2") == {"performance": {"score": 0.25}, "dropout": 0.1}
+    assert db.fetch_user_recommendations("user_3") == [{"content_id": CONTENT[2]}]
+    assert db.fetch_user_insights("user_0") == {"summary": "cluster 0"}
+
+
+def test_learning_outcomes(db):
+    scores = defaultdict(list)
+    for session in SESSIONS:
+        if "score" in session["performance_metrics"]:
+            scores[session["user_id"]].append(session["performance_metrics"]["score"])
+    expected = {user_id: sum(values) / len(values) for user_id, values in scores.items()}
+    assert db.fetch_all_learning_outcomes() == pytest.approx(expected)
+
+
+def test_content_queries(db):
+    completed = {c for s in SESSIONS if s["user_id"] == "user_1" for c in s["content_accessed"]}
+    assert sorted(db.fetch_user_completed_content("user_1")) == sorted(completed)
+
+    counts = defaultdict(int)
+    for session in SESSIONS:
+        if CLUSTERS.get(session["user_id"]) == 0:
+            for content_id in session["content_accessed"]:
+                counts[content_id] += 1
+    # A limit above the number of content items, so ties can't be cut differently
+    assert db.fetch_top_content_by_cluster(0, limit=len(CONTENT) + 1) == dict(counts)
+
+
+# --- Topic Mastery and Reviews ---
+def test_topic_mastery(db):
+    assert db.fetch_topic_mastery("user_2") == {
+        "Budgeting": {"p_mastery": 0.4, "attempts": 2, "correct": 1},
+        "Taxes": {"p_mastery": 0.75, "attempts": 4, "correct": 3},
+    }
+    assert db.fetch_topic_mastery("user_4") == {}
+
+
+def test_review_schedule(db):
+    schedule = db.fetch_review_schedule("user_0")
+    assert {q: item["due_at"] for q, item in schedule.items()} == REVIEWS["user_0"]
+    assert schedule["q1"]["ease"] == 2.5
+
+
+@pytest.mark.parametrize("after", [None, LOWER], ids=["overdue", "window"])
+def test_due_learners(db, after):
+    expected = {}
+    for user_id, items in REVIEWS.items():
+        due = [d for d in items.values() if d < UPPER and (after is None or d >= after)]
+        if due:
+            expected[user_id] = min(due)
+    assert dict(db.fetch_due_learners(UPPER, after)) == expected
+
+
+def test_next_due(db):
+    bounds = [("user_0", LOWER), ("user_1", LOWER), ("user_2", LOWER),
+              ("user_3", UPPER + timedelta(microseconds=2)), ("user_4", LOWER)]
+    assert sorted(db.fetch_next_due(bounds)) == [
+        ("user_0", UPPER), ("user_1", LOWER), ("user_2", LOWER + timedelta(microseconds=1)),
+    ]
+    assert db.fetch_next_due([]) == []
+
+
+def test_rescheduled_reviews(db):
+    # updated_at is stamped by the database clock at seeding time
+    expected = sorted((user_id, d) for user_id, items in REVIEWS.items() for d in items.values() if d < UPPER)
+    assert sorted(db.fetch_rescheduled_reviews(datetime(2000, 1, 1), UPPER)) == expected
+    assert db.fetch_rescheduled_reviews(datetime(2100, 1, 1), UPPER) == []
+
+
+def test_due_times_are_utc(db):
+    # Runs after the other review tests, since it adds a review for user_4
+    before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1)
+    due = datetime(2024, 3, 1, 13, tzinfo=timezone(timedelta(hours=3)))  # LOWER in UTC
+    db.upsert_review_schedule("user_4", {
+        "q1": {"interval_days": 1.0, "ease": 2.5, "repetitions": 1, "lapses": 0, "due_at": due}})
+    assert db.fetch_review_schedule("user_4")["q1"]["due_at"] == LOWER
+    assert dict(db.fetch_due_learners(LOWER + timedelta(microseconds=1), LOWER))["user_4"] == LOWER
+    assert "user_4" not in dict(db.fetch_due_learners(LOWER, LOWER - timedelta(hours=1)))
+    # updated_at comes from the database clock, in UTC like the bounds computed here
+    assert ("user_4", LOWER) in db.fetch_rescheduled_reviews(before, UPPER)
+    assert ("user_4", LOWER) not in db.fetch_rescheduled_reviews(before + timedelta(minutes=2), UPPER)
+
+
+# --- Cohort Rollups ---
+def _expected_rollups(granularity, dimension, start, end):
+    truncate = {"hourly": lambda ts: ts.replace(minute=0, second=0, microsecond=0),
+                "daily": lambda ts: ts.replace(hour=0, minute=0, second=0, microsecond=0)}[granularity]
+    groups = defaultdict(list)
+    for session in SESSIONS:
+        bucket = truncate(session["timestamp"])
+        if not start <= bucket < end:
+            continue
+        if dimension == "cluster":
+            groups[(bucket, str(CLUSTERS.get(session["user_id"], -1)))].append((session, 1))
+        else:
+            for content_id in session["content_accessed"]:
+                groups[(bucket, content_id)].append((session, len(session["content_accessed"])))
+    rollups = []
+    for (bucket, value), members in sorted(groups.items()):
+        scores = [s["performance_metrics"]["score"] for s, _ in members if "score" in s["performance_metrics"]]
+        rollups.append({
+            "bucket": bucket,
+            "dimension_value": value,
+            "sessions": len(members),
+            "learners": len({s["user_id"] for s, _ in members}),
+            "completions": sum(1 for s, _ in members if _completed(s)),
+            "score_sum": sum(scores),
+            "score_count": len(scores),
+            "time_spent_seconds": pytest.approx(sum(s["time_spent"].total_seconds() / n for s, n in members)),
+        })
+    return rollups
+
+
+@pytest.mark.parametrize("granularity", ["hourly", "daily"])
+@pytest.mark.parametrize("dimension", ["cluster", "content"])
+def test_session_rollups(db, granularity, dimension):
+    assert db.refresh_session_rollups(full=True) == max(s["timestamp"] for s in SESSIONS)
+    # Bucket-aligned bounds, the way the dashboard asks for a range
+    start = LOWER if granularity == "hourly" else LOWER.replace(hour=0)
+    end = start + timedelta(days=2)
+    fetched = db.fetch_session_rollups(granularity, dimension, start, end)
+    fetched.sort(key=lambda r: (r["bucket"], r["dimension_value"]))
+    assert fetched == _expected_rollups(granularity, dimension, start, end)
+
+
+# --- Bulk Export ---
+def test_watermark_bounds(db):
+    timestamps = [s["timestamp"] for s in SESSIONS]
+    assert tuple(db.fetch_session_watermark_bounds()) == (min(timestamps), max(timestamps))
+
+
+@pytest.mark.parametrize("since, until", [(None, None), (LOWER, None), (None, UPPER), (LOWER, UPPER)],
+                         ids=["all", "since", "until", "window"])
+def test_session_export_rows(db, since, until):
+    rows = [row for batch in db.iter_session_export_rows(since, until, batch_size=4) for row in batch]
+    expected = sorted((s for s in SESSIONS if _in_range(s["timestamp"], since, until)), key=lambda s: s["timestamp"])
+    assert [row[0] for row in rows] == [s["session_id"] for s in expected]
+    for row, session in zip(rows, expected):
+        assert row[1] == session["user_id"]
+        assert row[2] == session["timestamp"]
+        assert row[3] == pytest.approx(session["time_spent"].total_seconds())
+        assert row[4] == session["performance_metrics"].get("score")
+        assert row[5] is _completed(session)
+        assert row[6] == session["content_accessed"]
+        assert json.loads(row[7]) == session["interactions"]
+        assert row[8] == CLUSTERS.get(session["user_id"])
+
+
+def test_session_export_snapshot(db):
+    with db.session_export_snapshot(LOWER, batch_size=4) as (until, batches):
+        rows = [row for batch in batches for row in batch]
+    assert until == max(s["timestamp"] for s in SESSIONS)
+    expected = [row for batch in db.iter_session_export_rows(LOWER, until, batch_size=4) for row in batch]
+    assert rows == expected
+
+
+def test_user_analytics_rows(db):
+    rows = [row for batch in db.iter_user_analytics_rows(batch_size=3) for row in batch]
+    assert [row[0] for row in rows] == sorted(CLUSTERS)
+    for user_id, cluster, features, predictions, recommendations, insights in rows:
+        assert cluster == CLUSTERS[user_id]
+        assert json.loads(features) == db.fetch_user_features(user_id)
+        assert json.loads(predictions) == db.fetch_user_predictions(user_id)
+        assert json.loads(recommendations) == [{"content_id": CONTENT[cluster]}]
+        assert json.loads(insights) == {"summary": f"cluster {cluster}"}
+
+
+# --- Profiling ---
+def test_queries_get_profiling_spans(db, monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    monkeypatch.setattr(profiling, "LOG_PATH", str(tmp_path / "profiling.log"))
+    with profiling.span("rerun"):
+        db.fetch_user_profile("user_0")
+        # Rewrites a seeded row unchanged, so later tests see the same data
+        db.upsert_topic_mastery("user_0", {"Taxes": {"p_mastery": 0.75, "attempts": 4, "correct": 3}})
+    run = profiling.recent_runs(1)[0]
+    assert [(e["name"], e["depth"]) for e in run["spans"]] == [
+        ("rerun", 0), ("db:fetch_user_profile", 1), ("db:upsert_topic_mastery", 1),
+    ]
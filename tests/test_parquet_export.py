@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from parquet_export import export_sessions, read_watermark
+from sqlite_manager import SQLiteDatabaseManager
+
+T0 = datetime(2024, 3, 1, 12)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteDatabaseManager({"path": str(tmp_path / "lms.db")})
+    db.setup_database()
+    db.insert_user_profile({"user_id": "u1", "demographics": {}, "learning_preferences": {}})
+    yield db
+    db.close()
+
+
+def _add_session(db, session_id, timestamp):
+    db.insert_learning_session({
+        "session_id": session_id, "user_id": "u1", "content_accessed": ["Taxes"],
+        "time_spent": timedelta(minutes=5), "interactions": {}, "performance_metrics": {"score": 50},
+        "timestamp": timestamp,
+    })
+
+
+def _exported_ids(out_dir):
+    table = pq.read_table(str(out_dir / "learning_sessions"))
+    return sorted(table.column("session_id").to_pylist())
+
+
+def test_late_session_below_watermark_is_exported_once(db, tmp_path):
+    out_dir = tmp_path / "export"
+    _add_session(db, "s1", T0)
+    _add_session(db, "s2", T0 + timedelta(hours=1))
+    assert export_sessions(db, str(out_dir))["rows"] == 2
+    assert read_watermark(str(out_dir)) == T0 + timedelta(hours=1)
+
+    # Committed after the export, with a timestamp below its watermark
+    _add_session(db, "s3", T0 + timedelta(minutes=30))
+    result = export_sessions(db, str(out_dir))
+    assert result["rows"] == 1
+    assert result["watermark"] == T0 + timedelta(hours=1)
+    assert _exported_ids(out_dir) == ["s1", "s2", "s3"]
+
+    assert export_sessions(db, str(out_dir))["rows"] == 0
+    assert _exported_ids(out_dir) == ["s1", "s2", "s3"]
+
+
+def test_session_older_than_lookback_is_not_rescanned(db, tmp_path):
+    out_dir = tmp_path / "export"
+    _add_session(db, "s1", T0)
+    export_sessions(db, str(out_dir), lookback=timedelta(hours=1))
+    _add_session(db, "s0", T0 - timedelta(hours=2))
+    assert export_sessions(db, str(out_dir), lookback=timedelta(hours=1))["rows"] == 0
+    assert export_sessions(db, str(out_dir), full=True)["rows"] == 2
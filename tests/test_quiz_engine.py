@@ -0,0 +1,166 @@
+import pytest
+
+from quiz_engine import (DAY_SECONDS, DEFAULT_SM2_PARAMS, DueLearnerSweeper, ReviewScheduler, TimingWheel,
+                         new_item, sm2_update, to_datetime, to_epoch)
+
+NOW = 1_700_000_000.0
+
+
+# --- SM-2 Scheduling ---
+def test_sm2_intervals_grow_with_correct_answers():
+    item = new_item()
+    sm2_update(item, 4, NOW)
+    assert (item["repetitions"], item["interval_days"], item["due"]) == (1, 1.0, NOW + DAY_SECONDS)
+    sm2_update(item, 4, NOW)
+    assert item["interval_days"] == 6.0
+    ease = item["ease"]
+    sm2_update(item, 4, NOW)
+    assert item["interval_days"] == round(6.0 * ease, 2)
+    assert item["repetitions"] == 3
+
+
+def test_sm2_lapse_is_due_right_away():
+    item = new_item()
+    sm2_update(item, 5, NOW)
+    sm2_update(item, 5, NOW)
+    ease = item["ease"]
+    sm2_update(item, 1, NOW + 10)
+    assert (item["repetitions"], item["lapses"], item["due"]) == (0, 1, NOW + 10)
+    assert item["ease"] < ease
+    for _ in range(20):
+        sm2_update(item, 0, NOW)
+    assert item["ease"] == DEFAULT_SM2_PARAMS.min_ease
+
+
+def test_epoch_round_trip_is_exact():
+    for ts in (NOW, NOW + 0.5, NOW + 123.456789):
+        assert to_epoch(to_datetime(ts)) == ts
+
+
+# --- Review Scheduler ---
+def test_scheduler_heap_is_compacted_in_place():
+    scheduler = ReviewScheduler("u1")
+    heap = scheduler.heap
+    for i in range(50):
+        scheduler.record_review("q1", i % 2 == 0, now=NOW + i)
+        scheduler.record_review("q2", True, now=NOW + i)
+        assert len(heap) <= 2 * len(scheduler.items)
+    assert scheduler.heap is heap
+    assert scheduler.next_due() == min((item["due"], q) for q, item in scheduler.items.items())
+
+
+def test_scheduler_due_questions_keeps_them_scheduled():
+    scheduler = ReviewScheduler("u1")
+    scheduler.record_review("q1", False, now=NOW)
+    scheduler.record_review("q2", True, now=NOW)
+    assert scheduler.due_questions(NOW) == ["q1"]
+    assert scheduler.due_questions(NOW + DAY_SECONDS) == ["q1", "q2"]
+    assert scheduler.review_round(["q2", "q3", "q1"], now=NOW) == ["q1", "q3"]
+
+
+# --- Timing Wheel ---
+def test_wheel_fires_keys_once_when_due():
+    wheel = TimingWheel(tick_seconds=60, slots=10, now=NOW)
+    wheel.schedule("a", NOW + 90)
+    wheel.schedule("b", NOW + 30)
+    assert wheel.advance(NOW + 29) == []
+    assert wheel.advance(NOW + 60) == ["b"]
+    assert wheel.pop_due(NOW + 200) == [("a", NOW + 90)]
+    assert wheel.advance(NOW + 400) == []
+    assert len(wheel) == 0
+
+
+def test_wheel_skips_replaced_and_cancelled_entries():
+    wheel = TimingWheel(tick_seconds=60, slots=10, now=NOW)
+    wheel.schedule("a", NOW + 60)
+    wheel.schedule("a", NOW + 300)
+    wheel.schedule("b", NOW + 60)
+    wheel.cancel("b")
+    assert wheel.advance(NOW + 120) == []
+    assert wheel.advance(NOW + 300) == ["a"]
+
+
+def test_wheel_overflow_fires_after_a_revolution():
+    wheel = TimingWheel(tick_seconds=60, slots=10, now=NOW)
+    wheel.schedule("far", NOW + 60 * 25)
+    assert wheel.advance(NOW + 60 * 24) == []
+    assert wheel.advance(NOW + 60 * 25) == ["far"]
+
+
+# --- Due Learner Sweep ---
+class FakeScheduleDb:
+    """review_schedule in memory; times are epoch seconds, given to the sweeper as datetimes."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def save(self, user_id, question_id, due, at):
+        self.rows[user_id, question_id] = (due, at)
+
+    def fetch_due_learners(self, until, after=None):
+        until, after = to_epoch(until), to_epoch(after) if after is not None else float("-inf")
+        earliest = {}
+        for (user_id, _), (due, _) in self.rows.items():
+            if after <= due < until:
+                earliest[user_id] = min(due, earliest.get(user_id, due))
+        return [(user_id, to_datetime(due)) for user_id, due in earliest.items()]
+
+    def fetch_rescheduled_reviews(self, since, until):
+        since, until = to_epoch(since), to_epoch(until)
+        return [(user_id, to_datetime(due)) for (user_id, _), (due, at) in self.rows.items()
+                if at >= since and due < until]
+
+    def fetch_next_due(self, bounds):
+        result = []
+        for user_id, after in bounds:
+            dues = [due for (u, _), (due, _) in self.rows.items() if u == user_id and due >= to_epoch(after)]
+            if dues:
+                result.append((user_id, to_datetime(min(dues))))
+        return result
+
+
+@pytest.fixture
+def db():
+    return FakeScheduleDb()
+
+
+def _sweeper(db):
+    return DueLearnerSweeper(db, tick_seconds=60, horizon_seconds=3600, margin_seconds=60, now=NOW)
+
+
+def test_sweeper_reports_learner_once_when_due(db):
+    db.save("u1", "q1", NOW + 120, NOW - 10)
+    db.save("u1", "q2", NOW + 150, NOW - 10)
+    sweeper = _sweeper(db)
+    assert sweeper.sweep(NOW) == []
+    assert sweeper.sweep(NOW + 180) == ["u1"]
+    assert sweeper.sweep(NOW + 240) == []
+
+
+def test_sweeper_skips_review_moved_later(db):
+    db.save("u1", "q1", NOW + 120, NOW - 10)
+    sweeper = _sweeper(db)
+    assert sweeper.sweep(NOW) == []
+    # Answered correctly before it fell due; the wheel still holds the old time
+    db.save("u1", "q1", NOW + 600, NOW + 60)
+    assert sweeper.sweep(NOW + 180) == []
+    assert sweeper.sweep(NOW + 540) == []
+    assert sweeper.sweep(NOW + 600) == ["u1"]
+
+
+def test_sweeper_drops_review_moved_past_the_horizon(db):
+    db.save("u1", "q1", NOW + 120, NOW - 10)
+    sweeper = _sweeper(db)
+    sweeper.sweep(NOW)
+    db.save("u1", "q1", NOW + 2 * DAY_SECONDS, NOW + 60)
+    assert sweeper.sweep(NOW + 180) == []
+    assert len(sweeper.wheel) == 0
+
+
+def test_sweeper_picks_up_lapse_saved_after_load(db):
+    db.save("u1", "q1", NOW + 1800, NOW - 10)
+    sweeper = _sweeper(db)
+    assert sweeper.sweep(NOW) == []
+    db.save("u1", "q2", NOW + 90, NOW + 90)
+    assert sweeper.sweep(NOW + 120) == ["u1"]
+    assert sweeper.sweep(NOW + 1800) == ["u1"]
@@ -0,0 +1,66 @@
+import pytest
+
+import session_store
+from session_store import SessionStore, decode_state, encode_state
+
+
+class MemoryBackend:
+    def __init__(self):
+        self.blobs = {}
+        self.writes = 0
+
+    def get(self, sid):
+        return self.blobs.get(sid)
+
+    def set_many(self, blobs):
+        self.writes += 1
+        self.blobs.update(blobs)
+
+    def delete(self, sid):
+        self.blobs.pop(sid, None)
+
+
+@pytest.fixture
+def store():
+    # A long flush interval, so only explicit flush() calls write
+    return SessionStore(MemoryBackend(), ["progress"], flush_interval=3600)
+
+
+def test_load_then_save_before_flush_keeps_pending_state(store):
+    store.save("s1", {"progress": 1})
+    assert store.load("s1") == {"progress": 1}
+    store.save("s1", {"progress": 1})
+    store.flush()
+    assert decode_state(store.backend.blobs["s1"]) == {"progress": 1}
+
+
+def test_unchanged_state_is_not_rewritten(store):
+    store.save("s1", {"progress": 1, "widget": "ignored"})
+    store.flush()
+    store.save("s1", {"progress": 1})
+    store.flush()
+    assert store.backend.writes == 1
+
+
+def test_state_loaded_from_backend_is_not_rewritten(store):
+    store.backend.blobs["s1"] = encode_state({"progress": 2})
+    assert store.load("s1") == {"progress": 2}
+    store.save("s1", {"progress": 2})
+    store.flush()
+    assert store.backend.writes == 0
+
+
+def test_digest_cache_is_bounded():
+    store = SessionStore(MemoryBackend(), ["progress"], flush_interval=3600, max_tracked_sessions=3)
+    for i in range(10):
+        store.save(str(i), {"progress": i})
+    store.flush()
+    assert list(store._written_digests) == ["7", "8", "9"]
+
+
+@pytest.mark.parametrize("use_msgpack", [False, True], ids=["json", "msgpack"])
+def test_encoding_round_trip(use_msgpack):
+    if use_msgpack and session_store.msgpack is None:
+        pytest.skip("msgpack is not installed")
+    state = {"review_queue": [[1.5, "q1"]], "scores": {f"t{i}": i / 3 for i in range(100)}}
+    assert decode_state(encode_state(state, use_msgpack=use_msgpack)) == state
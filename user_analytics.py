@@ -0,0 +1,229 @@
+import json
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from database_manager import DatabaseManager, create_database_manager, db_config_from_env
+
+# A stage is a (name, function) pair. The function is called once per user with
+# the worker's own DatabaseManager and must be defined at module level so it can
+# be pickled and sent to a worker process.
+Stage = Tuple[str, Callable[[DatabaseManager, str], None]]
+
+
+def engineer_user_features(db: DatabaseManager, user_id: str):
+    """
+    Computes summary features from a user's learning sessions and stores them.
+
+    Args:
+        db (DatabaseManager): Connection owned by the current worker.
+        user_id (str): The user to process.
+    """
+    sessions = db.fetch_user_sessions(user_id)
+    scores = []
+    total_seconds = 0.0
+    content_ids = set()
+    for session in sessions:
+        score = (session.get("performance_metrics") or {}).get("score")
+        if score is not None:
+            scores.append(float(score))
+        time_spent = session.get("time_spent")
+        if hasattr(time_spent, "total_seconds"):
+            total_seconds += time_spent.total_seconds()
+        content_ids.update(session.get("content_accessed") or [])
+
+    last_active = sessions[-1]["timestamp"] if sessions else None
+    db.update_user_features(user_id, {
+        "session_count": len(sessions),
+        "total_time_spent_minutes": round(total_seconds / 60, 2),
+        "avg_score": round(sum(scores) / len(scores), 2) if scores else None,
+        "distinct_content_count": len(content_ids),
+        "last_active": last_active.isoformat() if last_active else None,
+    })
+
+
+DEFAULT_STAGES: List[Stage] = [
+    ("feature_engineering", engineer_user_features),
+]
+
+
+def shard_for_user(user_id: str, num_shards: int) -> int:
+    """Returns a stable shard index so a user lands in the same shard on every run."""
+    return zlib.crc32(user_id.encode("utf-8")) % num_shards
+
+
+def partition_users(user_ids: List[str], num_shards: int) -> List[List[str]]:
+    """
+    Splits user IDs into shards, each sorted so checkpoints can resume by cursor.
+
+    Args:
+        user_ids (list): All user IDs to process.
+        num_shards (int): Number of shards to produce.
+
+    Returns:
+        list: One sorted list of user IDs per shard.
+    """
+    shards = [[] for _ in range(num_shards)]
+    for user_id in user_ids:
+        shards[shard_for_user(user_id, num_shards)].append(user_id)
+    return [sorted(shard) for shard in shards]
+
+
+def _read_checkpoint(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"done": False, "last_user_id": None, "processed": 0}
+
+
+def _write_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    # Write to a temporary file and rename so a crash never leaves a torn checkpoint.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def _run_shard(db_config: Dict[str, str], stage: Stage, shard_index: int, user_ids: List[str],
+               checkpoint_path: str, checkpoint_every: int) -> Dict[str, Any]:
+    """Processes one shard of one stage inside a worker process."""
+    stage_name, stage_fn = stage
+    checkpoint = _read_checkpoint(checkpoint_path)
+    result = {"shard": shard_index, "processed": 0, "skipped": 0, "seconds": 0.0}
+    if checkpoint["done"]:
+        result["skipped"] = len(user_ids)
+        return result
+
+    last_user_id = checkpoint["last_user_id"]
+    pending = [u for u in user_ids if last_user_id is None or u > last_user_id]
+    result["skipped"] = len(user_ids) - len(pending)
+
+    start = time.perf_counter()
+    previously_processed = checkpoint["processed"]
+    db = create_database_manager(db_config)
+    try:
+        for user_id in pending:
+            stage_fn(db, user_id)
+            result["processed"] += 1
+            if result["processed"] % checkpoint_every == 0:
+                checkpoint.update(last_user_id=user_id, processed=previously_processed + result["processed"])
+                _write_checkpoint(checkpoint_path, checkpoint)
+        checkpoint.update(done=True, processed=previously_processed + result["processed"])
+        _write_checkpoint(checkpoint_path, checkpoint)
+    finally:
+        db.close()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+class AnalyticsJobRunner:
+    """
+    Runs nightly analytics stages over all users in parallel shards.
+
+    Each stage fans out over a ProcessPoolExecutor, one task per shard, and every
+    worker opens its own DatabaseManager connection. Stages run one after another
+    so a later stage (e.g. clustering) sees the complete output of the earlier one.
+    Progress is checkpointed per (stage, shard); re-running a job with the same
+    job_id resumes where the failed run stopped.
+    """
+
+    def __init__(self, db_config: Dict[str, str], stages: Optional[List[Stage]] = None,
+                 num_shards: int = 8, max_workers: Optional[int] = None,
+                 checkpoint_dir: str = ".analytics_checkpoints", checkpoint_every: int = 100):
+        self.db_config = db_config
+        self.stages = stages if stages is not None else DEFAULT_STAGES
+        self.num_shards = num_shards
+        self.max_workers = max_workers
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+
+    def _checkpoint_path(self, job_id: str, stage_name: str, shard_index: int) -> str:
+        job_dir = os.path.join(self.checkpoint_dir, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        return os.path.join(job_dir, f"{stage_name}.shard{shard_index}.json")
+
+    def run(self, job_id: str, user_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs every stage over all users and returns per-stage timings.
+
+        Args:
+            job_id (str): Identifies the run; reuse it to resume a failed job.
+            user_ids (list, optional): Users to process. Defaults to all users.
+
+        Returns:
+            dict: Per stage, the wall-clock seconds, summed worker seconds, the
+            slowest shard and the number of users processed and skipped.
+        """
+        if user_ids is None:
+            db = create_database_manager(self.db_config)
+            try:
+                user_ids = db.get_all_user_ids()
+            finally:
+                db.close()
+        shards = partition_users(user_ids, self.num_shards)
+
+        report = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for stage in self.stages:
+                stage_name = stage[0]
+                stage_start = time.perf_counter()
+                futures = [
+                    executor.submit(_run_shard, self.db_config, stage, i, shard,
+                                    self._checkpoint_path(job_id, stage_name, i), self.checkpoint_every)
+                    for i, shard in enumerate(shards) if shard
+                ]
+                results = []
+                errors = []
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        errors.append(e)
+                if errors:
+                    print(f"Stage '{stage_name}' failed in {len(errors)} shard(s); re-run job '{job_id}' to resume.")
+                    raise errors[0]
+
+                slowest = max(results, key=lambda r: r["seconds"], default=None)
+                report[stage_name] = {
+                    "wall_seconds": round(time.perf_counter() - stage_start, 3),
+                    "worker_seconds": round(sum(r["seconds"] for r in results), 3),
+                    "slowest_shard": slowest["shard"] if slowest else None,
+                    "slowest_shard_seconds": round(slowest["seconds"], 3) if slowest else 0.0,
+                    "users_processed": sum(r["processed"] for r in results),
+                    "users_skipped": sum(r["skipped"] for r in results),
+                }
+                print(f"Stage '{stage_name}' finished in {report[stage_name]['wall_seconds']}s "
+                      f"({report[stage_name]['users_processed']} users, "
+                      f"{report[stage_name]['users_skipped']} resumed from checkpoint).")
+        return report
+
+
+def print_timing_report(report: Dict[str, Dict[str, Any]]):
+    """Prints per-stage timings with the slowest stage flagged as the bottleneck."""
+    if not report:
+        print("No stages were run.")
+        return
+    bottleneck = max(report, key=lambda name: report[name]["wall_seconds"])
+    print(f"{'Stage':<24}{'Wall (s)':>10}{'Worker (s)':>12}{'Slowest shard (s)':>19}{'Users':>8}")
+    for name, timing in report.items():
+        marker = "  <- bottleneck" if name == bottleneck else ""
+        print(f"{name:<24}{timing['wall_seconds']:>10}{timing['worker_seconds']:>12}"
+              f"{timing['slowest_shard_seconds']:>19}{timing['users_processed']:>8}{marker}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the nightly analytics job in parallel shards.")
+    parser.add_argument("--job-id", default=time.strftime("%Y-%m-%d"), help="Reuse an ID to resume a failed run.")
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint-dir", default=".analytics_checkpoints")
+    args = parser.parse_args()
+
+    runner = AnalyticsJobRunner(db_config_from_env(), num_shards=args.shards,
+                                max_workers=args.workers, checkpoint_dir=args.checkpoint_dir)
+    print_timing_report(runner.run(args.job_id))
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import profiling
+from startup import lazy_import
+
+# plotly is only imported when the first figure is built
+go = lazy_import("plotly.graph_objects")
+
+# Series longer than this are downsampled before they are sent to the browser.
+MAX_LINE_POINTS = 500
+FIGURE_CACHE_SIZE = 256
+
+# Matches plotly.express' qualitative Set3 palette used by the original budget pie.
+SET3_COLORS = ["#8DD3C7", "#FFFFB3", "#BEBADA", "#FB8072", "#80B1D3", "#FDB462",
+               "#B3DE69", "#FCCDE5", "#D9D9D9", "#BC80BD", "#CCEBC5", "#FFED6F"]
+
+_figure_cache: "OrderedDict[Tuple[str, str], go.Figure]" = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def _data_key(data: Any) -> str:
+    return hashlib.blake2b(repr(data).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cached_figure(kind: str, data: Any, builder: Callable[[], go.Figure]) -> go.Figure:
+    """
+    Returns a figure from the cache, building it on a miss.
+
+    Figures are keyed on a hash of their input data and shared between sessions,
+    so callers must treat them as read-only.
+    """
+    key = (kind, _data_key(data))
+    with _figure_cache_lock:
+        fig = _figure_cache.get(key)
+        if fig is not None:
+            _figure_cache.move_to_end(key)
+            return fig
+    with profiling.span(f"figure:{kind}"):
+        fig = builder()
+    with _figure_cache_lock:
+        _figure_cache[key] = fig
+        if len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return fig
+
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> Tuple[List[float], List[float]]:
+    """
+    Downsamples a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the point that
+    forms the largest triangle with its neighbours, which preserves the visual shape.
+
+    Args:
+        x (sequence): X values in ascending order.
+        y (sequence): Y values.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        tuple: The downsampled x and y lists.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(x), list(y)
+
+    sampled_x, sampled_y = [x[0]], [y[0]]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_count = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / next_count
+        avg_y = sum(y[next_start:next_end]) / next_count
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = x[a], y[a]
+        best_area, best = -1.0, start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area, best = area, j
+        sampled_x.append(x[best])
+        sampled_y.append(y[best])
+        a = best
+
+    sampled_x.append(x[-1])
+    sampled_y.append(y[-1])
+    return sampled_x, sampled_y
+
+
+@lru_cache(maxsize=1)
+def government_structure_sankey() -> go.Figure:
+    """Returns the static government-structure Sankey, built once per process."""
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(
+            pad=15,
+            thickness=20,
+            line=dict(color="black", width=0.5),
+            label=["Government", "Executive", "Legislative", "Judicial", "President", "Congress", "Courts"],
+            color=["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7", "#DDA0DD", "#98D8C8"]
+        ),
+        link=dict(
+            source=[0, 0, 0, 1, 2, 3],
+            target=[1, 2, 3, 4, 5, 6],
+            value=[1, 1, 1, 1, 1, 1]
+        )
+    )])
+    fig.update_layout(title_text="Government Structure", font_size=10, height=400)
+    return fig
+
+
+def learning_progress_bar(categories: Sequence[str], completed: Sequence[int], totals: Sequence[int]) -> go.Figure:
+    """
+    Returns the grouped completed-vs-total bar chart shown on the home page.
+
+    Args:
+        categories (sequence): Category labels.
+        completed (sequence): Items completed per category.
+        totals (sequence): Items available per category.
+    """
+    data = (tuple(categories), tuple(completed), tuple(totals))
+
+    def build():
+        fig = go.Figure([
+            go.Bar(name="Completed", x=data[0], y=data[1], marker_color="#FF6B6B"),
+            go.Bar(name="Total", x=data[0], y=data[2], marker_color="#E0E0E0"),
+        ])
+        fig.update_layout(title="Your Learning Progress", barmode="group", height=400,
+                          xaxis_title="Category", yaxis_title="value")
+        return fig
+
+    return _cached_figure("learning_progress_bar", data, build)
+
+
+def budget_pie(categories: Sequence[str], amounts: Sequence[float]) -> go.Figure:
+    """
+    Returns the budget breakdown pie chart.
+
+    Args:
+        categories (sequence): Expense category labels.
+        amounts (sequence): Amount per category.
+    """
+    data = (tuple(categories), tuple(amounts))
+
+    def build():
+        fig = go.Figure(go.Pie(labels=data[0], values=data[1], marker=dict(colors=SET3_COLORS)))
+        fig.update_layout(title="Budget Breakdown")
+        return fig
+
+    return _cached_figure("budget_pie", data, build)
+
+
+def investment_growth_line(years: Sequence[float], values: Sequence[float]) -> go.Figure:
+    """
+    Returns the investment growth line chart, downsampled when the series is long.
+
+    Args:
+        years (sequence): X values in ascending order.
+        values (sequence): Investment value at each point.
+    """
+    data = (tuple(years), tuple(values))
+
+    def build():
+        x, y = lttb(data[0], data[1], MAX_LINE_POINTS)
+        fig = go.Figure(go.Scatter(x=x, y=y, mode="lines", line=dict(color="#FF6B6B", width=3, shape="spline")))
+        fig.update_layout(title="Investment Growth Over Time", xaxis_title="Year", yaxis_title="Investment Value")
+        return fig
+
+    return _cached_figure("investment_growth_line", data, build)
+
+
+def quiz_result_pie(correct: int, incorrect: int) -> go.Figure:
+    """Returns the correct-vs-incorrect pie chart shown when a quiz is finished."""
+    data = (correct, incorrect)
+
+    def build():
+        fig = go.Figure(go.Pie(labels=["Correct", "Incorrect"], values=list(data),
+                               marker=dict(colors=["#4ECDC4", "#FF6B6B"])))
+        fig.update_layout(title="Quiz Performance")
+        return fig
+
+    return _cached_figure("quiz_result_pie", data, build)
+
+
+def cohort_trend_lines(title: str, y_title: str, series: Dict[str, Tuple[Sequence[Any], Sequence[float]]]) -> go.Figure:
+    """
+    Returns a multi-line trend chart with one line per cohort.
+
+    Args:
+        title (str): Chart title.
+        y_title (str): Y axis label.
+        series (dict): Cohort name mapped to (buckets, values). Each line is
+            downsampled to MAX_LINE_POINTS so a year of hourly data stays light.
+    """
+    data = (title, y_title, tuple((name, tuple(x), tuple(y)) for name, (x, y) in sorted(series.items())))
+
+    def build():
+        fig = go.Figure()
+        for name, x, y in data[2]:
+            # Downsample on positions so LTTB works for datetime buckets too
+            positions, sampled_y = lttb(range(len(x)), y, MAX_LINE_POINTS)
+            fig.add_trace(go.Scatter(x=[x[i] for i in positions], y=sampled_y, mode="lines", name=name))
+        fig.update_layout(title=data[0], yaxis_title=data[1], height=400)
+        return fig
+
+    return _cached_figure("cohort_trend_lines", data, build)
+
+
+def time_per_module_bar(modules: Sequence[str], minutes: Sequence[float]) -> go.Figure:
+    """Returns a horizontal bar chart of minutes spent per content module."""
+    data = (tuple(modules), tuple(minutes))
+
+    def build():
+        fig = go.Figure(go.Bar(x=data[1], y=data[0], orientation="h", marker_color="#4ECDC4"))
+        fig.update_layout(title="Time Spent per Module", xaxis_title="Minutes", height=400,
+                          yaxis=dict(autorange="reversed"))
+        return fig
+
+    return _cached_figure("time_per_module_bar", data, build)